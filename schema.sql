@@ -30,7 +30,9 @@ CREATE TABLE IF NOT EXISTS runs (
     batch_size INTEGER DEFAULT 1,
     status TEXT DEFAULT 'Tried', -- Purchased, Tried, Tuned, Final
     source TEXT, -- 参考元
-    notion_page_id TEXT, -- Notion連携用
+    notion_page_id BLOB, -- Notion連携用（UUIDの16バイト）
+    notion_id TEXT, -- NotionページID（同期UPSERTの競合判定キー）
+    notion_url TEXT,
     comfyui_workflow_id TEXT, -- ComfyUI連携用
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -56,7 +58,7 @@ CREATE TABLE IF NOT EXISTS images (
     width INTEGER,
     height INTEGER,
     file_size INTEGER, -- bytes
-    hash TEXT, -- ファイルハッシュ（重複検出用）
+    hash BLOB, -- ファイルハッシュ（重複検出用、ダイジェストのバイト列）
     metadata TEXT, -- JSON形式の追加メタデータ
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (run_id) REFERENCES runs(run_id) ON DELETE CASCADE
@@ -79,12 +81,22 @@ CREATE TABLE IF NOT EXISTS run_tags (
     FOREIGN KEY (tag_id) REFERENCES tags(tag_id) ON DELETE CASCADE
 );
 
+-- 同期状態（差分同期のチェックポイント）
+CREATE TABLE IF NOT EXISTS sync_state (
+    name TEXT PRIMARY KEY, -- 例: notion:<database_id>:both
+    last_sync_at TIMESTAMP NOT NULL
+);
+
 -- インデックス作成
 CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status);
 CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at);
 CREATE INDEX IF NOT EXISTS idx_models_type ON models(type);
 CREATE INDEX IF NOT EXISTS idx_images_run_id ON images(run_id);
 CREATE INDEX IF NOT EXISTS idx_images_hash ON images(hash);
+CREATE INDEX IF NOT EXISTS idx_runs_notion_page_id ON runs(notion_page_id);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_runs_notion_id ON runs(notion_id);
+CREATE INDEX IF NOT EXISTS idx_runs_model_status ON runs(model_id, status);
+CREATE INDEX IF NOT EXISTS idx_runs_title ON runs(title);
 
 -- トリガー: updated_atの自動更新
 CREATE TRIGGER IF NOT EXISTS update_models_timestamp 
@@ -97,4 +109,24 @@ CREATE TRIGGER IF NOT EXISTS update_runs_timestamp
 AFTER UPDATE ON runs
 BEGIN
     UPDATE runs SET updated_at = CURRENT_TIMESTAMP WHERE run_id = NEW.run_id;
+END;
+
+-- プロンプト・タイトルの部分一致検索用の全文検索インデックス（FTS5 trigram）
+CREATE VIRTUAL TABLE IF NOT EXISTS runs_fts USING fts5(
+    prompt, title, content='runs', content_rowid='run_id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS runs_fts_ai AFTER INSERT ON runs BEGIN
+    INSERT INTO runs_fts(rowid, prompt, title) VALUES (new.run_id, new.prompt, new.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS runs_fts_ad AFTER DELETE ON runs BEGIN
+    INSERT INTO runs_fts(runs_fts, rowid, prompt, title)
+    VALUES ('delete', old.run_id, old.prompt, old.title);
+END;
+
+CREATE TRIGGER IF NOT EXISTS runs_fts_au AFTER UPDATE OF prompt, title ON runs BEGIN
+    INSERT INTO runs_fts(runs_fts, rowid, prompt, title)
+    VALUES ('delete', old.run_id, old.prompt, old.title);
+    INSERT INTO runs_fts(rowid, prompt, title) VALUES (new.run_id, new.prompt, new.title);
 END;
\ No newline at end of file
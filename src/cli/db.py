@@ -7,12 +7,20 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import click
+from sqlalchemy.exc import SQLAlchemyError
 
 from src.models.database import Image, Model, Run, Tag
-from src.utils.db_init import initialize_database, verify_database_setup
+from src.utils.db_init import (
+    checkpoint_database,
+    create_engine_for_database,
+    find_duplicate_notion_ids,
+    initialize_database,
+    unlink_duplicate_notion_ids,
+    verify_database_setup,
+)
 
 from .utils import (
     CliState,
@@ -27,6 +35,24 @@ from .utils import (
 )
 
 
+def _replace_database_file(source: Union[str, Path], db_path: str) -> None:
+    """データベースファイルを別のファイルの内容で置き換えます.
+
+    元のファイルに付随する ``-wal`` / ``-shm`` ファイルが残っていると、
+    SQLiteが次回接続時に置き換え後のファイルへ適用してしまうため、先に削除します。
+
+    Args:
+        source: コピー元のデータベースファイル
+        db_path: 置き換えるデータベースファイルのパス
+    """
+    for suffix in ("-wal", "-shm"):
+        try:
+            os.unlink(db_path + suffix)
+        except FileNotFoundError:
+            pass
+    shutil.copy2(source, db_path)
+
+
 @click.group(name='db')
 @click.pass_context
 def db_commands(ctx: click.Context) -> None:
@@ -72,7 +98,13 @@ def init(ctx: click.Context, force: bool) -> None:
         engine = initialize_database(db_path)
 
         # セットアップを検証
-        if verify_database_setup(engine):
+        try:
+            setup_ok = verify_database_setup(engine)
+        finally:
+            # 接続を閉じてWALの内容をデータベースファイルに反映
+            engine.dispose()
+
+        if setup_ok:
             display_success(f"データベースが正常に初期化されました: {db_path}")
         else:
             display_error("データベースの検証に失敗しました")
@@ -145,7 +177,9 @@ def status(ctx: click.Context) -> None:
 
         # 最近のアクティビティ
         display_info("\n最近のアクティビティ:")
-        recent_runs = db_manager.get_records(Run, order_by='created_at', limit=5)
+        recent_runs = db_manager.get_records_core(
+            Run, ['run_id', 'title', 'status', 'created_at'], order_by='created_at', limit=5
+        )
 
         if recent_runs:
             recent_data = []
@@ -210,6 +244,13 @@ def backup(ctx: click.Context, output: Optional[str]) -> None:
                 display_info("バックアップをキャンセルしました")
                 return
 
+        # WALの未反映分をデータベースファイルに書き戻してからコピー
+        engine = create_engine_for_database(db_path)
+        try:
+            checkpoint_database(engine)
+        finally:
+            engine.dispose()
+
         # ファイルをコピー
         display_info(f"バックアップを作成中: {db_path} -> {output}")
         shutil.copy2(db_path, output_path)
@@ -265,7 +306,16 @@ def restore(ctx: click.Context, backup_file: str, force: bool) -> None:
                 display_info("復元をキャンセルしました")
                 return
 
-            # 現在のDBを一時バックアップ
+            # 現在のDBを一時バックアップ（WALの未反映分を書き戻してからコピー）
+            engine = create_engine_for_database(db_path)
+            try:
+                checkpoint_database(engine)
+            except SQLAlchemyError as e:
+                # 破損したデータベースはチェックポイントできないため、そのままコピーする
+                display_warning(f"現在のデータベースのチェックポイントに失敗しました: {e}")
+            finally:
+                engine.dispose()
+
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             current_backup = f"{db_path}.restore_backup_{timestamp}"
             shutil.copy2(db_path, current_backup)
@@ -277,14 +327,17 @@ def restore(ctx: click.Context, backup_file: str, force: bool) -> None:
 
         # 復元実行
         display_info(f"データベースを復元中: {backup_file} -> {db_path}")
-        shutil.copy2(backup_path, db_path)
+        _replace_database_file(backup_path, db_path)
 
         # 復元されたデータベースの検証
         try:
-            from src.utils.db_init import create_engine_for_database
             engine = create_engine_for_database(db_path)
+            try:
+                restored_ok = verify_database_setup(engine)
+            finally:
+                engine.dispose()
 
-            if verify_database_setup(engine):
+            if restored_ok:
                 display_success(f"データベースが正常に復元されました: {db_path}")
 
                 # 一時バックアップの削除確認
@@ -299,7 +352,7 @@ def restore(ctx: click.Context, backup_file: str, force: bool) -> None:
 
                 # 復元失敗時は元のデータベースを復旧
                 if current_backup and Path(current_backup).exists():
-                    shutil.copy2(current_backup, db_path)
+                    _replace_database_file(current_backup, db_path)
                     display_info("元のデータベースを復旧しました")
 
                 ctx.exit(2)
@@ -309,7 +362,7 @@ def restore(ctx: click.Context, backup_file: str, force: bool) -> None:
 
             # 復元失敗時は元のデータベースを復旧
             if current_backup and Path(current_backup).exists():
-                shutil.copy2(current_backup, db_path)
+                _replace_database_file(current_backup, db_path)
                 display_info("元のデータベースを復旧しました")
 
             ctx.exit(2)
@@ -396,3 +449,59 @@ def cleanup(ctx: click.Context, table: str, dry_run: bool, force: bool) -> None:
 
     except Exception as e:
         handle_database_error(e)
+
+
+@db_commands.command(name='dedupe-notion-ids')
+@click.option(
+    '--force', '-f',
+    is_flag=True,
+    help='確認なしで紐付けを解除'
+)
+@click.pass_context
+def dedupe_notion_ids(ctx: click.Context, force: bool) -> None:
+    """同じNotionページに紐付いた重複Runの紐付けを解除します.
+
+    各ページについて最初に作成されたRunのみ紐付けを残し、
+    残りのRunはローカルのRunとして残します。
+    """
+    state = CliState(ctx)
+    db_path = state.db_path or "data/asset_manager.db"
+
+    if not Path(db_path).exists():
+        display_error(f"データベースファイルが見つかりません: {db_path}")
+        ctx.exit(1)
+
+    try:
+        # 重複があると初期化（一意インデックスの作成）に失敗するため、初期化せずに接続する
+        engine = create_engine_for_database(db_path)
+        try:
+            duplicates = find_duplicate_notion_ids(engine)
+            if not duplicates:
+                display_info("重複したNotionページの紐付けは見つかりませんでした")
+                return
+
+            display_table(
+                ['Notion ID', '残すRun', '紐付けを解除するRun'],
+                [
+                    [notion_id, str(run_ids[0]), ', '.join(map(str, run_ids[1:]))]
+                    for notion_id, run_ids in duplicates.items()
+                ],
+                '重複したNotionページの紐付け'
+            )
+
+            if not confirm_dangerous_action(
+                "上記のRunのNotionページへの紐付けを解除します。続行しますか？",
+                force
+            ):
+                display_info("紐付けの解除をキャンセルしました")
+                return
+
+            unlinked = unlink_duplicate_notion_ids(engine)
+        finally:
+            engine.dispose()
+
+        count = sum(len(run_ids) for run_ids in unlinked.values())
+        display_success(f"{count}件のRunの紐付けを解除しました")
+
+    except Exception as e:
+        handle_database_error(e)
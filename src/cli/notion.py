@@ -153,9 +153,11 @@ def status(output_format: str):
 @click.option('--direction', type=click.Choice(['from', 'to', 'both']),
               default='both', help='同期方向')
 @click.option('--dry-run', is_flag=True, help='実際の変更を行わず、変更内容をプレビュー')
+@click.option('--incremental', is_flag=True,
+              help='前回の同期以降に変更されたデータのみ同期（from/both）')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']),
               default='table', help='出力形式')
-def sync(direction: str, dry_run: bool, output_format: str):
+def sync(direction: str, dry_run: bool, incremental: bool, output_format: str):
     """
     Notion と ローカルデータベースを同期する。
 
@@ -179,7 +181,9 @@ def sync(direction: str, dry_run: bool, output_format: str):
                 click.echo("🔍 ドライランモード: 実際の変更は行いません")
             click.echo(f"🔄 同期を開始しています... (方向: {direction})")
 
-        result = asyncio.run(_sync_async(api_key, database_id, direction, dry_run))
+        result = asyncio.run(
+            _sync_async(api_key, database_id, direction, dry_run, incremental)
+        )
 
         # 結果を表示
         if output_format == 'json':
@@ -295,8 +299,8 @@ def init_database(confirm: bool):
 async def _test_connection_async(api_key: str, database_id: str) -> Dict[str, Any]:
     """Test Notion API connection asynchronously."""
     try:
-        client = NotionClient(api_key, database_id)
-        return await client.test_connection()
+        async with NotionClient(api_key, database_id) as client:
+            return await client.test_connection()
     except Exception as e:
         return {
             "success": False,
@@ -309,19 +313,22 @@ async def _sync_async(
     api_key: str,
     database_id: str,
     direction: str,
-    dry_run: bool
+    dry_run: bool,
+    incremental: bool = False
 ) -> Dict[str, Any]:
     """Perform sync operation asynchronously."""
     try:
-        client = NotionClient(api_key, database_id)
-        sync_manager = NotionSyncManager(client, dry_run=dry_run)
-
-        if direction == 'from':
-            stats = await sync_manager.sync_from_notion()
-        elif direction == 'to':
-            stats = await sync_manager.sync_to_notion()
-        elif direction == 'both':
-            stats = await sync_manager.sync_bidirectional()
+        async with NotionClient(api_key, database_id) as client:
+            sync_manager = NotionSyncManager(
+                client, dry_run=dry_run, incremental=incremental
+            )
+
+            if direction == 'from':
+                stats = await sync_manager.sync_from_notion()
+            elif direction == 'to':
+                stats = await sync_manager.sync_to_notion()
+            elif direction == 'both':
+                stats = await sync_manager.sync_bidirectional()
 
         return {
             "success": True,
@@ -350,10 +357,9 @@ async def _sync_async(
 async def _detect_conflicts_async(api_key: str, database_id: str) -> List[Dict[str, Any]]:
     """Detect conflicts asynchronously."""
     try:
-        client = NotionClient(api_key, database_id)
-        sync_manager = NotionSyncManager(client)
-
-        return await sync_manager.detect_conflicts()
+        async with NotionClient(api_key, database_id) as client:
+            sync_manager = NotionSyncManager(client)
+            return await sync_manager.detect_conflicts()
     except Exception as e:
         logger.error(f"Conflict detection failed: {e}")
         return []
@@ -362,11 +368,11 @@ async def _detect_conflicts_async(api_key: str, database_id: str) -> List[Dict[s
 async def _resolve_conflicts_auto(api_key: str, database_id: str) -> Dict[str, Any]:
     """Resolve conflicts automatically (latest wins)."""
     try:
-        client = NotionClient(api_key, database_id)
-        sync_manager = NotionSyncManager(client)
+        async with NotionClient(api_key, database_id) as client:
+            sync_manager = NotionSyncManager(client)
 
-        # 双方向同期を実行（競合解決含む）
-        stats = await sync_manager.sync_bidirectional()
+            # 双方向同期を実行（競合解決含む）
+            stats = await sync_manager.sync_bidirectional()
 
         return {
             "success": True,
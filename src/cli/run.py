@@ -8,12 +8,16 @@ from typing import Optional
 import click
 from sqlalchemy import desc
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload
 
 from src.models.database import Model, Run, RunLora
 from src.utils.db_utils import (
     get_images_for_run,
+    get_images_for_runs,
     get_loras_for_run,
+    get_loras_for_runs,
     get_tags_for_run,
+    get_tags_for_runs,
 )
 
 from .utils import (
@@ -125,8 +129,8 @@ def list(
             # 総件数を取得
             total_count = query_obj.count()
 
-            # ページネーション
-            results = query_obj.offset(offset).limit(limit).all()
+            # ページネーション（表示するモデル名は同じSELECTで先読み）
+            results = query_obj.offset(offset).limit(limit).options(joinedload(Run.model)).all()
 
             # セッションから切り離し
             for result in results:
@@ -196,7 +200,7 @@ def show(ctx: click.Context, run_id: int, output: str) -> None:
         db_manager = state.db_manager
 
         # 実行履歴を取得
-        run = db_manager.get_record_by_id(Run, run_id)
+        run = db_manager.get_record_by_id(Run, run_id, options=[joinedload(Run.model)])
         if not run:
             display_error(f"Run ID {run_id} が見つかりません")
             ctx.exit(1)
@@ -491,19 +495,11 @@ def delete(ctx: click.Context, run_ids: tuple, force: bool, cascade: bool) -> No
                 '削除対象一覧'
             )
 
-        # 関連データの確認
-        total_images = 0
-        total_loras = 0
-        total_tags = 0
-
-        for run in existing_runs:
-            images = get_images_for_run(db_manager, run.run_id)
-            loras = get_loras_for_run(db_manager, run.run_id)
-            tags = get_tags_for_run(db_manager, run.run_id)
-
-            total_images += len(images)
-            total_loras += len(loras)
-            total_tags += len(tags)
+        # 関連データの確認（全Run分をまとめて取得）
+        target_ids = [run.run_id for run in existing_runs]
+        total_images = sum(map(len, get_images_for_runs(db_manager, target_ids).values()))
+        total_loras = sum(map(len, get_loras_for_runs(db_manager, target_ids).values()))
+        total_tags = sum(map(len, get_tags_for_runs(db_manager, target_ids).values()))
 
         if total_images > 0 or total_loras > 0 or total_tags > 0:
             display_warning("関連データも削除されます:")
@@ -640,6 +636,11 @@ def copy(
         copied_runs = []
         failed_copies = []
 
+        # コピー元のLoRA関連付けをまとめて取得
+        source_loras_by_run = get_loras_for_runs(
+            db_manager, [source_run.run_id for source_run in source_runs]
+        )
+
         for source_run in source_runs:
             try:
                 # 新しい実行履歴データを準備
@@ -664,8 +665,7 @@ def copy(
                 new_run = db_manager.create_record(Run, **new_run_data)
 
                 # LoRA関連付けをコピー
-                source_loras = get_loras_for_run(db_manager, source_run.run_id)
-                for run_lora in source_loras:
+                for run_lora in source_loras_by_run[source_run.run_id]:
                     db_manager.create_record(
                         RunLora,
                         run_id=new_run.run_id,
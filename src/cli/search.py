@@ -8,6 +8,7 @@ from typing import Optional
 
 import click
 from sqlalchemy import and_, desc, func, or_
+from sqlalchemy.orm import joinedload
 
 from src.models.database import Model, Run, RunLora
 
@@ -153,7 +154,8 @@ def prompt(
 
             # ページネーション
             total_count = query_obj.count()
-            results = query_obj.offset(offset).limit(limit).all()
+            # 表示するモデル名は同じSELECTで先読み
+            results = query_obj.offset(offset).limit(limit).options(joinedload(Run.model)).all()
 
             # セッションから切り離し
             for result in results:
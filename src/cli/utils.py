@@ -3,9 +3,11 @@
 このモジュールはCLIコマンド間で共有される共通機能を提供します。
 """
 
-from typing import Any, List, Optional
+import json
+from typing import IO, Any, Iterable, List, Optional
 
 import click
+import yaml
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.utils.db_utils import DatabaseManager
@@ -182,31 +184,121 @@ def validate_output_format(output_format: str) -> str:
     return output_format
 
 
+def _json_default_serializer(obj: Any) -> Any:
+    """JSON serialization用のデフォルトシリアライザ."""
+    if hasattr(obj, '__dict__'):
+        # SQLAlchemyモデルの場合
+        result = {}
+        for key, value in obj.__dict__.items():
+            if not key.startswith('_'):
+                if hasattr(value, 'isoformat'):  # datetime
+                    result[key] = value.isoformat()
+                else:
+                    result[key] = value
+        return result
+    elif hasattr(obj, 'isoformat'):  # datetime
+        return obj.isoformat()
+    return str(obj)
+
+
+def serialize_json(data: Any) -> bytes:
+    """データをインデント付きのUTF-8 JSONバイト列にシリアライズします.
+
+    orjsonがインストールされている場合はそちらを使用し、
+    ない場合は標準ライブラリのjsonにフォールバックします。
+
+    Args:
+        data: シリアライズするデータ
+
+    Returns:
+        UTF-8エンコードされたJSON
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(
+            data, default=_json_default_serializer, indent=2, ensure_ascii=False
+        ).encode('utf-8')
+
+    return orjson.dumps(
+        data,
+        default=_json_default_serializer,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+
+
 def output_json(data: Any) -> None:
     """JSON形式でデータを出力します.
 
     Args:
         data: 出力するデータ
     """
-    import json
+    # バイト列のまま渡し、大きな出力で文字列へのデコードと再エンコードを避ける
+    click.echo(serialize_json(data))
 
-    def default_serializer(obj):
-        """JSON serialization用のデフォルトシリアライザ."""
-        if hasattr(obj, '__dict__'):
-            # SQLAlchemyモデルの場合
-            result = {}
-            for key, value in obj.__dict__.items():
-                if not key.startswith('_'):
-                    if hasattr(value, 'isoformat'):  # datetime
-                        result[key] = value.isoformat()
-                    else:
-                        result[key] = value
-            return result
-        elif hasattr(obj, 'isoformat'):  # datetime
-            return obj.isoformat()
-        return str(obj)
 
-    click.echo(json.dumps(data, default=default_serializer, indent=2, ensure_ascii=False))
+def serialize_yaml(data: Any, stream: Optional[IO[str]] = None) -> Optional[str]:
+    """データをブロック形式のYAMLにシリアライズします.
+
+    libyamlが利用可能な場合はC実装のDumperを使用します（出力内容は同一）。
+
+    Args:
+        data: シリアライズするデータ
+        stream: 書き込み先のストリーム（Noneの場合は文字列を返す）
+
+    Returns:
+        streamがNoneの場合はYAML文字列、それ以外はNone
+    """
+    dumper = getattr(yaml, 'CDumper', yaml.Dumper)
+    return yaml.dump(
+        data, stream, Dumper=dumper, allow_unicode=True, default_flow_style=False
+    )
+
+
+def write_json_array(items: Iterable[Any], stream: IO[bytes]) -> int:
+    """要素を1件ずつシリアライズし、JSON配列としてストリームに書き込みます.
+
+    出力は ``serialize_json(list(items))`` と同じ形式ですが、
+    全要素をメモリ上に保持しません。
+
+    Args:
+        items: 書き込む要素のイテラブル
+        stream: バイナリモードの書き込み先
+
+    Returns:
+        書き込んだ要素数
+    """
+    count = 0
+    stream.write(b'[')
+    for item in items:
+        stream.write(b',\n' if count else b'\n')
+        # 配列要素として2スペース分インデントする（JSON文字列内に改行は含まれない）
+        stream.write(b'\n'.join(b'  ' + line for line in serialize_json(item).splitlines()))
+        count += 1
+    stream.write(b'\n]' if count else b']')
+    return count
+
+
+def write_yaml_sequence(items: Iterable[Any], stream: IO[str]) -> int:
+    """要素を1件ずつシリアライズし、YAMLのシーケンスとしてストリームに書き込みます.
+
+    ブロック形式のシーケンスは要素ごとの出力を連結したものと一致するため、
+    出力は ``serialize_yaml(list(items))`` と同じになります。
+
+    Args:
+        items: 書き込む要素のイテラブル
+        stream: テキストモードの書き込み先
+
+    Returns:
+        書き込んだ要素数
+    """
+    count = 0
+    for item in items:
+        serialize_yaml([item], stream)
+        count += 1
+    if not count:
+        serialize_yaml([], stream)
+    return count
 
 
 def output_yaml(data: Any) -> None:
@@ -215,8 +307,6 @@ def output_yaml(data: Any) -> None:
     Args:
         data: 出力するデータ
     """
-    import yaml
-
     # SQLAlchemyオブジェクトを辞書に変換
     def convert_to_dict(obj):
         if hasattr(obj, '__dict__'):
@@ -239,7 +329,7 @@ def output_yaml(data: Any) -> None:
     else:
         converted_data = convert_to_dict(data)
 
-    click.echo(yaml.dump(converted_data, allow_unicode=True, default_flow_style=False))
+    click.echo(serialize_yaml(converted_data))
 
 
 def handle_database_error(error: Exception) -> None:
@@ -257,9 +347,16 @@ def handle_database_error(error: Exception) -> None:
         raise click.ClickException(f"予期しないエラー: {error}")
 
 
+# プログレスバーの描画回数の上限（件数が多い場合は描画を間引く）
+PROGRESS_BAR_MAX_RENDERS = 200
+
+
 def progress_bar(items, label: str = "処理中"):
     """プログレスバーを表示します.
 
+    件数が多い場合は端末への描画が処理時間を支配しないよう、
+    全体で最大 ``PROGRESS_BAR_MAX_RENDERS`` 回程度の描画に間引きます。
+
     Args:
         items: 処理するアイテムのイテラブル
         label: プログレスバーのラベル
@@ -267,7 +364,15 @@ def progress_bar(items, label: str = "処理中"):
     Yields:
         各アイテム
     """
-    with click.progressbar(items, label=label) as bar:  # type: ignore[var-annotated]
+    try:
+        total = len(items)
+    except TypeError:
+        total = 0
+    update_min_steps = max(1, total // PROGRESS_BAR_MAX_RENDERS)
+
+    with click.progressbar(  # type: ignore[var-annotated]
+        items, label=label, update_min_steps=update_min_steps
+    ) as bar:
         yield from bar
 
 
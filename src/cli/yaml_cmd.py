@@ -3,17 +3,20 @@
 このモジュールはYAMLファイルの読み込み、検証、エクスポート機能を提供します。
 """
 
-import json
+import itertools
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import click
 import yaml
 
+from src.models.database import Run
 from src.yaml_loader import (
     YAMLLoader,
     YAMLLoaderError,
     YAMLValidationError,
+    find_yaml_files,
+    safe_load_yaml,
 )
 
 from .utils import (
@@ -28,8 +31,13 @@ from .utils import (
     output_json,
     output_yaml,
     progress_bar,
+    write_json_array,
+    write_yaml_sequence,
 )
 
+# yaml load で共有セッションをコミットする間隔（ファイル数）
+LOAD_COMMIT_INTERVAL = 200
+
 
 @click.group(name='yaml')
 @click.pass_context
@@ -94,10 +102,7 @@ def load(
                 ctx.exit(1)
                 return
         elif path_obj.is_dir():
-            if recursive:
-                yaml_files = list(path_obj.rglob("*.yaml")) + list(path_obj.rglob("*.yml"))
-            else:
-                yaml_files = list(path_obj.glob("*.yaml")) + list(path_obj.glob("*.yml"))
+            yaml_files = find_yaml_files(path_obj, recursive=recursive)
         else:
             display_error(f"無効なパス: {path}")
             ctx.exit(1)
@@ -116,38 +121,58 @@ def load(
             return
 
         # ファイルを処理
-        successful_loads = []
-        failed_loads = []
-        skipped_files = []
-
-        for yaml_file in progress_bar(yaml_files, "YAMLファイルを処理中"):
-            try:
-                # 重複チェック
-                yaml_data = loader.load_yaml_file(yaml_file)
-
-                existing_run = loader.check_duplicate_run(yaml_data)
-                if existing_run:
-                    skipped_files.append((yaml_file, f"重複: Run ID {existing_run.run_id}"))
-                    continue
-
-                # バリデーション
-                if not skip_validation:
-                    loader.validator.validate(yaml_data)
-
-                # データベースに挿入
-                run = loader.load_and_insert(yaml_file)
-                successful_loads.append((yaml_file, run))
+        successful_loads: List[Tuple[Path, Run]] = []
+        failed_loads: List[Tuple[Path, str]] = []
+        skipped_files: List[Tuple[Path, str]] = []
+        aborted = False
+
+        # ループ内の属性参照を減らすためメソッドを事前に束縛
+        add_success = successful_loads.append
+        add_failure = failed_loads.append
+        add_skipped = skipped_files.append
+        validate_data = loader.validator.validate
+
+        # 全ファイルで1つのセッションを共有し、一定件数ごとにコミット
+        with loader.session_scope() as session:
+            for index, yaml_file in enumerate(
+                progress_bar(yaml_files, "YAMLファイルを処理中"), start=1
+            ):
+                try:
+                    # 重複チェック
+                    yaml_data = loader.load_yaml_file(yaml_file)
+
+                    existing_run = loader.check_duplicate_run(yaml_data, session=session)
+                    if existing_run:
+                        add_skipped((yaml_file, f"重複: Run ID {existing_run.run_id}"))
+                        continue
 
-            except (YAMLValidationError, YAMLLoaderError) as e:
-                failed_loads.append((yaml_file, str(e)))
-                if not continue_on_error:
-                    display_error(f"エラーが発生しました: {yaml_file}: {e}")
-                    ctx.exit(1)
-            except Exception as e:
-                failed_loads.append((yaml_file, f"予期しないエラー: {e}"))
-                if not continue_on_error:
-                    display_error(f"予期しないエラーが発生しました: {yaml_file}: {e}")
-                    ctx.exit(1)
+                    # バリデーション
+                    if not skip_validation:
+                        validate_data(yaml_data)
+
+                    # データベースに挿入
+                    run = loader.load_and_insert(yaml_file, session=session)
+                    add_success((yaml_file, run))
+
+                    if index % LOAD_COMMIT_INTERVAL == 0:
+                        session.commit()
+
+                except (YAMLValidationError, YAMLLoaderError) as e:
+                    add_failure((yaml_file, str(e)))
+                    if not continue_on_error:
+                        display_error(f"エラーが発生しました: {yaml_file}: {e}")
+                        aborted = True
+                        break
+                except Exception as e:
+                    add_failure((yaml_file, f"予期しないエラー: {e}"))
+                    if not continue_on_error:
+                        display_error(f"予期しないエラーが発生しました: {yaml_file}: {e}")
+                        aborted = True
+                        break
+
+        # エラー前に読み込んだファイルはコミット済みのまま終了
+        if aborted:
+            ctx.exit(1)
 
         # 結果を表示
         if successful_loads:
@@ -227,7 +252,7 @@ def validate(ctx: click.Context, files: tuple, strict: bool) -> None:
             # ファイルが指定されていない場合はdata/yamls/を検証
             yaml_dir = Path("data/yamls")
             if yaml_dir.exists():
-                yaml_files = list(yaml_dir.glob("*.yaml")) + list(yaml_dir.glob("*.yml"))
+                yaml_files = find_yaml_files(yaml_dir)
             else:
                 display_error("data/yamls ディレクトリが見つかりません")
                 ctx.exit(3)
@@ -239,8 +264,7 @@ def validate(ctx: click.Context, files: tuple, strict: bool) -> None:
                 if path_obj.is_file():
                     yaml_files.append(path_obj)
                 elif path_obj.is_dir():
-                    yaml_files.extend(path_obj.glob("*.yaml"))
-                    yaml_files.extend(path_obj.glob("*.yml"))
+                    yaml_files.extend(find_yaml_files(path_obj))
 
         if not yaml_files:
             display_warning("検証対象のYAMLファイルが見つかりません")
@@ -248,22 +272,28 @@ def validate(ctx: click.Context, files: tuple, strict: bool) -> None:
 
         display_info(f"検証対象ファイル: {len(yaml_files)}件")
 
-        valid_files = []
-        invalid_files = []
-        warnings = []
+        valid_files: List[Path] = []
+        invalid_files: List[Tuple[Path, str]] = []
+        warnings: List[Tuple[Path, List[str]]] = []
+
+        # ループ内の属性参照を減らすためメソッドを事前に束縛
+        add_valid = valid_files.append
+        add_invalid = invalid_files.append
+        add_warning = warnings.append
+        validate_data = validator.validate
 
         for yaml_file in progress_bar(yaml_files, "YAMLファイルを検証中"):
             try:
                 # YAMLファイルを読み込み
                 with open(yaml_file, encoding='utf-8') as f:
-                    yaml_data = yaml.safe_load(f)
+                    yaml_data = safe_load_yaml(f)
 
                 if not isinstance(yaml_data, dict):
-                    invalid_files.append((yaml_file, "YAMLファイルは辞書形式である必要があります"))
+                    add_invalid((yaml_file, "YAMLファイルは辞書形式である必要があります"))
                     continue
 
                 # バリデーション実行
-                validator.validate(yaml_data)
+                validate_data(yaml_data)
 
                 # 追加の警告チェック
                 file_warnings = []
@@ -280,19 +310,19 @@ def validate(ctx: click.Context, files: tuple, strict: bool) -> None:
 
                 # 警告がある場合
                 if file_warnings:
-                    warnings.append((yaml_file, file_warnings))
+                    add_warning((yaml_file, file_warnings))
                     if strict:
-                        invalid_files.append((yaml_file, "警告項目があります: " + ", ".join(file_warnings)))
+                        add_invalid((yaml_file, "警告項目があります: " + ", ".join(file_warnings)))
                         continue
 
-                valid_files.append(yaml_file)
+                add_valid(yaml_file)
 
             except YAMLValidationError as e:
-                invalid_files.append((yaml_file, str(e)))
+                add_invalid((yaml_file, str(e)))
             except yaml.YAMLError as e:
-                invalid_files.append((yaml_file, f"YAML形式エラー: {e}"))
+                add_invalid((yaml_file, f"YAML形式エラー: {e}"))
             except Exception as e:
-                invalid_files.append((yaml_file, f"予期しないエラー: {e}"))
+                add_invalid((yaml_file, f"予期しないエラー: {e}"))
 
         # 結果を表示
         if valid_files:
@@ -393,7 +423,7 @@ def export(
     state = CliState(ctx)
 
     try:
-        from src.utils.db_utils import export_runs_with_relations
+        from src.utils.db_utils import iter_export_runs
 
         db_manager = state.db_manager
 
@@ -435,48 +465,64 @@ def export(
                 ctx.exit(1)
                 return
 
-        # データをエクスポート
+        # データをエクスポート（1件ずつ生成し、ファイル出力では全件を保持しない）
+        export_iter = iter_export_runs(
+            db_manager=db_manager,
+            filters=filters,
+            run_ids=run_id_list,
+            since_date=since_date,
+            until_date=until_date,
+            limit=limit,
+            order_by='created_at'
+        )
         try:
-            export_data = export_runs_with_relations(
-                db_manager=db_manager,
-                filters=filters,
-                run_ids=run_id_list,
-                since_date=since_date,
-                until_date=until_date,
-                limit=limit,
-                order_by='created_at'
-            )
+            # 先頭の1件でクエリを実行し、日付形式のエラーや0件をここで検出
+            first_data = next(export_iter, None)
         except ValueError as e:
             display_error(str(e))
             ctx.exit(1)
             return
 
-        # Run IDが指定されていて見つからないものがあれば警告
-        if run_id_list:
-            found_ids = {data['_metadata']['run_id'] for data in export_data}
-            missing_ids = set(run_id_list) - found_ids
-            for missing_id in missing_ids:
-                display_warning(f"Run ID {missing_id} が見つかりません")
+        found_ids = set()
 
-        if not export_data:
+        def iter_export_data():
+            if first_data is None:
+                return
+            for data in itertools.chain([first_data], export_iter):
+                found_ids.add(data['_metadata']['run_id'])
+                yield data
+
+        def warn_missing_run_ids():
+            # Run IDが指定されていて見つからないものがあれば警告
+            if run_id_list:
+                for missing_id in set(run_id_list) - found_ids:
+                    display_warning(f"Run ID {missing_id} が見つかりません")
+
+        if first_data is None:
+            warn_missing_run_ids()
             display_warning("エクスポート対象のデータが見つかりません")
             return
 
-        display_info(f"エクスポート対象: {len(export_data)}件")
-
         # 出力
         if output:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                if format == 'json':
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:  # yaml
-                    yaml.dump(export_data, f, allow_unicode=True, default_flow_style=False)
+            if format == 'json':
+                with open(output_path, 'wb') as binary_out:
+                    count = write_json_array(iter_export_data(), binary_out)
+            else:  # yaml
+                with open(output_path, 'w', encoding='utf-8') as text_out:
+                    count = write_yaml_sequence(iter_export_data(), text_out)
 
+            warn_missing_run_ids()
+            display_info(f"エクスポート対象: {count}件")
             display_success(f"データをエクスポートしました: {output}")
         else:
+            export_data = list(iter_export_data())
+            warn_missing_run_ids()
+            display_info(f"エクスポート対象: {len(export_data)}件")
+
             # 標準出力
             if format == 'json':
                 output_json(export_data)
@@ -509,7 +555,7 @@ def info(ctx: click.Context, yaml_file: str) -> None:
 
         # YAMLデータを読み込み
         with open(file_path, encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
+            yaml_data = safe_load_yaml(f)
 
         if not isinstance(yaml_data, dict):
             display_error("YAMLファイルは辞書形式である必要があります")
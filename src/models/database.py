@@ -5,31 +5,186 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import operator
+import uuid
+from datetime import datetime
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from sqlalchemy import (
     REAL,
     DateTime,
     ForeignKey,
     Integer,
+    LargeBinary,
+    Select,
     String,
+    Table,
     Text,
     event,
     func,
+    insert,
+    select,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    joinedload,
+    mapped_column,
+    raiseload,
+    relationship,
+    selectinload,
 )
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
 
 if TYPE_CHECKING:
     pass
 
 
+def _tuple_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """指定した属性の値を常にタプルで返すゲッターを作成します.
+
+    ``operator.attrgetter`` は属性が1つの場合にタプルではなく値を返すため、
+    その場合のみタプルに包みます。
+    """
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return operator.attrgetter(*names)
+
+
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base class."""
-    pass
 
+    # created_at/updated_atなどのSQL式デフォルトをINSERT/UPDATEのRETURNINGで
+    # 取得し、flush後に再SELECTしなくても属性が揃うようにする
+    __mapper_args__ = {"eager_defaults": True}
+
+    # to_dict()で出力するカラム属性名と、そのうちISO形式に変換する日時カラム
+    # テーブル定義からクラス作成時に一度だけ算出する
+    _export_cols: ClassVar[Tuple[str, ...]] = ()
+    _datetime_cols: ClassVar[Tuple[str, ...]] = ()
+    # _export_colsの値をまとめてタプルで取り出すゲッター
+    _export_values: ClassVar[Callable[[Any], Tuple[Any, ...]]] = staticmethod(
+        _tuple_getter(())
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """マッピング後のテーブル定義からエクスポート対象カラムを算出します."""
+        super().__init_subclass__(**kwargs)
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            cls._export_cols = tuple(column.key for column in table.columns)
+            cls._export_values = staticmethod(_tuple_getter(cls._export_cols))
+            cls._datetime_cols = tuple(
+                column.key for column in table.columns
+                if isinstance(column.type, DateTime)
+            )
+
+    def _columns_to_dict(self) -> Dict[str, Any]:
+        """全カラムの値を辞書に変換します（日時はISO形式の文字列）."""
+        result = dict(zip(self._export_cols, type(self)._export_values(self)))
+        for key in self._datetime_cols:
+            value = result[key]
+            result[key] = value.isoformat() if value else None
+        return result
+
+
+class HexDigest(TypeDecorator[str]):
+    """16進数のハッシュ文字列をバイナリとして格納する型.
+
+    Python側では ``hashlib`` の ``hexdigest()`` と同じ16進数文字列として扱い、
+    データベースには生のダイジェストバイト列（SHA-256なら32バイト）で格納します。
+    16進数として解釈できない値や既存のTEXT値はそのまま扱います。
+    """
+
+    impl = LargeBinary(32)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Any], dialect: Any) -> Optional[Any]:
+        """16進数文字列をバイト列に変換します."""
+        if isinstance(value, str):
+            try:
+                return bytes.fromhex(value)
+            except ValueError:
+                return value
+        return value
+
+    def process_result_value(self, value: Optional[Any], dialect: Any) -> Optional[str]:
+        """バイト列を16進数文字列に変換します."""
+        if isinstance(value, bytes):
+            return value.hex()
+        return value
+
+
+class CompactUUID(TypeDecorator[str]):
+    """UUID文字列を16バイトのバイナリとして格納する型.
+
+    Python側ではNotionのページIDと同じハイフン区切りのUUID文字列として扱い、
+    データベースには ``uuid.UUID.bytes`` の16バイトで格納します。
+    UUIDとして解釈できない値や既存のTEXT値はそのまま扱います。
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Any], dialect: Any) -> Optional[Any]:
+        """UUID文字列をバイト列に変換します."""
+        if isinstance(value, str):
+            try:
+                return uuid.UUID(value).bytes
+            except ValueError:
+                return value
+        return value
+
+    def process_result_value(self, value: Optional[Any], dialect: Any) -> Optional[str]:
+        """バイト列をハイフン区切りのUUID文字列に変換します."""
+        if isinstance(value, bytes) and len(value) == 16:
+            return str(uuid.UUID(bytes=value))
+        return value
+
+
+class _CachedDictMixin:
+    """to_dict()の結果をインスタンスごとにキャッシュするMixin.
+
+    複数のRunから参照されるモデルやタグを繰り返しエクスポートする際に、
+    同じ辞書の再構築を避けます。キャッシュはカラム属性への代入、
+    refresh、expireの際に破棄されます（``_register_dict_cache_invalidation``）。
+    """
 
-class Model(Base):
+    def _build_dict(self) -> Dict[str, Any]:
+        """YAML export用の辞書を構築します."""
+        return self._columns_to_dict()  # type: ignore[attr-defined]
+
+    @cached_property
+    def _dict_cache(self) -> Dict[str, Any]:
+        return self._build_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """YAML export用の辞書形式に変換.
+
+        返り値はキャッシュのコピーのため、呼び出し側で変更しても影響しません。
+        """
+        return dict(self._dict_cache)
+
+
+class Model(_CachedDictMixin, Base):
     """モデル情報テーブル.
 
     Checkpoints, LoRA, VAE, ControlNetなどのAIモデル情報を管理します。
@@ -47,7 +202,10 @@ class Model(Base):
         DateTime, default=func.current_timestamp(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=func.current_timestamp(), nullable=False
+        DateTime,
+        default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+        nullable=False,
     )
 
     # Relationships
@@ -60,19 +218,6 @@ class Model(Base):
         """文字列表現を返します."""
         return f"<Model(id={self.model_id}, name='{self.name}', type='{self.type}')>"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """YAML export用の辞書形式に変換."""
-        return {
-            'model_id': self.model_id,
-            'name': self.name,
-            'type': self.type,
-            'filename': self.filename,
-            'source': self.source,
-            'notes': self.notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
-
 
 class Run(Base):
     """実行履歴テーブル.
@@ -99,7 +244,7 @@ class Run(Base):
     batch_size: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     status: Mapped[str] = mapped_column(String, default="Tried", nullable=False)
     source: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    notion_page_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    notion_page_id: Mapped[Optional[str]] = mapped_column(CompactUUID, nullable=True)
     notion_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     notion_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     comfyui_workflow_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -107,7 +252,10 @@ class Run(Base):
         DateTime, default=func.current_timestamp(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=func.current_timestamp(), nullable=False
+        DateTime,
+        default=func.current_timestamp(),
+        onupdate=func.current_timestamp(),
+        nullable=False,
     )
 
     # Relationships
@@ -126,8 +274,31 @@ class Run(Base):
         """文字列表現を返します."""
         return f"<Run(id={self.run_id}, title='{self.title}', status='{self.status}')>"
 
+    @classmethod
+    def query_for_export(cls) -> Select[Run]:
+        """to_dict()が参照する関連データを先読みするクエリを返します.
+
+        コレクションはselectinloadで読み込むため、Run件数に関わらず関連ごとに
+        固定回数のSELECTで済みます。読み込んでいない関連へのアクセスは
+        遅延読み込みせずに例外となります。
+
+        Returns:
+            フィルタやソートを追加できるSELECT文
+        """
+        return select(cls).options(
+            joinedload(cls.model),
+            selectinload(cls.loras).joinedload(RunLora.lora_model),
+            selectinload(cls.images),
+            selectinload(cls.tags).joinedload(RunTag.tag),
+            raiseload("*"),
+        )
+
     def to_dict(self) -> Dict[str, Any]:
-        """YAML export用の辞書形式に変換."""
+        """YAML export用の辞書形式に変換.
+
+        関連データ（model, loras, tags, images）を参照するため、
+        ``query_for_export()`` で取得したRunに対して呼び出してください。
+        """
         result: Dict[str, Any] = {
             'run_title': self.title,
             'prompt': self.prompt,
@@ -151,19 +322,19 @@ class Run(Base):
         }
 
         # Add model name if available
-        if hasattr(self, 'model') and self.model:
+        if self.model:
             result['model'] = self.model.name
 
         # Add LoRA names if available
-        if hasattr(self, 'loras') and self.loras:
+        if self.loras:
             result['loras'] = [lora.lora_model.name for lora in self.loras]
 
         # Add tag names if available
-        if hasattr(self, 'tags') and self.tags:
+        if self.tags:
             result['tags'] = [tag.tag.name for tag in self.tags]
 
         # Add image information if available
-        if hasattr(self, 'images') and self.images:
+        if self.images:
             result['images'] = [image.to_dict() for image in self.images]
 
         # Add metadata
@@ -177,7 +348,7 @@ class Run(Base):
         return result
 
 
-class Image(Base):
+class Image(_CachedDictMixin, Base):
     """生成画像テーブル.
 
     実行履歴に紐づく生成画像の情報を管理します。
@@ -194,7 +365,7 @@ class Image(Base):
     width: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     height: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    hash: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    hash: Mapped[Optional[str]] = mapped_column(HexDigest, nullable=True)
     image_metadata: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.current_timestamp(), nullable=False
@@ -207,23 +378,8 @@ class Image(Base):
         """文字列表現を返します."""
         return f"<Image(id={self.image_id}, filename='{self.filename}')>"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """YAML export用の辞書形式に変換."""
-        return {
-            'image_id': self.image_id,
-            'run_id': self.run_id,
-            'filename': self.filename,
-            'filepath': self.filepath,
-            'width': self.width,
-            'height': self.height,
-            'file_size': self.file_size,
-            'hash': self.hash,
-            'image_metadata': self.image_metadata,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
-
 
-class Tag(Base):
+class Tag(_CachedDictMixin, Base):
     """タグテーブル.
 
     実行履歴の分類用タグを管理します。
@@ -247,15 +403,6 @@ class Tag(Base):
         """文字列表現を返します."""
         return f"<Tag(id={self.tag_id}, name='{self.name}', category='{self.category}')>"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """YAML export用の辞書形式に変換."""
-        return {
-            'tag_id': self.tag_id,
-            'name': self.name,
-            'category': self.category,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
-
 
 class RunLora(Base):
     """実行履歴とLoRAの関連付けテーブル.
@@ -285,11 +432,7 @@ class RunLora(Base):
 
     def to_dict(self) -> Dict[str, Any]:
         """YAML export用の辞書形式に変換."""
-        result: Dict[str, Any] = {
-            'run_id': self.run_id,
-            'lora_id': self.lora_id,
-            'weight': self.weight
-        }
+        result = self._columns_to_dict()
 
         # Add LoRA model name if available
         if hasattr(self, 'lora_model') and self.lora_model:
@@ -323,10 +466,7 @@ class RunTag(Base):
 
     def to_dict(self) -> Dict[str, Any]:
         """YAML export用の辞書形式に変換."""
-        result: Dict[str, Any] = {
-            'run_id': self.run_id,
-            'tag_id': self.tag_id
-        }
+        result = self._columns_to_dict()
 
         # Add tag details if available
         if hasattr(self, 'tag') and self.tag:
@@ -336,14 +476,151 @@ class RunTag(Base):
         return result
 
 
-# Auto-update triggers for updated_at fields
-@event.listens_for(Model, "before_update")
-def update_model_timestamp(mapper: Any, connection: Any, target: Model) -> None:
-    """Modelテーブルのupdated_atを自動更新します."""
-    target.updated_at = datetime.now(timezone.utc)
+class SyncState(Base):
+    """同期状態テーブル.
+
+    外部サービスとの差分同期に使用するチェックポイントを管理します。
+    """
+
+    __tablename__ = "sync_state"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    last_sync_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        """文字列表現を返します."""
+        return f"<SyncState(name='{self.name}', last_sync_at={self.last_sync_at})>"
+
+
+def _invalidate_dict_cache(target: Any, *args: Any) -> None:
+    """to_dict()のキャッシュを破棄します."""
+    # 参照が切れたインスタンスのexpireではtargetがNoneになる
+    if target is not None:
+        target.__dict__.pop("_dict_cache", None)
+
+
+def _register_dict_cache_invalidation(cls: Any) -> None:
+    """属性の変更・再読み込み時にto_dict()のキャッシュを破棄するイベントを登録します."""
+    for event_name in ("refresh", "refresh_flush", "expire"):
+        event.listen(cls, event_name, _invalidate_dict_cache)
+    for attr in cls.__mapper__.column_attrs:
+        event.listen(getattr(cls, attr.key), "set", _invalidate_dict_cache)
+
+
+for _cached_cls in (Model, Image, Tag):
+    _register_dict_cache_invalidation(_cached_cls)
+
+
+# 関連付けテーブルのCoreテーブル（一括挿入ではORMのマッピングを経由しない）
+run_loras_table = cast(Table, RunLora.__table__)
+run_tags_table = cast(Table, RunTag.__table__)
+
+
+# Bulk insert helpers
+# session.add()によるオブジェクト単位のINSERTを避け、executemany形式で一括挿入する。
+# SQLAlchemyのinsertmanyvaluesにより複数行のVALUESにまとめて送信される
+# （1文あたりの行数はエンジンの insertmanyvalues_page_size で制御）。
+
+# 1回のexecuteに渡す最大行数（パラメータリストのメモリ使用量を抑える）
+BULK_INSERT_CHUNK_SIZE = 10000
 
 
-@event.listens_for(Run, "before_update")
-def update_run_timestamp(mapper: Any, connection: Any, target: Run) -> None:
-    """Runテーブルのupdated_atを自動更新します."""
-    target.updated_at = datetime.now(timezone.utc)
+def _chunked(rows: Sequence[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """行データを BULK_INSERT_CHUNK_SIZE 件ずつのリストに分割します."""
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        yield list(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+
+
+def _bulk_insert_returning_ids(
+    session: Session, model: Any, pk_column: Any, rows: Sequence[Dict[str, Any]]
+) -> List[int]:
+    """行データを一括挿入し、採番された主キーを入力と同じ順序で返します.
+
+    SQLiteでは ``sort_by_parameter_order`` を指定すると1行ずつのINSERTになるため
+    指定しません。RETURNINGの順序は不定ですが、INTEGER PRIMARY KEYは挿入順に
+    増加する値が採番されるため、昇順に並べ替えると入力順と一致します。
+    """
+    stmt = insert(model).returning(pk_column)
+    ids: List[int] = []
+    for chunk in _chunked(rows):
+        ids.extend(sorted(session.scalars(stmt, chunk)))
+    return ids
+
+
+def bulk_insert_runs(session: Session, rows: Sequence[Dict[str, Any]]) -> List[int]:
+    """実行履歴を一括挿入します.
+
+    Args:
+        session: SQLAlchemy Session インスタンス
+        rows: Runのカラム名をキーとする辞書のシーケンス
+
+    Returns:
+        挿入されたrun_idのリスト（rowsと同じ順序）
+    """
+    return _bulk_insert_returning_ids(session, Run, Run.run_id, rows)
+
+
+def bulk_insert_run_loras(session: Session, rows: Sequence[Dict[str, Any]]) -> None:
+    """実行履歴とLoRAの関連付けを一括挿入します.
+
+    既に存在する (run_id, lora_id) の組み合わせは無視されます。
+
+    Args:
+        session: SQLAlchemy Session インスタンス
+        rows: run_id, lora_id, weight をキーとする辞書のシーケンス
+    """
+    stmt = insert(run_loras_table).prefix_with("OR IGNORE")
+    for chunk in _chunked(rows):
+        session.execute(stmt, chunk)
+
+
+def bulk_insert_run_tags(session: Session, rows: Sequence[Dict[str, Any]]) -> None:
+    """実行履歴とタグの関連付けを一括挿入します.
+
+    既に存在する (run_id, tag_id) の組み合わせは無視されます。
+
+    Args:
+        session: SQLAlchemy Session インスタンス
+        rows: run_id, tag_id をキーとする辞書のシーケンス
+    """
+    stmt = insert(run_tags_table).prefix_with("OR IGNORE")
+    for chunk in _chunked(rows):
+        session.execute(stmt, chunk)
+
+
+# UPSERTで上書きしないカラム（主キー、競合判定キー、作成日時）
+_RUN_UPSERT_EXCLUDED_COLUMNS = frozenset({"run_id", "notion_id", "created_at"})
+
+
+def upsert_runs(session: Session, rows: Sequence[Dict[str, Any]]) -> List[int]:
+    """notion_idをキーに実行履歴を一括UPSERTします.
+
+    ``INSERT ... ON CONFLICT (notion_id) DO UPDATE`` により、既存行の検索と
+    INSERT/UPDATEの振り分けを1文で行います。更新されるのは各行に含まれる
+    カラムのみで、updated_atが含まれない場合は現在時刻が設定されます。
+
+    Args:
+        session: SQLAlchemy Session インスタンス
+        rows: notion_idを含み、すべて同じキーを持つ辞書のシーケンス
+
+    Returns:
+        挿入または更新されたrun_idのリスト（rowsと同じ順序）
+    """
+    if not rows:
+        return []
+
+    stmt = sqlite_insert(Run)
+    set_: Dict[str, Any] = {
+        key: stmt.excluded[key]
+        for key in rows[0]
+        if key not in _RUN_UPSERT_EXCLUDED_COLUMNS
+    }
+    set_.setdefault("updated_at", func.current_timestamp())
+    upsert = stmt.on_conflict_do_update(
+        index_elements=[Run.notion_id], set_=set_
+    ).returning(Run.run_id, sort_by_parameter_order=True)
+
+    ids: List[int] = []
+    for chunk in _chunked(rows):
+        ids.extend(session.scalars(upsert, chunk))
+    return ids
@@ -6,12 +6,17 @@ with rate limiting, error handling, and async support.
 """
 
 import asyncio
+import functools
 import logging
+import operator
+import random
 import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, cast
 
-from notion_client import Client
+import httpx
+from notion_client import AsyncClient
 from notion_client.errors import (
     APIResponseError,
     HTTPResponseError,
@@ -21,6 +26,30 @@ from notion_client.errors import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_get_plain_text = operator.itemgetter("plain_text")
+
+# Number of idle connections kept open for reuse between requests
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 10
+
+# Seconds an idle keep-alive connection is kept before being closed
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# Upper bound for the exponential part of the retry backoff (seconds)
+MAX_BACKOFF_SECONDS = 60
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    # Without h2, httpx falls back to HTTP/1.1 with keep-alive connections
+    HTTP2_AVAILABLE = False
+else:
+    HTTP2_AVAILABLE = True
+
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = None
+
 
 class NotionRateLimiter:
     """Rate limiter for Notion API (3 requests per second)."""
@@ -28,30 +57,41 @@ class NotionRateLimiter:
     def __init__(self, max_requests: int = 3, time_window: float = 1.0):
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: List[float] = []
+        # Monotonic request timestamps in ascending order (oldest at the left).
+        # Only the last max_requests entries matter for the sliding window.
+        self.requests: Deque[float] = deque(maxlen=max_requests)
         self._lock = asyncio.Lock()
 
     async def wait_if_needed(self) -> None:
         """Wait if rate limit would be exceeded."""
         async with self._lock:
-            current_time = time.time()
+            # time.monotonic() is unaffected by system clock adjustments
+            current_time = time.monotonic()
 
             # Remove old requests outside time window
-            self.requests = [
-                req_time for req_time in self.requests
-                if current_time - req_time < self.time_window
-            ]
+            while self.requests and current_time - self.requests[0] >= self.time_window:
+                self.requests.popleft()
 
             # Check if we need to wait
             if len(self.requests) >= self.max_requests:
-                oldest_request = min(self.requests)
+                oldest_request = self.requests[0]
                 wait_time = self.time_window - (current_time - oldest_request)
                 if wait_time > 0:
                     logger.debug(f"Rate limit: waiting {wait_time:.2f} seconds")
                     await asyncio.sleep(wait_time)
 
-            # Record this request
-            self.requests.append(current_time)
+            # Record this request (after any wait, so the window starts when it is sent)
+            self.requests.append(time.monotonic())
+
+    def pause(self, seconds: float) -> None:
+        """Block all requests for the given number of seconds.
+
+        The window is filled with timestamps that expire ``seconds`` from now,
+        so subsequent calls to :meth:`wait_if_needed` back off automatically.
+        """
+        resume_at = time.monotonic() + seconds - self.time_window
+        for _ in range(self.max_requests):
+            self.requests.append(resume_at)
 
 
 class NotionAPIError(Exception):
@@ -93,6 +133,10 @@ class NotionClient:
     - Automatic retry with exponential backoff
     - Comprehensive error handling
     - Async support for high-performance operations
+
+    Requests are sent with a single ``httpx.AsyncClient`` (HTTP/2 when ``h2``
+    is installed) that is reused for the lifetime of the instance. Call
+    :meth:`aclose` or use ``async with`` to release its connections.
     """
 
     def __init__(
@@ -116,12 +160,35 @@ class NotionClient:
         self.max_retries = max_retries
         self.timeout = timeout
 
-        # Initialize client and rate limiter
-        self.client = Client(auth=api_key)
+        # Initialize client and rate limiter (retries are handled by _make_request)
+        self._http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+        )
+        self.client = AsyncClient(
+            client=self._http_client,
+            auth=api_key,
+            timeout_ms=timeout * 1000,
+        )
         self.rate_limiter = NotionRateLimiter()
+        # Bound client methods keyed by dotted path (e.g. "pages.retrieve")
+        self._method_cache: Dict[str, Callable[..., Any]] = {}
 
         logger.info(f"Notion client initialized for database: {database_id}")
 
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connections."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "NotionClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     async def _make_request(
         self,
         method: str,
@@ -142,20 +209,24 @@ class NotionClient:
         Raises:
             NotionAPIError: Various Notion API errors
         """
+        # Resolve the dotted method path once (reused across retries and calls)
+        client_method = self._method_cache.get(method)
+        if client_method is None:
+            client_method = cast(
+                Callable[..., Any],
+                functools.reduce(getattr, method.split('.'), self.client),
+            )
+            self._method_cache[method] = client_method
+
         for attempt in range(self.max_retries + 1):
             try:
                 # Apply rate limiting
                 await self.rate_limiter.wait_if_needed()
 
-                # Get the method from client using dotted path
-                method_parts = method.split('.')
-                client_method = self.client
-                for part in method_parts:
-                    client_method = getattr(client_method, part)
-
-                # Make the request
+                # The async client does not block the event loop, so concurrent
+                # requests (e.g. the next query page) are genuinely in flight together
                 logger.debug(f"Making Notion API request: {method} (attempt {attempt + 1})")
-                response = client_method(*args, **kwargs)  # type: ignore[operator]
+                response = await client_method(*args, **kwargs)
 
                 logger.debug(f"Notion API request successful: {method}")
                 return response
@@ -164,7 +235,7 @@ class NotionClient:
                 logger.warning(f"Notion API timeout (attempt {attempt + 1}): {e}")
                 if attempt >= self.max_retries:
                     raise NotionTimeoutError(f"タイムアウトエラー: {e}")
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(self._backoff(attempt))
 
             except HTTPResponseError as e:
                 if e.status == 401:
@@ -175,13 +246,14 @@ class NotionClient:
                     logger.warning(f"Rate limit exceeded (attempt {attempt + 1}): {e}")
                     if attempt >= self.max_retries:
                         raise NotionRateLimitError(f"レート制限エラー: {e}")
-                    await asyncio.sleep(2 ** attempt)
+                    # The rate limiter holds back this retry and any concurrent requests
+                    self.rate_limiter.pause(self._retry_after(e, attempt))
                 elif e.status >= 500:
                     # Server error - retry
                     logger.warning(f"Notion API server error (attempt {attempt + 1}): {e}")
                     if attempt >= self.max_retries:
                         raise NotionConnectionError(f"サーバーエラー: {e}")
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(self._backoff(attempt))
                 else:
                     raise NotionAPIError(f"APIエラー (HTTP {e.status}): {e}")
 
@@ -193,6 +265,44 @@ class NotionClient:
                 logger.error(f"Unexpected error in Notion API request: {e}")
                 raise NotionAPIError(f"予期しないエラー: {e}")
 
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """
+        Get the wait time before retry ``attempt + 1``.
+
+        Exponential (capped at MAX_BACKOFF_SECONDS) plus up to one second of
+        jitter, so concurrent requests that failed together do not retry
+        together.
+
+        Args:
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait
+        """
+        return min(MAX_BACKOFF_SECONDS, 2 ** attempt) + random.random()
+
+    @staticmethod
+    def _retry_after(error: HTTPResponseError, attempt: int) -> float:
+        """
+        Get the wait time before retrying a rate-limited request.
+
+        Args:
+            error: 429 response error
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds from the Retry-After header, or the backoff if absent
+        """
+        headers = getattr(error, "headers", None) or {}
+        retry_after = headers.get("Retry-After")
+        if retry_after is None:
+            return NotionClient._backoff(attempt)
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return NotionClient._backoff(attempt)
+
     async def get_database_info(self) -> Dict[str, Any]:
         """
         Get database information.
@@ -205,7 +315,8 @@ class NotionClient:
     async def get_database_pages(
         self,
         page_size: int = 100,
-        start_cursor: Optional[str] = None
+        start_cursor: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Get database pages with pagination.
@@ -213,38 +324,73 @@ class NotionClient:
         Args:
             page_size: Number of pages to retrieve (max 100)
             start_cursor: Start cursor for pagination
+            filter: Notion database query filter
 
         Returns:
             Database pages response
         """
-        query_params = {
+        query_params: Dict[str, Any] = {
             "database_id": self.database_id,
             "page_size": min(page_size, 100)
         }
 
         if start_cursor:
             query_params["start_cursor"] = start_cursor
+        if filter:
+            query_params["filter"] = filter
 
         return await self._make_request("databases.query", **query_params)
 
-    async def get_all_pages(self) -> List[Dict[str, Any]]:
+    async def iter_pages(
+        self,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all pages in the database.
+
+        The next page of results is requested as soon as its cursor is known,
+        so the caller can process one batch while the next is in flight.
+
+        Args:
+            filter: Notion database query filter
+
+        Yields:
+            Database pages in query order
+        """
+        pending: Optional[asyncio.Task[Dict[str, Any]]] = asyncio.ensure_future(
+            self.get_database_pages(filter=filter)
+        )
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                if response.get("has_more", False):
+                    pending = asyncio.ensure_future(
+                        self.get_database_pages(
+                            start_cursor=response.get("next_cursor"), filter=filter
+                        )
+                    )
+
+                for page in response.get("results", []):
+                    yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def get_all_pages(
+        self,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get all pages from the database.
 
+        Args:
+            filter: Notion database query filter
+
         Returns:
             List of all pages
         """
-        all_pages = []
-        start_cursor = None
-
-        while True:
-            response = await self.get_database_pages(start_cursor=start_cursor)
-            all_pages.extend(response.get("results", []))
-
-            if not response.get("has_more", False):
-                break
-
-            start_cursor = response.get("next_cursor")
+        all_pages = [page async for page in self.iter_pages(filter=filter)]
 
         logger.info(f"Retrieved {len(all_pages)} pages from database")
         return all_pages
@@ -369,6 +515,9 @@ class NotionClient:
         Returns:
             Datetime object
         """
+        if _parse_iso_datetime is not None:
+            # C implementation; accepts the trailing "Z" directly
+            return _parse_iso_datetime(dt_str)
         return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
 
     def extract_text_from_rich_text(self, rich_text: List[Dict[str, Any]]) -> str:
@@ -384,9 +533,13 @@ class NotionClient:
         if not rich_text or not isinstance(rich_text, list):
             return ""
 
-        return "".join(
-            text_obj.get("plain_text", "") for text_obj in rich_text
-        )
+        try:
+            # Notion always includes plain_text, so take the C-level fast path
+            return "".join(map(_get_plain_text, rich_text))
+        except KeyError:
+            return "".join(
+                text_obj.get("plain_text", "") for text_obj in rich_text
+            )
 
     def create_rich_text(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -401,9 +554,4 @@ class NotionClient:
         if not text:
             return []
 
-        return [
-            {
-                "type": "text",
-                "text": {"content": text}
-            }
-        ]
+        return [{"type": "text", "text": {"content": text}}]
@@ -5,34 +5,180 @@ This module provides bidirectional synchronization between Notion database
 and local SQLite database with data mapping and conflict resolution.
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import operator
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy import select
-from sqlalchemy.orm import Session
-
-from .models.database import Model, Run, RunLora, RunTag, Tag
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    Select,
+    String,
+    Table,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from .models.database import (
+    Model,
+    Run,
+    RunLora,
+    RunTag,
+    SyncState,
+    Tag,
+    bulk_insert_run_loras,
+    bulk_insert_run_tags,
+    run_loras_table,
+    run_tags_table,
+    upsert_runs,
+)
 from .notion_client import NotionClient
 from .utils.db_utils import DatabaseManager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of Notion page writes in flight at once
+# (matches the 3 requests/second allowed by the rate limiter)
+NOTION_SYNC_CONCURRENCY = 3
+
+# Pages converted and prefetched together (Notion's maximum page_size)
+SYNC_BATCH_SIZE = 100
+
+# Maximum number of names per IN clause when prefetching lookups
+PREFETCH_CHUNK_SIZE = 500
+
+# Runs fetched from SQLite per round trip when streaming local runs
+RUN_STREAM_BATCH_SIZE = 500
+
+# Modification times at most this far apart are treated as the same edit
+TIMESTAMP_TOLERANCE_SECONDS = 1
+
+# Connection-local staging table joined against runs in detect_conflicts.
+# Kept out of Base.metadata so create_all never creates it permanently.
+_NOTION_SYNC_STAGE = Table(
+    "notion_sync_stage",
+    MetaData(),
+    Column("notion_id", String, primary_key=True),
+    Column("updated_at", DateTime),
+    prefixes=["TEMPORARY"],
+)
+
+
+def _select_runs_for_sync() -> Select[Run]:
+    """
+    Select runs with the relations local_to_notion reads already loaded.
+
+    Without this every run costs extra lazy SELECTs for its model, LoRAs and
+    tags; with it the whole list is loaded in a fixed number of statements.
+    """
+    return select(Run).options(
+        joinedload(Run.model),
+        selectinload(Run.loras).joinedload(RunLora.lora_model),
+        selectinload(Run.tags).joinedload(RunTag.tag),
+    )
+
+
+# Run columns written from converted page data (see NotionSyncManager._run_row)
+_RUN_TEXT_COLUMNS = ("title", "prompt", "negative", "notion_url")
+_RUN_CHOICE_COLUMNS = ("sampler", "status")
+_RUN_NUMBER_COLUMNS: Tuple[Tuple[str, Callable[[float], Any]], ...] = (
+    ("cfg", float), ("steps", int), ("seed", int), ("width", int), ("height", int),
+)
+
+
+def _split_names(value: Any) -> List[str]:
+    """
+    Return the names of a converted multi-select field.
+
+    notion_to_local joins multi-select values with ", "; lists are accepted too.
+    """
+    if isinstance(value, str):
+        return [name for name in (part.strip() for part in value.split(",")) if name]
+    return list(value or ())
+
+
+def _normalize_dt(dt: datetime) -> datetime:
+    """
+    Normalize a timestamp for comparison.
+
+    Naive values (as read back from SQLite) are taken to be UTC. The result is
+    aware, in UTC and truncated to whole seconds.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _modified_delta(notion_modified: datetime, local_modified: datetime) -> float:
+    """
+    Return how many seconds the Notion edit is newer than the local one.
+
+    Differences within TIMESTAMP_TOLERANCE_SECONDS are reported as 0.
+    """
+    delta = (_normalize_dt(notion_modified) - _normalize_dt(local_modified)).total_seconds()
+    return delta if abs(delta) > TIMESTAMP_TOLERANCE_SECONDS else 0.0
+
 
-@dataclass
 class SyncStats:
-    """Statistics for sync operations."""
-    total_notion_pages: int = 0
-    total_local_runs: int = 0
-    created_local: int = 0
-    updated_local: int = 0
-    created_notion: int = 0
-    updated_notion: int = 0
-    skipped: int = 0
-    conflicts: int = 0
-    errors: int = 0
+    """
+    Statistics for sync operations.
+
+    A plain class with ``__slots__`` rather than a dataclass, since
+    ``dataclass(slots=True)`` needs Python 3.10. Counters are only updated
+    from the event loop thread, so concurrent sync tasks need no lock.
+    """
+    __slots__ = (
+        "total_notion_pages",
+        "total_local_runs",
+        "created_local",
+        "updated_local",
+        "created_notion",
+        "updated_notion",
+        "skipped",
+        "conflicts",
+        "errors",
+    )
+
+    def __init__(
+        self,
+        total_notion_pages: int = 0,
+        total_local_runs: int = 0,
+        created_local: int = 0,
+        updated_local: int = 0,
+        created_notion: int = 0,
+        updated_notion: int = 0,
+        skipped: int = 0,
+        conflicts: int = 0,
+        errors: int = 0,
+    ) -> None:
+        self.total_notion_pages = total_notion_pages
+        self.total_local_runs = total_local_runs
+        self.created_local = created_local
+        self.updated_local = updated_local
+        self.created_notion = created_notion
+        self.updated_notion = updated_notion
+        self.skipped = skipped
+        self.conflicts = conflicts
+        self.errors = errors
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"{type(self).__name__}({counts})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SyncStats):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
 
 
 class NotionFieldMapper:
@@ -65,9 +211,63 @@ class NotionFieldMapper:
     # Reverse mapping for local -> Notion
     REVERSE_MAPPING = {v: k for k, v in FIELD_MAPPING.items()}
 
+    # (local field, Notion property) pairs for local -> Notion, by property type.
+    # Every field listed here must be a Run column: the getters below do not
+    # default missing attributes (Run has no "notes", so Notes is never pushed).
+    _RICH_TEXT_FIELDS = (("prompt", "Prompt"), ("negative", "Negative"))
+    _NUMBER_FIELDS = (
+        ("cfg", "CFG"), ("steps", "Steps"), ("seed", "Seed"),
+        ("width", "Width"), ("height", "Height"),
+    )
+    _SELECT_FIELDS = (("sampler", "Sampler"), ("status", "Status"))
+
+    # Getters returning each list's local values as a tuple, in the same order
+    _RICH_TEXT_GETTER = operator.attrgetter(*(field for field, _ in _RICH_TEXT_FIELDS))
+    _NUMBER_GETTER = operator.attrgetter(*(field for field, _ in _NUMBER_FIELDS))
+    _SELECT_GETTER = operator.attrgetter(*(field for field, _ in _SELECT_FIELDS))
+
     def __init__(self, notion_client: NotionClient):
         self.notion_client = notion_client
 
+        # Notion property type -> converter to the local value
+        self._converters: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "title": self._extract_title,
+            "rich_text": self._extract_rich_text,
+            "number": self._convert_number,
+            "select": self._convert_select,
+            "multi_select": self._convert_multi_select,
+            "created_time": self._convert_datetime,
+            "last_edited_time": self._convert_datetime,
+            "url": self._convert_url,
+        }
+
+        # (Notion field, local field, converter) resolved by compile_schema()
+        self._compiled_fields: Optional[
+            Tuple[Tuple[str, str, Callable[[Dict[str, Any]], Any]], ...]
+        ] = None
+
+    def compile_schema(self, database_properties: Dict[str, Any]) -> None:
+        """
+        Resolve the field conversion plan from the database schema.
+
+        Pages always carry the property types declared by their database, so
+        the per-field type dispatch is done once here instead of for every page.
+
+        Args:
+            database_properties: "properties" of the Notion database object
+        """
+        plan = []
+        for notion_field, local_field in self.FIELD_MAPPING.items():
+            schema = database_properties.get(notion_field)
+            if not schema:
+                continue
+
+            converter = self._converters.get(schema.get("type"))
+            if converter is not None:
+                plan.append((notion_field, local_field, converter))
+
+        self._compiled_fields = tuple(plan)
+
     def notion_to_local(self, notion_page: Dict[str, Any]) -> Dict[str, Any]:
         """
         Convert Notion page to local database format.
@@ -78,36 +278,31 @@ class NotionFieldMapper:
         Returns:
             Local database field data
         """
-        local_data = {}
+        local_data: Dict[str, Any] = {}
         properties = notion_page.get("properties", {})
 
-        for notion_field, local_field in self.FIELD_MAPPING.items():
-            if notion_field not in properties:
-                continue
+        # The compiled plan is the mapping partially evaluated against the
+        # schema: only fields with a known converter, dispatch already resolved
+        if self._compiled_fields is not None:
+            fields = self._compiled_fields
+        else:
+            # No schema available - dispatch on each property's type
+            converters = self._converters
+            fields = tuple(
+                (notion_field, local_field, converter)
+                for notion_field, local_field in self.FIELD_MAPPING.items()
+                if notion_field in properties
+                for converter in (converters.get(properties[notion_field].get("type")),)
+                if converter is not None
+            )
 
-            prop = properties[notion_field]
-            prop_type = prop.get("type")
+        for notion_field, local_field, converter in fields:
+            prop = properties.get(notion_field)
+            if prop is None:
+                continue
 
             try:
-                if prop_type == "title":
-                    local_data[local_field] = self._extract_title(prop)
-                elif prop_type == "rich_text":
-                    local_data[local_field] = self._extract_rich_text(prop)
-                elif prop_type == "number":
-                    local_data[local_field] = str(self._extract_number(prop)) if self._extract_number(prop) is not None else ""
-                elif prop_type == "select":
-                    local_data[local_field] = self._extract_select(prop) or ""
-                elif prop_type == "multi_select":
-                    local_data[local_field] = ", ".join(self._extract_multi_select(prop))
-                elif prop_type == "created_time":
-                    dt = self._extract_datetime(prop)
-                    local_data[local_field] = dt.isoformat() if dt else ""
-                elif prop_type == "last_edited_time":
-                    dt = self._extract_datetime(prop)
-                    local_data[local_field] = dt.isoformat() if dt else ""
-                elif prop_type == "url":
-                    local_data[local_field] = self._extract_url(prop) or ""
-
+                local_data[local_field] = converter(prop)
             except Exception as e:
                 logger.warning(f"Failed to convert {notion_field}: {e}")
                 continue
@@ -129,42 +324,26 @@ class NotionFieldMapper:
             Notion properties format
         """
         notion_properties: Dict[str, Any] = {}
+        create_rich_text = self.notion_client.create_rich_text
 
         # Title
         if run.title:
-            notion_properties["Title"] = {
-                "title": self.notion_client.create_rich_text(run.title)
-            }
+            notion_properties["Title"] = {"title": create_rich_text(run.title)}
 
         # Rich text fields
-        for field in ["prompt", "negative", "notes"]:
-            value = getattr(run, field, None)
+        for (_, notion_field), value in zip(self._RICH_TEXT_FIELDS, self._RICH_TEXT_GETTER(run)):
             if value:
-                notion_field = self.REVERSE_MAPPING.get(field)
-                if notion_field:
-                    notion_properties[notion_field] = {
-                        "rich_text": self.notion_client.create_rich_text(value)
-                    }
+                notion_properties[notion_field] = {"rich_text": create_rich_text(value)}
 
         # Number fields
-        for field in ["cfg", "steps", "seed", "width", "height"]:
-            value = getattr(run, field, None)
+        for (_, notion_field), value in zip(self._NUMBER_FIELDS, self._NUMBER_GETTER(run)):
             if value is not None:
-                notion_field = self.REVERSE_MAPPING.get(field)
-                if notion_field:
-                    notion_properties[notion_field] = {
-                        "number": float(value)
-                    }
+                notion_properties[notion_field] = {"number": float(value)}
 
         # Select fields
-        for field in ["sampler", "status"]:
-            value = getattr(run, field, None)
+        for (_, notion_field), value in zip(self._SELECT_FIELDS, self._SELECT_GETTER(run)):
             if value:
-                notion_field = self.REVERSE_MAPPING.get(field)
-                if notion_field:
-                    notion_properties[notion_field] = {
-                        "select": {"name": value}
-                    }
+                notion_properties[notion_field] = {"select": {"name": value}}
 
         # Model name (special handling)
         if run.model:
@@ -186,7 +365,6 @@ class NotionFieldMapper:
                 "multi_select": [{"name": name} for name in tag_names]
             }
 
-
         return notion_properties
 
     def _extract_title(self, prop: Dict[str, Any]) -> str:
@@ -199,31 +377,28 @@ class NotionFieldMapper:
         rich_text_data = prop.get("rich_text", [])
         return self.notion_client.extract_text_from_rich_text(rich_text_data)
 
-    def _extract_number(self, prop: Dict[str, Any]) -> Optional[float]:
-        """Extract number from Notion property."""
-        return prop.get("number")
+    def _convert_number(self, prop: Dict[str, Any]) -> str:
+        """Convert number property to its local string form."""
+        number = prop.get("number")
+        return str(number) if number is not None else ""
 
-    def _extract_select(self, prop: Dict[str, Any]) -> Optional[str]:
-        """Extract select value from Notion property."""
+    def _convert_select(self, prop: Dict[str, Any]) -> str:
+        """Convert select property to its local string form."""
         select_data = prop.get("select")
-        return select_data.get("name") if select_data else None
+        return (select_data.get("name") or "") if select_data else ""
 
-    def _extract_multi_select(self, prop: Dict[str, Any]) -> List[str]:
-        """Extract multi-select values from Notion property."""
-        multi_select_data = prop.get("multi_select", [])
-        return [item.get("name", "") for item in multi_select_data]
+    def _convert_multi_select(self, prop: Dict[str, Any]) -> str:
+        """Convert multi-select property to a comma separated string."""
+        return ", ".join([item.get("name", "") for item in prop.get("multi_select", ())])
 
-    def _extract_datetime(self, prop: Dict[str, Any]) -> Optional[datetime]:
-        """Extract datetime from Notion property."""
+    def _convert_datetime(self, prop: Dict[str, Any]) -> str:
+        """Convert created/last edited time property to an ISO string."""
         dt_str = prop.get("created_time") or prop.get("last_edited_time")
-        if dt_str:
-            return self.notion_client.parse_datetime(dt_str)
-        return None
-
-    def _extract_url(self, prop: Dict[str, Any]) -> Optional[str]:
-        """Extract URL from Notion property."""
-        return prop.get("url")
+        return self.notion_client.parse_datetime(dt_str).isoformat() if dt_str else ""
 
+    def _convert_url(self, prop: Dict[str, Any]) -> str:
+        """Convert URL property to its local string form."""
+        return prop.get("url") or ""
 
 class NotionSyncManager:
     """
@@ -236,22 +411,127 @@ class NotionSyncManager:
     - Detailed statistics and reporting
     """
 
-    def __init__(self, notion_client: NotionClient, dry_run: bool = False):
+    def __init__(
+        self,
+        notion_client: NotionClient,
+        dry_run: bool = False,
+        incremental: bool = False
+    ):
         """
         Initialize sync manager.
 
         Args:
             notion_client: Notion API client
             dry_run: If True, no actual changes will be made
+            incremental: If True, Notion → Local and bidirectional syncs only
+                process pages and runs changed since the last successful sync
         """
         self.notion_client = notion_client
         self.dry_run = dry_run
+        self.incremental = incremental
         self.field_mapper = NotionFieldMapper(notion_client)
         self.stats = SyncStats()
         self.db_manager = DatabaseManager()
+        self._schema_loaded = False
+        # Per-session name → instance caches for models, LoRAs and tags
+        self._cache_session: Optional[Session] = None
+        self._name_caches: Dict[str, Dict[str, Any]] = {}
+        # Converted pages keyed by (page id, last_edited_time)
+        self._converted_pages: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
         logger.info(f"Notion sync manager initialized (dry_run: {dry_run})")
 
+    async def _load_field_schema(self) -> None:
+        """Compile the field mapper from the database schema (once per manager)."""
+        if self._schema_loaded:
+            return
+        self._schema_loaded = True
+
+        try:
+            database_info = await self.notion_client.get_database_info()
+            self.field_mapper.compile_schema(database_info.get("properties", {}))
+        except Exception as e:
+            # Fall back to per-page type dispatch
+            logger.debug(f"Database schema unavailable, using dynamic mapping: {e}")
+
+    def _load_checkpoint(self, direction: str, session: Session) -> Optional[datetime]:
+        """Get the start time of the last successful incremental sync, if any."""
+        if not self.incremental:
+            return None
+        state = session.get(SyncState, f"notion:{self.notion_client.database_id}:{direction}")
+        return state.last_sync_at if state else None
+
+    def _save_checkpoint(self, direction: str, started_at: datetime, session: Session) -> None:
+        """
+        Record ``started_at`` as the next checkpoint in the sync's transaction.
+
+        The checkpoint only advances when every page and run synced, so failed
+        items are retried by the next incremental sync.
+        """
+        if self.incremental and not self.dry_run and self.stats.errors == 0:
+            session.merge(SyncState(
+                name=f"notion:{self.notion_client.database_id}:{direction}",
+                last_sync_at=started_at
+            ))
+
+    def _edited_since(self, checkpoint: Optional[datetime]) -> Optional[Dict[str, Any]]:
+        """Build a Notion query filter for pages edited at or after ``checkpoint``."""
+        if checkpoint is None:
+            return None
+        return {
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": self.notion_client.format_datetime(checkpoint)}
+        }
+
+    async def _convert_pages(
+        self, pages: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Convert a batch of pages in a worker thread.
+
+        The conversion is pure Python, so running it off the event loop lets
+        in-flight Notion requests progress meanwhile. The whole batch is one
+        thread hop; a process pool would spend more pickling pages than
+        converting them.
+
+        Returns:
+            (page, local_data) pairs in the order of ``pages``
+        """
+        return await asyncio.to_thread(
+            lambda: [(page, self._convert_page(page)) for page in pages]
+        )
+
+    def _convert_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a Notion page to local format, reusing results for unchanged pages.
+
+        A page's content cannot change without its ``last_edited_time`` changing,
+        so conversions are cached by ``(id, last_edited_time)`` for the lifetime
+        of the manager. The returned dict is shared and must not be modified.
+        """
+        page_id = page.get("id")
+        edited = page.get("last_edited_time")
+        if not page_id or not edited:
+            return self.field_mapper.notion_to_local(page)
+
+        key = (page_id, edited)
+        local_data = self._converted_pages.get(key)
+        if local_data is None:
+            local_data = self.field_mapper.notion_to_local(page)
+            self._converted_pages[key] = local_data
+        return local_data
+
+    def _to_datetime(self, value: Any) -> Optional[datetime]:
+        """
+        Return a converted timestamp field as a datetime.
+
+        notion_to_local stores created/last edited times as ISO strings, so they
+        are parsed back before being compared with or written to DateTime columns.
+        """
+        if isinstance(value, str):
+            return self.notion_client.parse_datetime(value) if value else None
+        return value
+
     async def sync_from_notion(self) -> SyncStats:
         """
         Sync from Notion to local database.
@@ -263,21 +543,31 @@ class NotionSyncManager:
         self.stats = SyncStats()
 
         try:
-            # Get all pages from Notion
-            notion_pages = await self.notion_client.get_all_pages()
-            self.stats.total_notion_pages = len(notion_pages)
+            await self._load_field_schema()
+            # Stored as naive UTC like CURRENT_TIMESTAMP
+            started_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
-            # Process each page
+            # Process pages as they arrive while the next batch is fetched
             with self.db_manager.get_session() as session:
-                for page in notion_pages:
-                    try:
-                        await self._sync_page_to_local(page, session)
-                    except Exception as e:
-                        logger.error(f"Failed to sync page {page.get('id')}: {e}")
-                        self.stats.errors += 1
+                checkpoint = await asyncio.to_thread(self._load_checkpoint, "from", session)
+                batch: List[Dict[str, Any]] = []
+                async for page in self.notion_client.iter_pages(
+                    filter=self._edited_since(checkpoint)
+                ):
+                    self.stats.total_notion_pages += 1
+                    batch.append(page)
+                    if len(batch) >= SYNC_BATCH_SIZE:
+                        await self._sync_pages_to_local(batch, session)
+                        batch = []
+                        if not self.dry_run:
+                            # Write the batch while the next page is downloaded
+                            await asyncio.to_thread(session.flush)
+                if batch:
+                    await self._sync_pages_to_local(batch, session)
 
                 if not self.dry_run:
-                    session.commit()
+                    await asyncio.to_thread(self._save_checkpoint, "from", started_at, session)
+                    await asyncio.to_thread(session.commit)
                     logger.info("Local database updated")
                 else:
                     logger.info("Dry run: no changes made to local database")
@@ -301,24 +591,32 @@ class NotionSyncManager:
 
         try:
             with self.db_manager.get_session() as session:
-                # Get all local runs
-                runs = session.execute(select(Run)).scalars().all()
-                self.stats.total_local_runs = len(runs)
-
-                # Get existing Notion pages for comparison
-                notion_pages = await self.notion_client.get_all_pages()
+                # Get existing Notion pages while the local runs are loaded
+                pages_task = asyncio.ensure_future(self.notion_client.get_all_pages())
+                try:
+                    partitions = await asyncio.to_thread(
+                        lambda: iter(session.execute(
+                            _select_runs_for_sync().execution_options(
+                                yield_per=RUN_STREAM_BATCH_SIZE
+                            )
+                        ).scalars().partitions())
+                    )
+                except BaseException:
+                    pages_task.cancel()
+                    raise
+                notion_pages = await pages_task
                 notion_pages_by_id = {
                     str(page.get("id")): page for page in notion_pages
                     if page.get("id") is not None
                 }
 
-                # Process each run
-                for run in runs:
-                    try:
-                        await self._sync_run_to_notion(run, notion_pages_by_id)
-                    except Exception as e:
-                        logger.error(f"Failed to sync run {run.run_id}: {e}")
-                        self.stats.errors += 1
+                # Stream runs in batches, processing each batch concurrently
+                runs = await asyncio.to_thread(next, partitions, None)
+                while runs:
+                    self.stats.total_local_runs += len(runs)
+                    await self._sync_runs_to_notion(runs, notion_pages_by_id, session)
+                    runs = await asyncio.to_thread(next, partitions, None)
+                await asyncio.to_thread(session.commit)
 
         except Exception as e:
             logger.error(f"Sync to Notion failed: {e}")
@@ -338,43 +636,81 @@ class NotionSyncManager:
         self.stats = SyncStats()
 
         try:
-            # Get data from both sources
-            notion_pages = await self.notion_client.get_all_pages()
+            started_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
             with self.db_manager.get_session() as session:
-                runs = session.execute(select(Run)).scalars().all()
+                checkpoint = await asyncio.to_thread(self._load_checkpoint, "both", session)
+
+                # Get data from both sources, loading runs while pages download
+                pages_task = asyncio.ensure_future(
+                    self.notion_client.get_all_pages(filter=self._edited_since(checkpoint))
+                )
+                try:
+                    query = _select_runs_for_sync()
+                    if checkpoint is not None:
+                        # Changed pages whose run is not loaded here are matched by
+                        # notion_id when _save_local_runs upserts them
+                        query = query.where(
+                            or_(Run.updated_at >= checkpoint, Run.notion_id.is_(None))
+                        )
+                    runs_by_notion_id, unlinked_runs = await asyncio.to_thread(
+                        self._index_runs, session, query
+                    )
+                except BaseException:
+                    pages_task.cancel()
+                    raise
+                notion_pages = await pages_task
+                await self._load_field_schema()
 
                 # Create lookup maps
                 notion_pages_by_id = {
                     str(page.get("id")): page for page in notion_pages
                     if page.get("id") is not None
                 }
-                runs_by_notion_id = {
-                    run.notion_id: run for run in runs if run.notion_id
-                }
 
                 self.stats.total_notion_pages = len(notion_pages)
-                self.stats.total_local_runs = len(runs)
+                self.stats.total_local_runs = len(runs_by_notion_id) + len(unlinked_runs)
+
+                # Convert all pages once and load the names they reference
+                converted = await self._convert_pages(notion_pages)
+                await asyncio.to_thread(
+                    self._prefetch_lookups, [local_data for _, local_data in converted], session
+                )
+
+                existing_pages_by_id = notion_pages_by_id
+                if checkpoint is not None:
+                    # Pages not edited since the checkpoint were not fetched but
+                    # still exist, so local changes to them are pushed as updates
+                    existing_pages_by_id = {
+                        **dict.fromkeys(runs_by_notion_id, {}),
+                        **notion_pages_by_id
+                    }
 
-                # Sync Notion pages that exist locally
-                for page in notion_pages:
-                    page_id = page.get("id")
-                    if page_id in runs_by_notion_id:
+                # Single pass over the pages: matched runs are taken out of the
+                # index, so whatever remains afterwards exists only locally
+                notion_only: List[Dict[str, Any]] = []
+                for page, local_data in converted:
+                    run = runs_by_notion_id.pop(page["id"], None)
+                    if run is not None:
                         # Both exist - check for conflicts
                         await self._sync_with_conflict_resolution(
-                            page, runs_by_notion_id[page_id], session
+                            page, run, session, local_data
                         )
                     else:
-                        # Only in Notion - create locally
-                        await self._sync_page_to_local(page, session)
+                        # Only in Notion - create locally (written together below)
+                        notion_only.append(local_data)
+                await self._save_local_runs(notion_only, session)
 
                 # Sync local runs that don't exist in Notion
-                for run in runs:
-                    if not run.notion_id or run.notion_id not in notion_pages_by_id:
-                        await self._sync_run_to_notion(run, notion_pages_by_id)
+                await self._sync_runs_to_notion(
+                    unlinked_runs + list(runs_by_notion_id.values()),
+                    existing_pages_by_id,
+                    session
+                )
 
                 if not self.dry_run:
-                    session.commit()
+                    await asyncio.to_thread(self._save_checkpoint, "both", started_at, session)
+                    await asyncio.to_thread(session.commit)
                     logger.info("Bidirectional sync completed")
                 else:
                     logger.info("Dry run: no changes made")
@@ -386,40 +722,246 @@ class NotionSyncManager:
         self._log_sync_stats("Bidirectional")
         return self.stats
 
-    async def _sync_page_to_local(self, page: Dict[str, Any], session: Session) -> None:
-        """Sync a single Notion page to local database."""
+    async def _sync_pages_to_local(self, pages: List[Dict[str, Any]], session: Session) -> None:
+        """Sync a batch of Notion pages to local database."""
+        converted = await self._convert_pages(pages)
+        local_data_list = [local_data for _, local_data in converted]
+        await asyncio.to_thread(self._prefetch_lookups, local_data_list, session)
+
         try:
-            # Convert Notion page to local format
-            local_data = self.field_mapper.notion_to_local(page)
+            await self._save_local_runs(local_data_list, session)
+        except Exception as e:
+            logger.error(f"Failed to sync {len(pages)} pages to local: {e}")
+            self.stats.errors += len(pages)
 
-            # Check if run already exists by notion_id
-            notion_id = local_data.get("notion_id")
-            existing_run = None
+    async def _sync_page_to_local(
+        self,
+        page: Dict[str, Any],
+        session: Session,
+        local_data: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Sync a single Notion page to local database."""
+        if local_data is None:
+            local_data = self._convert_page(page)
+        await self._save_local_runs([local_data], session)
 
-            if notion_id:
-                existing_run = session.execute(
-                    select(Run).where(Run.notion_id == notion_id)
-                ).scalar_one_or_none()
+    async def _save_local_runs(self, local_data_list: List[Dict[str, Any]], session: Session) -> None:
+        """
+        Create or update the local runs for converted Notion pages.
 
-            if existing_run:
-                # Update existing run
-                await self._update_local_run(existing_run, local_data, session)
-                self.stats.updated_local += 1
-            else:
-                # Create new run
-                await self._create_local_run(local_data, session)
-                self.stats.created_local += 1
+        Runs are written with one ``INSERT ... ON CONFLICT (notion_id) DO UPDATE``
+        per batch (upsert_runs) and their LoRA/tag links with bulk inserts, instead
+        of a SELECT and ORM insert per page. Existing runs only get the fields
+        present in the page data, and links that are still wanted are left in
+        place, so LoRA weights set locally survive. The writes of a batch share a
+        savepoint, so a failing batch does not undo earlier ones.
 
-        except Exception as e:
-            logger.error(f"Failed to sync page to local: {e}")
-            raise
+        The database work runs in a worker thread so in-flight Notion requests
+        keep progressing meanwhile.
+        """
+        if not local_data_list:
+            return
+
+        is_new = await asyncio.to_thread(self._write_local_runs, local_data_list, session)
+
+        created = sum(is_new)
+        self.stats.created_local += created
+        self.stats.updated_local += len(local_data_list) - created
+
+    def _write_local_runs(
+        self, local_data_list: List[Dict[str, Any]], session: Session
+    ) -> List[bool]:
+        """
+        Write the runs and links for ``_save_local_runs`` (nothing in dry-run mode).
+
+        Returns:
+            Whether each entry of ``local_data_list`` is a new run
+        """
+        # Title and prompt of the linked runs. SQLite checks NOT NULL before
+        # resolving the conflict, so upsert rows must carry them even when the
+        # page does not; the lookup also gives the created/updated counts.
+        notion_ids = sorted({
+            local_data["notion_id"] for local_data in local_data_list if local_data.get("notion_id")
+        })
+        existing: Dict[Optional[str], Tuple[str, str]] = {}
+        for start in range(0, len(notion_ids), PREFETCH_CHUNK_SIZE):
+            chunk = notion_ids[start:start + PREFETCH_CHUNK_SIZE]
+            for notion_id, title, prompt in session.execute(
+                select(Run.notion_id, Run.title, Run.prompt).where(Run.notion_id.in_(chunk))
+            ):
+                existing[notion_id] = (title, prompt)
+        current = [existing.get(local_data.get("notion_id") or "") for local_data in local_data_list]
+        is_new = [values is None for values in current]
+
+        if not self.dry_run:
+            # Resolve names first; new models, LoRAs and tags get ids on flush
+            models: List[Optional[Model]] = []
+            loras: Dict[int, List[Model]] = {}
+            tags: Dict[int, List[Tag]] = {}
+            for index, local_data in enumerate(local_data_list):
+                models.append(self._get_or_create_model(local_data.get("model_name"), session))
+                if "lora_names" in local_data:
+                    loras[index] = [
+                        self._get_or_create_lora(name, session)
+                        for name in _split_names(local_data["lora_names"])
+                    ]
+                if "tag_names" in local_data:
+                    tags[index] = [
+                        self._get_or_create_tag(name, session)
+                        for name in _split_names(local_data["tag_names"])
+                    ]
+
+            with session.begin_nested():
+                session.flush()
+                run_ids = self._upsert_run_rows(session, [
+                    self._run_row(local_data, model, values)
+                    for local_data, model, values in zip(local_data_list, models, current)
+                ])
+                updated_ids = {run_id for run_id, new in zip(run_ids, is_new) if not new}
+                self._sync_links(
+                    session, run_loras_table, "lora_id", updated_ids,
+                    {run_ids[index]: [lora.model_id for lora in items] for index, items in loras.items()},
+                )
+                self._sync_links(
+                    session, run_tags_table, "tag_id", updated_ids,
+                    {run_ids[index]: [tag.tag_id for tag in items] for index, items in tags.items()},
+                )
+
+        return is_new
+
+    def _run_row(
+        self,
+        local_data: Dict[str, Any],
+        model: Optional[Model],
+        current: Optional[Tuple[str, str]],
+    ) -> Dict[str, Any]:
+        """
+        Build the runs row written by upsert_runs from converted page data.
+
+        ``current`` is the (title, prompt) of the linked run, or None for a new run.
+        """
+        row: Dict[str, Any] = {"notion_id": local_data.get("notion_id") or None}
+        for column in _RUN_TEXT_COLUMNS:
+            if column in local_data:
+                row[column] = local_data[column]
+        # Empty selects are skipped so the column defaults apply
+        for column in _RUN_CHOICE_COLUMNS:
+            if local_data.get(column):
+                row[column] = local_data[column]
+        # Numbers arrive as strings ("" when the property is empty)
+        for column, cast in _RUN_NUMBER_COLUMNS:
+            value = local_data.get(column)
+            if value not in (None, ""):
+                row[column] = cast(float(value))
+        if model is not None:
+            row["model_id"] = model.model_id
+
+        updated_at = self._to_datetime(local_data.get("updated_at"))
+        if updated_at:
+            row["updated_at"] = updated_at
+        if current is not None:
+            row.setdefault("title", current[0])
+            row.setdefault("prompt", current[1])
+        else:
+            row.setdefault("title", "")
+            row.setdefault("prompt", "")
+            created_at = self._to_datetime(local_data.get("created_at"))
+            if created_at:
+                row["created_at"] = created_at
+        return row
+
+    @staticmethod
+    def _upsert_run_rows(session: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        Upsert runs rows, returning their run_ids in the order of ``rows``.
+
+        upsert_runs needs every row of a statement to have the same keys, so rows
+        are grouped by the columns they set.
+        """
+        groups: Dict[Tuple[str, ...], List[int]] = {}
+        for index, row in enumerate(rows):
+            groups.setdefault(tuple(row), []).append(index)
+
+        run_ids = [0] * len(rows)
+        for indexes in groups.values():
+            group_ids = upsert_runs(session, [rows[index] for index in indexes])
+            for index, run_id in zip(indexes, group_ids):
+                run_ids[index] = run_id
+        return run_ids
+
+    @staticmethod
+    def _sync_links(
+        session: Session,
+        table: Table,
+        column: str,
+        updated_ids: Set[int],
+        links: Dict[int, List[int]],
+    ) -> None:
+        """
+        Make the LoRA/tag links of the given runs match ``links``.
+
+        Links of updated runs that are no longer wanted are deleted in one
+        statement; wanted links are inserted with ``OR IGNORE``, so existing
+        rows (and their weights) are kept.
+        """
+        stale_runs = [run_id for run_id in links if run_id in updated_ids]
+        wanted = [(run_id, target_id) for run_id, ids in links.items() for target_id in ids]
+
+        if stale_runs:
+            stmt = delete(table).where(table.c.run_id.in_(stale_runs))
+            if wanted:
+                stmt = stmt.where(tuple_(table.c.run_id, table.c[column]).not_in(wanted))
+            session.execute(stmt)
+
+        rows = [{"run_id": run_id, column: target_id} for run_id, target_id in wanted]
+        if table is run_loras_table:
+            bulk_insert_run_loras(session, [{**row, "weight": 1.0} for row in rows])
+        else:
+            bulk_insert_run_tags(session, rows)
+
+    async def _sync_runs_to_notion(
+        self,
+        runs: Sequence[Run],
+        notion_pages_by_id: Dict[str, Dict[str, Any]],
+        session: Session
+    ) -> None:
+        """
+        Sync local runs to Notion with bounded concurrency.
+
+        IDs of newly created Notion pages are written back to ``session`` in a
+        single executemany UPDATE; committing is left to the caller.
+        """
+        semaphore = asyncio.Semaphore(NOTION_SYNC_CONCURRENCY)
+        created_pages: List[Dict[str, Any]] = []
+
+        async def sync_run(run: Run) -> None:
+            async with semaphore:
+                try:
+                    created = await self._sync_run_to_notion(run, notion_pages_by_id)
+                except Exception as e:
+                    logger.error(f"Failed to sync run {run.run_id}: {e}")
+                    self.stats.errors += 1
+                else:
+                    if created:
+                        created_pages.append(created)
+
+        await asyncio.gather(*(sync_run(run) for run in runs))
+
+        if created_pages:
+            await asyncio.to_thread(session.execute, update(Run), created_pages)
 
     async def _sync_run_to_notion(
         self,
         run: Run,
         notion_pages_by_id: Dict[str, Dict[str, Any]]
-    ) -> None:
-        """Sync a single local run to Notion."""
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Sync a single local run to Notion.
+
+        Returns:
+            ``run_id``/``notion_id``/``notion_url`` to store locally when a
+            Notion page was created, otherwise None
+        """
         try:
             # Convert local run to Notion format
             notion_properties = self.field_mapper.local_to_notion(run)
@@ -429,18 +971,19 @@ class NotionSyncManager:
                 if not self.dry_run:
                     await self.notion_client.update_page(run.notion_id, notion_properties)
                 self.stats.updated_notion += 1
-            else:
-                # Create new Notion page
-                if not self.dry_run:
-                    response = await self.notion_client.create_page(notion_properties)
-                    # Update local run with Notion ID
-                    with self.db_manager.get_session() as session:
-                        local_run = session.get(Run, run.run_id)
-                        if local_run:
-                            local_run.notion_id = response.get("id")
-                            local_run.notion_url = response.get("url")
-                            session.commit()
-                self.stats.created_notion += 1
+                return None
+
+            # Create new Notion page
+            created = None
+            if not self.dry_run:
+                response = await self.notion_client.create_page(notion_properties)
+                created = {
+                    "run_id": run.run_id,
+                    "notion_id": response.get("id"),
+                    "notion_url": response.get("url"),
+                }
+            self.stats.created_notion += 1
+            return created
 
         except Exception as e:
             logger.error(f"Failed to sync run to Notion: {e}")
@@ -450,24 +993,27 @@ class NotionSyncManager:
         self,
         page: Dict[str, Any],
         run: Run,
-        session: Session
+        session: Session,
+        local_data: Optional[Dict[str, Any]] = None
     ) -> None:
         """Handle sync with conflict resolution."""
         try:
             # Convert Notion page to local format
-            local_data = self.field_mapper.notion_to_local(page)
+            if local_data is None:
+                local_data = self._convert_page(page)
 
             # Check for conflicts (last modified time)
-            notion_modified = local_data.get("updated_at")
+            notion_modified = self._to_datetime(local_data.get("updated_at"))
             local_modified = run.updated_at
 
             if notion_modified and local_modified:
                 # Compare modification times
-                if notion_modified > local_modified:
+                delta = _modified_delta(notion_modified, local_modified)
+                if delta > 0:
                     # Notion is newer - update local
                     await self._update_local_run(run, local_data, session)
                     self.stats.updated_local += 1
-                elif local_modified > notion_modified:
+                elif delta < 0:
                     # Local is newer - update Notion
                     notion_properties = self.field_mapper.local_to_notion(run)
                     if not self.dry_run and run.notion_id:
@@ -485,68 +1031,25 @@ class NotionSyncManager:
             logger.error(f"Failed to resolve conflict: {e}")
             raise
 
-    async def _create_local_run(self, local_data: Dict[str, Any], session: Session) -> None:
-        """Create a new local run from Notion data."""
-        if self.dry_run:
-            return
-
-        try:
-            # Create or get model
-            model_name = local_data.get("model_name")
-            model = await self._get_or_create_model(model_name, session) if model_name else None
-
-            # Create run
-            run = Run(
-                title=local_data.get("title", ""),
-                prompt=local_data.get("prompt", ""),
-                negative=local_data.get("negative", ""),
-                cfg=local_data.get("cfg"),
-                steps=local_data.get("steps"),
-                sampler=local_data.get("sampler"),
-                seed=local_data.get("seed"),
-                width=local_data.get("width"),
-                height=local_data.get("height"),
-                model=model,
-                status=local_data.get("status", "pending"),
-                notes=local_data.get("notes"),
-                notion_id=local_data.get("notion_id"),
-                notion_url=local_data.get("notion_url"),
-                created_at=local_data.get("created_at") or datetime.now(timezone.utc),
-                updated_at=local_data.get("updated_at") or datetime.now(timezone.utc)
-            )
-
-            session.add(run)
-
-            # Handle LoRAs
-            lora_names = local_data.get("lora_names", [])
-            for lora_name in lora_names:
-                lora_model = await self._get_or_create_lora(lora_name, session)
-                run_lora = RunLora(run=run, lora_model=lora_model, weight=1.0)
-                run.loras.append(run_lora)
-
-            # Handle Tags
-            tag_names = local_data.get("tag_names", [])
-            for tag_name in tag_names:
-                tag = await self._get_or_create_tag(tag_name, session)
-                run_tag = RunTag(run=run, tag=tag)
-                run.tags.append(run_tag)
-
-            logger.debug(f"Created local run: {run.title}")
-
-        except Exception as e:
-            logger.error(f"Failed to create local run: {e}")
-            raise
-
     async def _update_local_run(
         self,
         run: Run,
         local_data: Dict[str, Any],
         session: Session
     ) -> None:
-        """Update an existing local run with Notion data."""
+        """Update an existing local run with Notion data (in a worker thread)."""
         if self.dry_run:
             return
 
+        await asyncio.to_thread(self._apply_local_update, run, local_data, session)
+
+    def _apply_local_update(
+        self,
+        run: Run,
+        local_data: Dict[str, Any],
+        session: Session
+    ) -> None:
+        """Copy converted page data onto ``run``, loading its links as needed."""
         try:
             # Update basic fields
             for field in ["title", "prompt", "negative", "cfg", "steps",
@@ -559,28 +1062,35 @@ class NotionSyncManager:
             if "model_name" in local_data:
                 model_name = local_data["model_name"]
                 if model_name:
-                    model = await self._get_or_create_model(model_name, session)
+                    model = self._get_or_create_model(model_name, session)
                     run.model = model
 
             # Update timestamps
-            if "updated_at" in local_data:
-                run.updated_at = local_data["updated_at"]
+            updated_at = self._to_datetime(local_data.get("updated_at"))
+            if updated_at:
+                run.updated_at = updated_at
 
-            # Update LoRAs
+            # Update LoRAs (only the difference, so unchanged rows are left alone)
             if "lora_names" in local_data:
-                run.loras.clear()
-                for lora_name in local_data["lora_names"]:
-                    lora_model = await self._get_or_create_lora(lora_name, session)
-                    run_lora = RunLora(run=run, lora_model=lora_model, weight=1.0)
-                    run.loras.append(run_lora)
+                existing_loras = {rl.lora_model.name: rl for rl in run.loras}
+                desired_loras = dict.fromkeys(_split_names(local_data["lora_names"]))
+                for lora_name in existing_loras.keys() - desired_loras.keys():
+                    run.loras.remove(existing_loras[lora_name])
+                for lora_name in desired_loras:
+                    if lora_name not in existing_loras:
+                        lora_model = self._get_or_create_lora(lora_name, session)
+                        run.loras.append(RunLora(lora_model=lora_model, weight=1.0))
 
             # Update Tags
             if "tag_names" in local_data:
-                run.tags.clear()
-                for tag_name in local_data["tag_names"]:
-                    tag = await self._get_or_create_tag(tag_name, session)
-                    run_tag = RunTag(run=run, tag=tag)
-                    run.tags.append(run_tag)
+                existing_tags = {rt.tag.name: rt for rt in run.tags}
+                desired_tags = dict.fromkeys(_split_names(local_data["tag_names"]))
+                for tag_name in existing_tags.keys() - desired_tags.keys():
+                    run.tags.remove(existing_tags[tag_name])
+                for tag_name in desired_tags:
+                    if tag_name not in existing_tags:
+                        tag = self._get_or_create_tag(tag_name, session)
+                        run.tags.append(RunTag(tag=tag))
 
             logger.debug(f"Updated local run: {run.title}")
 
@@ -588,11 +1098,60 @@ class NotionSyncManager:
             logger.error(f"Failed to update local run: {e}")
             raise
 
-    async def _get_or_create_model(self, model_name: Optional[str], session: Session) -> Optional[Model]:
+    def _name_cache(self, kind: str, session: Session) -> Dict[str, Any]:
+        """
+        Get the name → instance cache for ``kind``.
+
+        Popular models and tags appear on most pages, so lookups are cached for
+        the lifetime of the session instead of issuing a SELECT per page.
+        The caches are dropped whenever a different session is passed.
+        """
+        if session is not self._cache_session:
+            self._cache_session = session
+            self._name_caches = {}
+        return self._name_caches.setdefault(kind, {})
+
+    def _prefetch_lookups(self, local_data_list: List[Dict[str, Any]], session: Session) -> None:
+        """
+        Load the models, LoRAs and tags referenced by converted pages in bulk.
+
+        Names not yet cached are fetched with one ``IN`` query per kind (chunked),
+        so the per-page ``_get_or_create_*`` calls only hit the cache. Names that
+        do not exist are left to ``_get_or_create_*``, whose new instances are
+        inserted together when the session flushes.
+        """
+        model_names: Set[str] = set()
+        lora_names: Set[str] = set()
+        tag_names: Set[str] = set()
+        for local_data in local_data_list:
+            if local_data.get("model_name"):
+                model_names.add(local_data["model_name"])
+            lora_names.update(_split_names(local_data.get("lora_names")))
+            tag_names.update(_split_names(local_data.get("tag_names")))
+
+        lookups = (
+            ("model", model_names, Model, select(Model)),
+            ("lora", lora_names, Model, select(Model).where(Model.type == "lora")),
+            ("tag", tag_names, Tag, select(Tag)),
+        )
+        for kind, names, entity, query in lookups:
+            cache = self._name_cache(kind, session)
+            missing = sorted(names - cache.keys())
+            for start in range(0, len(missing), PREFETCH_CHUNK_SIZE):
+                chunk = missing[start:start + PREFETCH_CHUNK_SIZE]
+                for instance in session.execute(query.where(entity.name.in_(chunk))).scalars():
+                    cache.setdefault(instance.name, instance)
+
+    def _get_or_create_model(self, model_name: Optional[str], session: Session) -> Optional[Model]:
         """Get or create a model by name."""
         if not model_name:
             return None
 
+        cache = self._name_cache("model", session)
+        model = cache.get(model_name)
+        if model is not None:
+            return model
+
         model = session.execute(
             select(Model).where(Model.name == model_name)
         ).scalar_one_or_none()
@@ -602,10 +1161,16 @@ class NotionSyncManager:
             session.add(model)
             logger.debug(f"Created model: {model_name}")
 
+        cache[model_name] = model
         return model
 
-    async def _get_or_create_lora(self, lora_name: str, session: Session) -> Model:
+    def _get_or_create_lora(self, lora_name: str, session: Session) -> Model:
         """Get or create a LoRA model by name."""
+        cache = self._name_cache("lora", session)
+        lora = cache.get(lora_name)
+        if lora is not None:
+            return lora
+
         lora = session.execute(
             select(Model).where(Model.name == lora_name).where(Model.type == "lora")
         ).scalar_one_or_none()
@@ -615,10 +1180,16 @@ class NotionSyncManager:
             session.add(lora)
             logger.debug(f"Created LoRA: {lora_name}")
 
+        cache[lora_name] = lora
         return lora
 
-    async def _get_or_create_tag(self, tag_name: str, session: Session) -> Tag:
+    def _get_or_create_tag(self, tag_name: str, session: Session) -> Tag:
         """Get or create a tag by name."""
+        cache = self._name_cache("tag", session)
+        tag = cache.get(tag_name)
+        if tag is not None:
+            return tag
+
         tag = session.execute(
             select(Tag).where(Tag.name == tag_name)
         ).scalar_one_or_none()
@@ -628,6 +1199,7 @@ class NotionSyncManager:
             session.add(tag)
             logger.debug(f"Created tag: {tag_name}")
 
+        cache[tag_name] = tag
         return tag
 
     def _log_sync_stats(self, sync_type: str) -> None:
@@ -643,6 +1215,78 @@ class NotionSyncManager:
         logger.info(f"Conflicts: {self.stats.conflicts}")
         logger.info(f"Errors: {self.stats.errors}")
 
+    @staticmethod
+    def _index_runs(session: Session, query: Select[Run]) -> Tuple[Dict[str, Run], List[Run]]:
+        """
+        Stream the runs selected by ``query`` into lookup structures.
+
+        Rows are fetched in batches of RUN_STREAM_BATCH_SIZE and indexed in a
+        single pass, without materializing an intermediate list of all runs.
+
+        Returns:
+            Runs keyed by notion_id, and runs not linked to a Notion page
+        """
+        runs_by_notion_id: Dict[str, Run] = {}
+        unlinked_runs: List[Run] = []
+        result = session.execute(query.execution_options(yield_per=RUN_STREAM_BATCH_SIZE))
+        for run in result.scalars():
+            if run.notion_id:
+                runs_by_notion_id[run.notion_id] = run
+            else:
+                unlinked_runs.append(run)
+        return runs_by_notion_id, unlinked_runs
+
+    def _find_modified_runs(
+        self,
+        pages: List[Dict[str, Any]],
+        checkpoint: Optional[datetime],
+        session: Session,
+    ) -> List[Run]:
+        """
+        Return runs linked to the given pages whose updated_at differs.
+
+        The pages' last_edited_time values are staged in a temporary table so
+        the comparison happens in a single join. Pages without a usable
+        last_edited_time always match their run.
+        """
+        staged: Dict[str, Optional[datetime]] = {}
+        for page in pages:
+            page_id = page.get("id")
+            if not page_id:
+                continue
+            edited = page.get("last_edited_time")
+            edited_at = self.notion_client.parse_datetime(edited) if edited else None
+            if edited_at is not None and edited_at.tzinfo is not None:
+                edited_at = edited_at.astimezone(timezone.utc).replace(tzinfo=None)
+            staged[page_id] = edited_at
+
+        if not staged:
+            return []
+
+        stage = _NOTION_SYNC_STAGE
+        stage.create(session.connection(), checkfirst=True)
+        session.execute(delete(stage))
+        session.execute(
+            insert(stage),
+            [{"notion_id": k, "updated_at": v} for k, v in staged.items()],
+        )
+
+        # datetime() normalizes the stored text formats to whole seconds
+        query = (
+            select(Run)
+            .join(stage, Run.notion_id == stage.c.notion_id)
+            .where(
+                or_(
+                    stage.c.updated_at.is_(None),
+                    Run.updated_at.is_(None),
+                    func.datetime(Run.updated_at) != func.datetime(stage.c.updated_at),
+                )
+            )
+        )
+        if checkpoint is not None:
+            query = query.where(Run.updated_at >= checkpoint)
+        return list(session.execute(query).scalars().all())
+
     async def detect_conflicts(self) -> List[Dict[str, Any]]:
         """
         Detect conflicts between Notion and local data.
@@ -653,40 +1297,45 @@ class NotionSyncManager:
         conflicts = []
 
         try:
-            # Get data from both sources
-            notion_pages = await self.notion_client.get_all_pages()
-
             with self.db_manager.get_session() as session:
-                runs = session.execute(select(Run)).scalars().all()
-
-                # Create lookup maps
-                runs_by_notion_id = {
-                    run.notion_id: run for run in runs if run.notion_id
-                }
+                checkpoint = await asyncio.to_thread(self._load_checkpoint, "both", session)
+
+                # Get data from both sources
+                notion_pages = await self.notion_client.get_all_pages(
+                    filter=self._edited_since(checkpoint)
+                )
+                await self._load_field_schema()
+
+                # Only runs whose timestamp differs from their page come back
+                pages_by_id = {page.get("id"): page for page in notion_pages}
+                runs = await asyncio.to_thread(
+                    self._find_modified_runs, notion_pages, checkpoint, session
+                )
+
+                # Convert the matching Notion pages to local format
+                matched_runs = [run for run in runs if run.notion_id in pages_by_id]
+                converted = await self._convert_pages(
+                    [pages_by_id[run.notion_id] for run in matched_runs]
+                )
 
                 # Check for conflicts
-                for page in notion_pages:
-                    page_id = page.get("id")
-                    if page_id in runs_by_notion_id:
-                        run = runs_by_notion_id[page_id]
-
-                        # Convert Notion page to local format
-                        local_data = self.field_mapper.notion_to_local(page)
-
-                        # Check for conflicts
-                        notion_modified = local_data.get("updated_at")
-                        local_modified = run.updated_at
-
-                        if notion_modified and local_modified and notion_modified != local_modified:
-                            conflicts.append({
-                                "run_id": run.run_id,
-                                "notion_id": page_id,
-                                "notion_title": local_data.get("title", ""),
-                                "local_title": run.title,
-                                "notion_modified": notion_modified,
-                                "local_modified": local_modified,
-                                "conflict_type": "modification_time"
-                            })
+                for run, (page, local_data) in zip(matched_runs, converted):
+                    notion_modified = self._to_datetime(local_data.get("updated_at"))
+                    local_modified = run.updated_at
+
+                    if (
+                        notion_modified and local_modified
+                        and _modified_delta(notion_modified, local_modified)
+                    ):
+                        conflicts.append({
+                            "run_id": run.run_id,
+                            "notion_id": page.get("id"),
+                            "notion_title": local_data.get("title", ""),
+                            "local_title": run.title,
+                            "notion_modified": notion_modified,
+                            "local_modified": local_modified,
+                            "conflict_type": "modification_time"
+                        })
 
         except Exception as e:
             logger.error(f"Failed to detect conflicts: {e}")
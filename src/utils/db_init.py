@@ -3,15 +3,63 @@
 このモジュールはデータベースの初期化とセットアップ機能を提供します。
 """
 
+import atexit
 import os
+import sqlite3
+import time
+from contextlib import contextmanager, suppress
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy import bindparam, create_engine, event, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.types import TypeDecorator
 
-from src.models.database import Base
+from src.models.database import Base, CompactUUID, HexDigest
+
+# データベースファイルに永続化されるPRAGMA設定（エンジンの最初の接続で一度だけ適用する）
+SQLITE_PERSISTENT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",  # 読み取りと書き込みを並行可能にする
+)
+
+# 接続ごとに適用するSQLiteのPRAGMA設定
+# PRAGMAは接続単位の設定のため、プールが新しい接続を開くたびに適用する必要がある
+SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",  # WALモードではNORMALでも整合性が保たれる
+    "PRAGMA busy_timeout=5000",  # 書き込みロック中は即エラーにせず最大5秒待つ
+    "PRAGMA temp_store=MEMORY",
+)
+
+# メモリマップとページキャッシュの既定値（環境変数で上書き可能）
+DEFAULT_SQLITE_MMAP_SIZE = 268435456  # 256MB（0でmmapを無効化）
+DEFAULT_SQLITE_CACHE_KIB = 65536  # 64MB
+
+# 一括INSERT時に1文のVALUESにまとめる最大行数
+INSERTMANYVALUES_PAGE_SIZE = 1000
+
+# コネクションプールの設定（Notion同期とエクスポートなど並行する読み取り用）
+# SQLiteはローカルファイルのため、切断検知用のpool_pre_pingやpool_recycleは設定しない
+POOL_SIZE = 10
+POOL_MAX_OVERFLOW = 20
+POOL_TIMEOUT = 30  # 秒
+
+# 接続ごとに PRAGMA optimize を実行する最短間隔（秒）
+OPTIMIZE_INTERVAL_SECONDS = 15 * 60
+
+# 読み取り専用エンジンのプールサイズ（WALでは読み取りは書き込みと並行して実行できる）
+READ_POOL_SIZE = 8
+
+# インメモリデータベースを表すパス
+MEMORY_DATABASE_PATH = ":memory:"
+
+
+class DatabaseInitError(RuntimeError):
+    """データベース初期化エラー."""
+    pass
 
 
 def get_database_path() -> str:
@@ -46,6 +94,113 @@ def create_database_directory(db_path: str) -> None:
         Path(db_dir).mkdir(parents=True, exist_ok=True)
 
 
+def _execute_pragmas(dbapi_connection: Any, pragmas: Tuple[str, ...]) -> None:
+    """DBAPI接続でPRAGMAをまとめて実行します."""
+    dbapi_connection.executescript(";".join(pragmas))
+
+
+def apply_persistent_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """データベースファイルに永続化されるPRAGMA設定を適用します.
+
+    SQLAlchemyの ``first_connect`` イベントリスナーとして登録され、
+    エンジンごとに最初の接続でのみ実行されます。
+
+    Args:
+        dbapi_connection: sqlite3の接続オブジェクト
+        connection_record: コネクションプールのレコード
+    """
+    _execute_pragmas(dbapi_connection, SQLITE_PERSISTENT_PRAGMAS)
+
+
+def _get_int_env(name: str, default: int) -> int:
+    """整数値の環境変数を取得します.
+
+    Args:
+        name: 環境変数名
+        default: 未設定時の値
+
+    Returns:
+        環境変数の値
+
+    Raises:
+        ValueError: 値が整数でない場合
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer: {value!r}") from None
+
+
+def get_sqlite_pragmas() -> Tuple[str, ...]:
+    """接続ごとに適用するPRAGMAの一覧を返します.
+
+    mmapサイズとキャッシュサイズは環境変数 ``SQLITE_MMAP_SIZE`` （バイト）と
+    ``SQLITE_CACHE_KIB`` （KiB）で上書きできます。
+
+    Returns:
+        実行するPRAGMA文のタプル
+
+    Raises:
+        ValueError: 環境変数の値が整数でない場合
+    """
+    mmap_size = _get_int_env("SQLITE_MMAP_SIZE", DEFAULT_SQLITE_MMAP_SIZE)
+    cache_kib = _get_int_env("SQLITE_CACHE_KIB", DEFAULT_SQLITE_CACHE_KIB)
+    return SQLITE_PRAGMAS + (
+        f"PRAGMA mmap_size={mmap_size}",
+        f"PRAGMA cache_size={-cache_kib}",  # 負値はKiB単位
+    )
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """新しいDBAPI接続にSQLiteのPRAGMA設定を適用します.
+
+    SQLAlchemyの ``connect`` イベントリスナーとして登録されます。
+
+    Args:
+        dbapi_connection: sqlite3の接続オブジェクト
+        connection_record: コネクションプールのレコード
+    """
+    _execute_pragmas(dbapi_connection, get_sqlite_pragmas())
+
+
+def optimize_on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+    """プールに返却された接続で定期的に ``PRAGMA optimize`` を実行します.
+
+    SQLAlchemyの ``checkin`` イベントリスナーとして登録されます。
+    接続ごとに最初の返却時刻を記録し、``OPTIMIZE_INTERVAL_SECONDS`` 以上
+    経過していればクエリプランナーの統計を更新します。
+
+    Args:
+        dbapi_connection: sqlite3の接続オブジェクト（無効化された場合はNone）
+        connection_record: コネクションプールのレコード
+    """
+    if dbapi_connection is None:
+        return
+
+    now = time.monotonic()
+    last_optimized = connection_record.info.setdefault("last_optimized", now)
+    if now - last_optimized < OPTIMIZE_INTERVAL_SECONDS:
+        return
+
+    connection_record.info["last_optimized"] = now
+    # 統計の更新は最適化のためだけなので、ロック待ちなどの失敗は無視する
+    with suppress(sqlite3.Error):
+        dbapi_connection.execute("PRAGMA optimize")
+
+
+def optimize_database(engine: Engine) -> None:
+    """クエリプランナーの統計を更新します（``PRAGMA optimize``）.
+
+    Args:
+        engine: SQLAlchemy Engine インスタンス（書き込み可能なもの）
+    """
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA optimize"))
+
+
 def create_engine_for_database(db_path: Optional[str] = None) -> Engine:
     """SQLAlchemyエンジンを作成します.
 
@@ -61,8 +216,20 @@ def create_engine_for_database(db_path: Optional[str] = None) -> Engine:
     if db_path is None:
         db_path = get_database_path()
 
-    # データベースディレクトリを作成
-    create_database_directory(db_path)
+    if db_path == MEMORY_DATABASE_PATH:
+        # インメモリDBは接続ごとに別のDBになるため、単一の接続を共有する
+        # （journal_mode=WALは無視され "memory" のままになる）
+        pool_options: Dict[str, Any] = {"poolclass": StaticPool}
+    else:
+        # データベースディレクトリを作成
+        create_database_directory(db_path)
+        # 接続（とSQLiteのページキャッシュ）をセッションをまたいで再利用する
+        pool_options = {
+            "poolclass": QueuePool,
+            "pool_size": POOL_SIZE,
+            "max_overflow": POOL_MAX_OVERFLOW,
+            "pool_timeout": POOL_TIMEOUT,
+        }
 
     # SQLite接続文字列を作成
     database_url = f"sqlite:///{db_path}"
@@ -71,59 +238,384 @@ def create_engine_for_database(db_path: Optional[str] = None) -> Engine:
     engine = create_engine(
         database_url,
         echo=False,  # SQLログを無効化（本番環境用）
-        connect_args={"check_same_thread": False}  # SQLiteのスレッド制限を無効化
+        connect_args={"check_same_thread": False},  # SQLiteのスレッド制限を無効化
+        insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,
+        **pool_options,
     )
 
-    # 外部キー制約を有効化
-    with engine.connect() as conn:
-        conn.execute(text("PRAGMA foreign_keys=ON"))
-        conn.commit()
+    # WALはファイルに記録されるため最初の接続でのみ切り替え、
+    # 外部キー制約などの接続単位のPRAGMAは接続ごとに有効化
+    event.listen(engine, "first_connect", apply_persistent_pragmas)
+    event.listen(engine, "connect", apply_sqlite_pragmas)
+    event.listen(engine, "checkin", optimize_on_checkin)
 
     return engine
 
 
-def create_tables(engine: Engine) -> None:
-    """データベーステーブルを作成します.
+def apply_read_only_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """読み取り専用のDBAPI接続にPRAGMA設定を適用します.
+
+    通常の接続単位のPRAGMAに加えて ``query_only`` を有効にします。
+
+    Args:
+        dbapi_connection: sqlite3の接続オブジェクト
+        connection_record: コネクションプールのレコード
+    """
+    _execute_pragmas(dbapi_connection, get_sqlite_pragmas() + ("PRAGMA query_only=1",))
+
+
+def create_read_engine_for_database(db_path: str) -> Engine:
+    """読み取り専用のSQLAlchemyエンジンを作成します.
+
+    データベースファイルを ``mode=ro`` で開くため、書き込みは常に失敗します。
+    WALモードでは書き込み中のトランザクションを待たずに読み取れるため、
+    参照系の処理をこのエンジンに分けることで書き込みと競合しなくなります。
+    データベースは事前に ``initialize_database`` で作成しておく必要があります。
+
+    Args:
+        db_path: データベースファイルのパス
+
+    Returns:
+        読み取り専用のSQLAlchemy Engine インスタンス
+    """
+    database_uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+
+    def connect() -> sqlite3.Connection:
+        return sqlite3.connect(database_uri, uri=True, check_same_thread=False)
+
+    engine = create_engine(
+        "sqlite://",
+        creator=connect,
+        echo=False,
+        poolclass=QueuePool,
+        pool_size=READ_POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+    )
+    event.listen(engine, "connect", apply_read_only_pragmas)
+
+    return engine
+
+
+def checkpoint_database(engine: Engine) -> None:
+    """WALファイルの内容をデータベースファイル本体に書き戻します.
+
+    WALモードでは未チェックポイントの変更が ``-wal`` ファイルに残るため、
+    データベースファイルを直接コピーする前に呼び出してください。
 
     Args:
         engine: SQLAlchemy Engine インスタンス
     """
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+
+
+@contextmanager
+def _schema_connection(engine: Union[Engine, Connection]) -> Iterator[Connection]:
+    """スキーマ操作に使う接続を返します.
+
+    Engineの場合は新しい接続でトランザクションを開始してコミットし、
+    Connectionの場合は呼び出し側のトランザクションをそのまま使います。
+    """
+    if isinstance(engine, Connection):
+        yield engine
+        return
+    with engine.begin() as conn:
+        yield conn
+
+
+def create_tables(engine: Union[Engine, Connection]) -> None:
+    """データベーステーブルを作成します.
+
+    Args:
+        engine: SQLAlchemy Engine または Connection インスタンス
+    """
     # SQLAlchemyモデルからテーブルを作成
     Base.metadata.create_all(engine)
 
 
-def create_indexes(engine: Engine) -> None:
+def _convert_text_values(
+    conn: Connection, table: str, column: str, column_type: TypeDecorator[Any]
+) -> None:
+    """TEXTで格納されている既存の値をカラム型のバイナリ表現に変換します.
+
+    バイナリ型の導入前に作成されたデータベースでは値がTEXTのまま残っており、
+    バイナリで比較する ``==`` 検索に一致しなくなるため、格納形式を揃えます。
+    カラム型が変換できない値はTEXTのまま残します。
+
+    Args:
+        conn: SQLAlchemy Connection インスタンス
+        table: テーブル名
+        column: カラム名
+        column_type: カラムの型（``process_bind_param`` で変換する）
+    """
+    rows = conn.execute(
+        text(f"SELECT rowid, {column} FROM {table} WHERE typeof({column}) = 'text'")
+    ).all()
+    params = []
+    for row_id, value in rows:
+        converted = column_type.process_bind_param(value, conn.dialect)
+        if isinstance(converted, bytes):
+            params.append({"row_id": row_id, "value": converted})
+    if params:
+        conn.execute(text(f"UPDATE {table} SET {column} = :value WHERE rowid = :row_id"), params)
+
+
+def _convert_notion_page_ids(conn: Connection) -> None:
+    """runs.notion_page_idのTEXT値を16バイトのUUID表現に変換します."""
+    _convert_text_values(conn, "runs", "notion_page_id", CompactUUID())
+
+
+def _convert_image_hashes(conn: Connection) -> None:
+    """images.hashの16進数TEXT値をダイジェストのバイト列に変換します."""
+    _convert_text_values(conn, "images", "hash", HexDigest())
+
+
+# 既存データの移行処理（n番目の処理を適用済みのデータベースは PRAGMA user_version = n）
+MIGRATIONS: Tuple[Callable[[Connection], None], ...] = (
+    _convert_notion_page_ids,
+    _convert_image_hashes,
+)
+
+
+def migrate_database(engine: Union[Engine, Connection]) -> None:
+    """未適用の移行処理を実行します.
+
+    適用済みの処理数を ``PRAGMA user_version`` に記録し、
+    各処理はデータベースごとに一度だけ実行します。
+
+    Args:
+        engine: SQLAlchemy Engine または Connection インスタンス
+    """
+    with _schema_connection(engine) as conn:
+        version = conn.execute(text("PRAGMA user_version")).scalar_one()
+        for migration in MIGRATIONS[version:]:
+            migration(conn)
+        if version < len(MIGRATIONS):
+            conn.execute(text(f"PRAGMA user_version = {len(MIGRATIONS)}"))
+
+
+# schema.sqlに基づくインデックス（インデックス名, 作成SQL）
+INDEXES = (
+    ("idx_runs_status", "CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status)"),
+    ("idx_runs_created_at", "CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at)"),
+    ("idx_models_type", "CREATE INDEX IF NOT EXISTS idx_models_type ON models(type)"),
+    ("idx_images_run_id", "CREATE INDEX IF NOT EXISTS idx_images_run_id ON images(run_id)"),
+    ("idx_images_hash", "CREATE INDEX IF NOT EXISTS idx_images_hash ON images(hash)"),
+    # Notion同期でページIDから既存Runを検索するため
+    (
+        "idx_runs_notion_page_id",
+        "CREATE INDEX IF NOT EXISTS idx_runs_notion_page_id ON runs(notion_page_id)",
+    ),
+    # Notion同期のUPSERT（ON CONFLICT (notion_id)）の競合判定に使用
+    (
+        "uq_runs_notion_id",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_runs_notion_id ON runs(notion_id)",
+    ),
+    # モデルとステータスを組み合わせた絞り込み用
+    (
+        "idx_runs_model_status",
+        "CREATE INDEX IF NOT EXISTS idx_runs_model_status ON runs(model_id, status)",
+    ),
+    # YAML読み込み時の重複チェック（タイトルとプロンプトの一致）用
+    # プロンプトは長文のためインデックスには含めず、タイトルで絞り込んだ行のみ比較する
+    ("idx_runs_title", "CREATE INDEX IF NOT EXISTS idx_runs_title ON runs(title)"),
+)
+
+
+def find_duplicate_notion_ids(engine: Union[Engine, Connection]) -> Dict[str, List[int]]:
+    """同じNotionページに紐付いた複数のRunを検索します.
+
+    Args:
+        engine: SQLAlchemy Engine または Connection インスタンス
+
+    Returns:
+        notion_id -> 紐付いているrun_idのリスト（昇順）の辞書
+    """
+    duplicates: Dict[str, List[int]] = {}
+    with _schema_connection(engine) as conn:
+        rows = conn.execute(text(
+            "SELECT notion_id, run_id FROM runs WHERE notion_id IN ("
+            "SELECT notion_id FROM runs WHERE notion_id IS NOT NULL AND notion_id != '' "
+            "GROUP BY notion_id HAVING COUNT(*) > 1) "
+            "ORDER BY notion_id, run_id"
+        ))
+        for notion_id, run_id in rows:
+            duplicates.setdefault(notion_id, []).append(run_id)
+    return duplicates
+
+
+def unlink_duplicate_notion_ids(engine: Union[Engine, Connection]) -> Dict[str, List[int]]:
+    """同じNotionページに紐付いた重複Runの紐付けを解除します.
+
+    各notion_idについて最初に作成されたRun（最小のrun_id）のみ紐付けを残し、
+    残りはnotion_idをNULLにしてローカルのRunとして残します
+    （画像が紐付いている可能性があるため行は削除しません）。
+
+    Args:
+        engine: SQLAlchemy Engine または Connection インスタンス
+
+    Returns:
+        notion_id -> 紐付けを解除したrun_idのリストの辞書
+    """
+    with _schema_connection(engine) as conn:
+        unlinked = {
+            notion_id: run_ids[1:]
+            for notion_id, run_ids in find_duplicate_notion_ids(conn).items()
+        }
+        if unlinked:
+            conn.execute(
+                text("UPDATE runs SET notion_id = NULL WHERE run_id = :run_id"),
+                [{"run_id": run_id} for run_ids in unlinked.values() for run_id in run_ids],
+            )
+    return unlinked
+
+
+def _check_duplicate_notion_ids(conn: Connection) -> None:
+    """uq_runs_notion_idを作成できるか既存のnotion_idを確認します.
+
+    uq_runs_notion_id導入前のデータベースには、同じページを重複して取り込んだ
+    Runが存在し得ます。どのRunを紐付けたまま残すかは利用者が判断すべきため、
+    自動では解除せずエラーにします（``db dedupe-notion-ids`` で解除できます）。
+    空文字のnotion_idはページを指さないため、NULLに揃えます。
+
+    Args:
+        conn: SQLAlchemy Connection インスタンス
+
+    Raises:
+        DatabaseInitError: 同じnotion_idを持つRunが存在する場合
+    """
+    conn.execute(text("UPDATE runs SET notion_id = NULL WHERE notion_id = ''"))
+    duplicates = find_duplicate_notion_ids(conn)
+    if duplicates:
+        details = "; ".join(
+            f"{notion_id}: run_id {', '.join(map(str, run_ids))}"
+            for notion_id, run_ids in duplicates.items()
+        )
+        raise DatabaseInitError(
+            f"Runs share the same notion_id ({details}). "
+            "Run 'db dedupe-notion-ids' to unlink the duplicates."
+        )
+
+
+# 作成前に既存データを確認する必要があるインデックス（インデックス名 -> 事前処理）
+INDEX_PREPARATIONS: Dict[str, Callable[[Connection], None]] = {
+    "uq_runs_notion_id": _check_duplicate_notion_ids,
+}
+
+
+def create_indexes(engine: Union[Engine, Connection]) -> None:
     """データベースインデックスを作成します.
 
+    既存のインデックスを確認し、不足しているものだけを作成します。
+    一意インデックスは、作成前に既存データに重複がないことを確認します。
+
     Args:
-        engine: SQLAlchemy Engine インスタンス
+        engine: SQLAlchemy Engine または Connection インスタンス
+
+    Raises:
+        DatabaseInitError: 一意インデックスの対象に重複した値が存在する場合
+    """
+    with _schema_connection(engine) as conn:
+        existing = set(conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index'")
+        ).scalars())
+        for name, index_sql in INDEXES:
+            if name not in existing:
+                prepare = INDEX_PREPARATIONS.get(name)
+                if prepare is not None:
+                    prepare(conn)
+                conn.execute(text(index_sql))
+
+
+# プロンプト・タイトル検索用のFTS5テーブル（runsを外部コンテンツとして参照）
+# trigramトークナイザにより、LIKE '%term%' と同じ部分一致検索を索引で行う
+RUNS_FTS_TABLE = "runs_fts"
+RUNS_FTS_SQL = (
+    "CREATE VIRTUAL TABLE runs_fts USING fts5("
+    "prompt, title, content='runs', content_rowid='run_id', tokenize='trigram')"
+)
+
+# trigramで検索できる最短の文字数（これより短い語は通常の部分一致検索を使う）
+FTS_MIN_TERM_LENGTH = 3
+
+# runsの変更をFTSテーブルに反映するトリガー
+RUNS_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS runs_fts_ai AFTER INSERT ON runs BEGIN
+        INSERT INTO runs_fts(rowid, prompt, title) VALUES (new.run_id, new.prompt, new.title);
+    END
+    """,
     """
-    # schema.sqlに基づくインデックスを作成
-    indexes = [
-        "CREATE INDEX IF NOT EXISTS idx_runs_status ON runs(status)",
-        "CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at)",
-        "CREATE INDEX IF NOT EXISTS idx_models_type ON models(type)",
-        "CREATE INDEX IF NOT EXISTS idx_images_run_id ON images(run_id)",
-        "CREATE INDEX IF NOT EXISTS idx_images_hash ON images(hash)",
-    ]
+    CREATE TRIGGER IF NOT EXISTS runs_fts_ad AFTER DELETE ON runs BEGIN
+        INSERT INTO runs_fts(runs_fts, rowid, prompt, title)
+        VALUES ('delete', old.run_id, old.prompt, old.title);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS runs_fts_au AFTER UPDATE OF prompt, title ON runs BEGIN
+        INSERT INTO runs_fts(runs_fts, rowid, prompt, title)
+        VALUES ('delete', old.run_id, old.prompt, old.title);
+        INSERT INTO runs_fts(rowid, prompt, title) VALUES (new.run_id, new.prompt, new.title);
+    END
+    """,
+)
 
-    with engine.connect() as conn:
-        for index_sql in indexes:
-            conn.execute(text(index_sql))
-        conn.commit()
+
+def has_search_index(engine: Union[Engine, Connection]) -> bool:
+    """プロンプト検索用のFTSテーブルが存在するかを確認します.
+
+    Args:
+        engine: SQLAlchemy Engine または Connection インスタンス
+
+    Returns:
+        FTSテーブルが存在する場合True
+    """
+    with _schema_connection(engine) as conn:
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": RUNS_FTS_TABLE},
+        ).first() is not None
 
 
-def create_triggers(engine: Engine) -> None:
+def create_search_index(engine: Union[Engine, Connection]) -> bool:
+    """プロンプト検索用のFTSテーブルと同期トリガーを作成します.
+
+    新規作成時は既存のRunを索引に取り込みます。SQLiteがFTS5（trigram）に
+    対応していない場合は何もせず、検索は通常の部分一致にフォールバックします。
+
+    Args:
+        engine: SQLAlchemy Engine または Connection インスタンス
+
+    Returns:
+        FTSテーブルが利用可能な場合True
+    """
+    with _schema_connection(engine) as conn:
+        if not has_search_index(conn):
+            try:
+                conn.execute(text(RUNS_FTS_SQL))
+            except OperationalError:
+                # fts5モジュールまたはtrigramトークナイザが利用できない
+                # （SQLiteは失敗した文のみを取り消すため、トランザクションは継続できる）
+                return False
+            conn.execute(text("INSERT INTO runs_fts(runs_fts) VALUES ('rebuild')"))
+
+        for trigger_sql in RUNS_FTS_TRIGGERS:
+            conn.execute(text(trigger_sql))
+    return True
+
+
+def create_triggers(engine: Union[Engine, Connection]) -> None:
     """データベーストリガーを作成します.
 
     Note:
-        SQLAlchemyのeventシステムでupdated_atの自動更新を実装しているため、
+        updated_atはカラム定義の onupdate で自動更新しているため、
         このメソッドは将来の拡張用として空実装にしています。
 
     Args:
-        engine: SQLAlchemy Engine インスタンス
+        engine: SQLAlchemy Engine または Connection インスタンス
     """
-    # SQLAlchemyのeventシステムを使用してupdated_atを自動更新しているため、
+    # updated_atはカラム定義の onupdate（UPDATE文のSET句）で自動更新しているため、
     # ここでは追加のトリガーは作成しません
     pass
 
@@ -141,38 +633,125 @@ def initialize_database(db_path: Optional[str] = None) -> Engine:
         初期化されたSQLAlchemy Engine インスタンス
 
     Raises:
-        ValueError: データベース設定が無効な場合
-        Exception: データベース初期化に失敗した場合
+        DatabaseInitError: データベース設定が無効、または初期化に失敗した場合
     """
     try:
         # エンジンを作成
         engine = create_engine_for_database(db_path)
 
-        # テーブルを作成
-        create_tables(engine)
+        # スキーマ作成を1つのトランザクションにまとめてコミットを1回にする
+        with engine.connect() as conn:
+            # pysqliteはDDLの前に暗黙のBEGINを発行しないため明示的に開始する
+            conn.exec_driver_sql("BEGIN")
 
-        # インデックスを作成
-        create_indexes(engine)
+            # テーブルを作成
+            create_tables(conn)
 
-        # トリガーを作成（現在は空実装）
-        create_triggers(engine)
+            # 既存データを現在の格納形式に移行
+            migrate_database(conn)
+
+            # インデックスを作成
+            create_indexes(conn)
+
+            # トリガーを作成（現在は空実装）
+            create_triggers(conn)
+
+            # プロンプト検索用の全文検索インデックスを作成
+            create_search_index(conn)
+
+            conn.commit()
 
         return engine
 
     except Exception as e:
-        raise Exception(f"Database initialization failed: {e}") from e
+        raise DatabaseInitError(f"Database initialization failed: {e}") from e
+
+
+# 初期化済みエンジンのキャッシュ（絶対パス -> (書き込み用, 読み取り用)）
+_engine_cache: Dict[str, Tuple[Engine, Engine]] = {}
+
+
+@atexit.register
+def _optimize_cached_databases() -> None:
+    """終了時にキャッシュ済みのデータベースの統計を更新します."""
+    for path, (engine, _) in list(_engine_cache.items()):
+        if os.path.exists(path):
+            with suppress(Exception):
+                optimize_database(engine)
+
+
+def get_database_engines(db_path: Optional[str] = None) -> Tuple[Engine, Engine]:
+    """初期化済みの書き込み用・読み取り用エンジンを取得します.
+
+    同じデータベースファイルに対するエンジンはプロセス内で共有されるため、
+    2回目以降は初期化を省略し、プール済みの接続（とページキャッシュ）を再利用します。
+    インメモリDBは呼び出しごとに別のデータベースを作成し、両方に同じエンジンを返します。
+
+    Args:
+        db_path: データベースファイルのパス（Noneの場合は環境変数から取得）
+
+    Returns:
+        (書き込み用エンジン, 読み取り専用エンジン)
+
+    Raises:
+        DatabaseInitError: データベースパスが未設定、または初期化に失敗した場合
+    """
+    if db_path is None:
+        try:
+            db_path = get_database_path()
+        except ValueError as e:
+            raise DatabaseInitError(f"Database initialization failed: {e}") from e
+
+    if db_path == MEMORY_DATABASE_PATH:
+        engine = initialize_database(db_path)
+        return engine, engine
+
+    key = os.path.abspath(db_path)
+    engines = _engine_cache.get(key)
+    if engines is not None and not os.path.exists(key):
+        # ファイルが削除された場合は作り直す
+        for cached in engines:
+            cached.dispose()
+        engines = None
+
+    if engines is None:
+        engine = initialize_database(key)
+        engines = (engine, create_read_engine_for_database(key))
+        _engine_cache[key] = engines
+
+    return engines
+
+
+def reset_engine_cache() -> None:
+    """キャッシュ済みのエンジンを破棄し、キャッシュを空にします.
+
+    テストの後始末など、同じパスのデータベースを作り直す場合に使用します。
+    """
+    for engines in _engine_cache.values():
+        for engine in engines:
+            engine.dispose()
+    _engine_cache.clear()
 
 
 def get_session_factory(engine: Engine) -> sessionmaker[Session]:
     """セッションファクトリを作成します.
 
+    コミット後も読み込み済みの属性を保持するため（``expire_on_commit=False``）、
+    セッションから切り離したインスタンスも再読み込みなしで参照できます。
+
     Args:
         engine: SQLAlchemy Engine インスタンス
 
     Returns:
         セッションファクトリ
     """
-    return sessionmaker(bind=engine, autoflush=False, autocommit=False)
+    return sessionmaker(
+        bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
+    )
+
+
+# verify_database_setupで存在を確認するテーブル
+REQUIRED_TABLES = frozenset({"models", "runs", "images", "tags", "run_loras", "run_tags"})
 
 
 def verify_database_setup(engine: Engine) -> bool:
@@ -186,24 +765,15 @@ def verify_database_setup(engine: Engine) -> bool:
         False: セットアップに問題がある
     """
     try:
-        # テーブルの存在を確認
+        # テーブルの存在を1回のクエリでまとめて確認
         with engine.connect() as conn:
-            tables = [
-                "models",
-                "runs",
-                "images",
-                "tags",
-                "run_loras",
-                "run_tags"
-            ]
-
-            for table in tables:
-                result = conn.execute(
-                    text("SELECT name FROM sqlite_master WHERE type='table' AND name=:table"),
-                    {"table": table}
-                )
-                if not result.fetchone():
-                    return False
+            existing = set(conn.execute(
+                text("SELECT name FROM sqlite_master WHERE type='table' AND name IN :tables")
+                .bindparams(bindparam("tables", expanding=True)),
+                {"tables": list(REQUIRED_TABLES)}
+            ).scalars())
+            if not existing.issuperset(REQUIRED_TABLES):
+                return False
 
             # 外部キー制約が有効かを確認
             result = conn.execute(text("PRAGMA foreign_keys"))
@@ -3,26 +3,53 @@
 このモジュールは接続管理、セッション管理、基本的なCRUD操作を提供します。
 """
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Type, TypeVar, cast
-
-from sqlalchemy import desc, or_
-from sqlalchemy.engine import Engine
+from functools import cache, cached_property, lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar, Union, cast
+
+from sqlalchemy import (
+    Select,
+    bindparam,
+    desc,
+    insert,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.engine import Engine, Row
 from sqlalchemy.orm import Session, joinedload, sessionmaker
+from sqlalchemy.orm.interfaces import ORMOption
 
 from src.models.database import Base, Image, Model, Run, RunLora, RunTag
-from src.utils.db_init import get_session_factory, initialize_database
+from src.utils.db_init import (
+    FTS_MIN_TERM_LENGTH,
+    RUNS_FTS_TABLE,
+    get_database_engines,
+    get_session_factory,
+    has_search_index,
+    optimize_database,
+)
 
 # TypeVarを定義してジェネリック型をサポート
 ModelType = TypeVar("ModelType", bound=Base)
 
+# 複数Runの関連データ取得でIN句に一度に渡すrun_idの件数
+RUN_ID_CHUNK_SIZE = 500
+
+# 関連付けテーブルを1カラムで取得する際に先読みする参照先の関連
+# 切り離し後に名前を表示する呼び出し側が、遅延読み込みに頼らずに済むようにする
+_ASSOCIATION_TARGETS = {RunLora: "lora_model", RunTag: "tag"}
+
 
 class DatabaseManager:
     """データベース管理クラス.
 
     エンジンとセッションファクトリを管理し、データベース操作の
     コンテキストマネージャとユーティリティメソッドを提供します。
+    参照系の処理は読み取り専用エンジン（``read_engine``）を使用します。
     """
 
     def __init__(self, db_path: Optional[str] = None):
@@ -31,8 +58,20 @@ class DatabaseManager:
         Args:
             db_path: データベースファイルのパス（Noneの場合は環境変数から取得）
         """
-        self.engine: Engine = initialize_database(db_path)
+        # 同じファイルのエンジンはDatabaseManager間で共有される
+        # （インメモリDBでは読み取りも同じエンジンを使う）
+        self.engine: Engine
+        self.read_engine: Engine
+        self.engine, self.read_engine = get_database_engines(db_path)
         self.session_factory: sessionmaker[Session] = get_session_factory(self.engine)
+        self.read_session_factory: sessionmaker[Session] = get_session_factory(
+            self.read_engine
+        )
+
+    @cached_property
+    def has_search_index(self) -> bool:
+        """プロンプト検索で全文検索インデックスを使えるか（初回の検索時に確認）."""
+        return has_search_index(self.engine)
 
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -54,6 +93,37 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def close(self) -> None:
+        """クエリプランナーの統計を更新し、プール中の接続を閉じます.
+
+        エンジンは同じファイルのDatabaseManager間で共有されているため破棄はせず、
+        以降の操作では必要に応じて新しい接続が開かれます。
+        """
+        optimize_database(self.engine)
+        self.engine.dispose()
+        if self.read_engine is not self.engine:
+            self.read_engine.dispose()
+
+    @contextmanager
+    def get_read_session(self) -> Generator[Session, None, None]:
+        """読み取り専用セッションのコンテキストマネージャ.
+
+        書き込みと競合しない読み取り専用エンジンのセッションを返します。
+        コミット済みのデータのみ参照でき、変更をflushするとエラーになります。
+
+        Yields:
+            SQLAlchemy Session インスタンス
+
+        Raises:
+            SQLAlchemyError: データベース操作エラー
+        """
+        session = self.read_session_factory()
+        try:
+            yield session
+        finally:
+            session.rollback()
+            session.close()
+
     def create_record(self, model_class: Type[ModelType], **kwargs) -> ModelType:
         """新しいレコードを作成します.
 
@@ -70,30 +140,35 @@ class DatabaseManager:
         with self.get_session() as session:
             record = model_class(**kwargs)
             session.add(record)
-            session.flush()  # IDを取得するためにflush
-            session.refresh(record)  # 最新の状態を取得
+            # IDとデフォルト値はeager_defaultsによりINSERTのRETURNINGで取得される
+            session.flush()
             session.expunge(record)  # セッションから切り離してDetachedInstanceErrorを防ぐ
             return record
 
     def get_record_by_id(
-        self, model_class: Type[ModelType], record_id: int
+        self,
+        model_class: Type[ModelType],
+        record_id: int,
+        options: Optional[Sequence[ORMOption]] = None,
     ) -> Optional[ModelType]:
         """IDでレコードを取得します.
 
         Args:
             model_class: モデルクラス
             record_id: レコードID
+            options: ローダーオプション（例: ``[joinedload(Run.model)]``）。
+                切り離し後に参照する関連を先読みする場合に指定
 
         Returns:
             レコードインスタンス（見つからない場合はNone）
         """
-        with self.get_session() as session:
-            # SQLAlchemy introspection to get primary key column
-            primary_key = next(iter(model_class.__table__.primary_key))
-            record = session.query(model_class).filter(primary_key == record_id).first()
+        with self.get_read_session() as session:
+            # 主キー取得は識別マップとキャッシュ済みのローダーを使う
+            record = session.get(model_class, record_id, options=options)
             if record:
-                session.expunge(record)  # セッションから切り離してDetachedInstanceErrorを防ぐ
-            return cast(Optional[ModelType], record)
+                # 先読みした関連ごとまとめて切り離してDetachedInstanceErrorを防ぐ
+                session.expunge_all()
+            return record
 
     def get_records(
         self,
@@ -102,6 +177,7 @@ class DatabaseManager:
         order_by: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        options: Optional[Sequence[ORMOption]] = None,
     ) -> List[ModelType]:
         """条件に基づいてレコードを取得します.
 
@@ -111,23 +187,29 @@ class DatabaseManager:
             order_by: ソート用カラム名
             limit: 取得件数制限
             offset: オフセット
+            options: ローダーオプション（例: ``[selectinload(Model.runs)]``）。
+                切り離し後に参照する関連を先読みする場合に指定
 
         Returns:
             レコードインスタンスのリスト
         """
-        with self.get_session() as session:
+        with self.get_read_session() as session:
             query = session.query(model_class)
+            if options:
+                query = query.options(*options)
 
             # フィルタを適用
             if filters:
                 for key, value in filters.items():
-                    if hasattr(model_class, key):
-                        query = query.filter(getattr(model_class, key) == value)
+                    attribute = _model_attribute(model_class, key)
+                    if attribute is not None:
+                        query = query.filter(attribute == value)
 
             # ソートを適用
             if order_by:
-                if hasattr(model_class, order_by):
-                    query = query.order_by(getattr(model_class, order_by))
+                attribute = _model_attribute(model_class, order_by)
+                if attribute is not None:
+                    query = query.order_by(attribute)
 
             # ページネーションを適用
             if offset is not None:
@@ -136,10 +218,62 @@ class DatabaseManager:
                 query = query.limit(limit)
 
             records = query.all()
-            for record in records:
-                session.expunge(record)  # セッションから切り離してDetachedInstanceErrorを防ぐ
+            session.expunge_all()  # まとめて切り離してDetachedInstanceErrorを防ぐ
             return cast(List[ModelType], records)
 
+    def get_records_core(
+        self,
+        model_class: Type[ModelType],
+        columns: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Row[Any]]:
+        """指定したカラムのみを行として取得します.
+
+        ORMインスタンスを構築しないため、表示用など一部のカラムだけが
+        必要な場合は ``get_records`` より高速です。
+        各行はカラム名の属性でアクセスできます（例: ``row.title``）。
+
+        Args:
+            model_class: モデルクラス
+            columns: 取得するカラム名のシーケンス
+            filters: フィルタ条件の辞書
+            order_by: ソート用カラム名
+            limit: 取得件数制限
+            offset: オフセット
+
+        Returns:
+            Rowのリスト
+
+        Raises:
+            ValueError: 存在しないカラム名が指定された場合
+        """
+        stmt = select(*_resolve_columns(model_class, columns))
+
+        # フィルタを適用
+        if filters:
+            for key, value in filters.items():
+                attribute = _model_attribute(model_class, key)
+                if attribute is not None:
+                    stmt = stmt.where(attribute == value)
+
+        # ソートを適用
+        if order_by:
+            attribute = _model_attribute(model_class, order_by)
+            if attribute is not None:
+                stmt = stmt.order_by(attribute)
+
+        # ページネーションを適用
+        if offset is not None:
+            stmt = stmt.offset(offset)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        with self.get_read_session() as session:
+            return list(session.execute(stmt))
+
     def update_record(
         self, model_class: Type[ModelType], record_id: int, **kwargs
     ) -> Optional[ModelType]:
@@ -157,16 +291,13 @@ class DatabaseManager:
             SQLAlchemyError: データベース操作エラー
         """
         with self.get_session() as session:
-            # SQLAlchemy introspection to get primary key column
-            primary_key = next(iter(model_class.__table__.primary_key))
-            record = session.query(model_class).filter(primary_key == record_id).first()
+            record = session.get(model_class, record_id)
 
             if record:
                 for key, value in kwargs.items():
                     if hasattr(record, key):
                         setattr(record, key, value)
-                session.flush()
-                session.refresh(record)
+                session.flush()  # onupdateの値はUPDATEのRETURNINGで取得される
                 session.expunge(record)  # セッションから切り離してDetachedInstanceErrorを防ぐ
                 return record
             return None
@@ -185,9 +316,7 @@ class DatabaseManager:
             SQLAlchemyError: データベース操作エラー
         """
         with self.get_session() as session:
-            # SQLAlchemy introspection to get primary key column
-            primary_key = next(iter(model_class.__table__.primary_key))
-            record = session.query(model_class).filter(primary_key == record_id).first()
+            record = session.get(model_class, record_id)
 
             if record:
                 session.delete(record)
@@ -195,8 +324,97 @@ class DatabaseManager:
             return False
 
 
+@lru_cache(maxsize=1024)
+def _cached_model_attribute(model_class: Type[Base], name: str) -> Any:
+    return getattr(model_class, name, None)
+
+
+def _model_attribute(model_class: Type[Base], name: str) -> Any:
+    """フィルタやソートに使うモデル属性を返します（クラス・名前ごとにキャッシュ）.
+
+    ``lru_cache`` のラッパーは引数の型を ``Hashable`` に落とすため、
+    型付きの関数を経由して呼び出します。
+
+    Args:
+        model_class: モデルクラス
+        name: 属性名
+
+    Returns:
+        モデル属性（存在しない場合はNone）
+    """
+    return _cached_model_attribute(model_class, name)
+
+
+def _resolve_columns(model_class: Type[Base], columns: Sequence[str]) -> List[Any]:
+    """カラム名をモデルのカラム属性に変換します.
+
+    Args:
+        model_class: モデルクラス
+        columns: カラム名のシーケンス
+
+    Returns:
+        カラム属性のリスト
+
+    Raises:
+        ValueError: 存在しないカラム名が指定された場合
+    """
+    table_columns = model_class.__table__.columns
+    unknown = [name for name in columns if name not in table_columns]
+    if unknown:
+        raise ValueError(f"Unknown columns for {model_class.__name__}: {', '.join(unknown)}")
+    return [getattr(model_class, name) for name in columns]
+
+
 # 専用のヘルパー関数
 
+@cache
+def _cached_select_by_column(model_class: Type[Base], column_name: str) -> Any:
+    stmt = select(model_class).where(getattr(model_class, column_name) == bindparam("value"))
+    target = _ASSOCIATION_TARGETS.get(model_class)
+    if target is not None:
+        stmt = stmt.options(joinedload(getattr(model_class, target)))
+    return stmt
+
+
+def _select_by_column(model_class: Type[Base], column_name: str) -> Any:
+    """1つのカラムの一致で絞り込むSELECT文を返します（クラス・カラムごとにキャッシュ）.
+
+    値はバインドパラメータ ``value`` で渡すため、文の構築とキャッシュキーの
+    算出は初回のみで済みます。関連付けテーブル（RunLora, RunTag）の場合は
+    参照先のモデル・タグを同じSELECTで読み込みます。
+
+    Args:
+        model_class: モデルクラス
+        column_name: 絞り込みに使うカラム名
+
+    Returns:
+        SELECT文
+    """
+    return _cached_select_by_column(model_class, column_name)
+
+
+def _get_records_by_column(
+    db_manager: DatabaseManager, model_class: Type[ModelType], column_name: str, value: Any
+) -> List[ModelType]:
+    """1つのカラムの値が一致するレコードを取得します.
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        model_class: モデルクラス
+        column_name: 絞り込みに使うカラム名
+        value: カラムの値
+
+    Returns:
+        レコードインスタンスのリスト
+    """
+    with db_manager.get_read_session() as session:
+        records = list(
+            session.scalars(_select_by_column(model_class, column_name), {"value": value})
+        )
+        session.expunge_all()  # まとめて切り離してDetachedInstanceErrorを防ぐ
+        return records
+
+
 def get_models_by_type(db_manager: DatabaseManager, model_type: str) -> List[Model]:
     """タイプ別にモデルを取得します.
 
@@ -207,7 +425,7 @@ def get_models_by_type(db_manager: DatabaseManager, model_type: str) -> List[Mod
     Returns:
         指定されたタイプのモデルリスト
     """
-    return db_manager.get_records(Model, filters={"type": model_type})
+    return _get_records_by_column(db_manager, Model, "type", model_type)
 
 
 def get_runs_by_status(db_manager: DatabaseManager, status: str) -> List[Run]:
@@ -220,59 +438,111 @@ def get_runs_by_status(db_manager: DatabaseManager, status: str) -> List[Run]:
     Returns:
         指定されたステータスの実行履歴リスト
     """
-    return db_manager.get_records(Run, filters={"status": status})
+    return _get_records_by_column(db_manager, Run, "status", status)
 
 
-def get_recent_runs(db_manager: DatabaseManager, limit: int = 10) -> List[Run]:
+def get_recent_runs(
+    db_manager: DatabaseManager,
+    limit: int = 10,
+    columns: Optional[Sequence[str]] = None,
+) -> Union[List[Run], List[Row[Any]]]:
     """最近の実行履歴を取得します.
 
     Args:
         db_manager: DatabaseManagerインスタンス
         limit: 取得件数
+        columns: 取得するカラム名（指定時はRunではなくRowを返す）
 
     Returns:
         最近の実行履歴リスト
     """
-    with db_manager.get_session() as session:
+    if columns is not None:
+        stmt = (
+            select(*_resolve_columns(Run, columns))
+            .order_by(desc(Run.created_at))
+            .limit(limit)
+        )
+        with db_manager.get_read_session() as session:
+            return list(session.execute(stmt))
+
+    with db_manager.get_read_session() as session:
         records = (
             session.query(Run)
             .order_by(desc(Run.created_at))
             .limit(limit)
             .all()
         )
-        for record in records:
-            session.expunge(record)  # セッションから切り離してDetachedInstanceErrorを防ぐ
+        session.expunge_all()  # まとめて切り離してDetachedInstanceErrorを防ぐ
         return records
 
 
+def _prompt_search_condition(db_manager: DatabaseManager, search_term: str) -> Any:
+    """プロンプト・タイトルの部分一致検索条件を作成します.
+
+    全文検索インデックスがあり、検索語がtrigramで検索できる長さの場合は
+    FTSテーブルを引き、それ以外はLIKEによる部分一致にフォールバックします。
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        search_term: 検索キーワード
+
+    Returns:
+        Runに対する検索条件
+    """
+    if db_manager.has_search_index and len(search_term) >= FTS_MIN_TERM_LENGTH:
+        # 検索語全体をフレーズとして扱い、FTSの演算子として解釈させない
+        phrase = '"' + search_term.replace('"', '""') + '"'
+        matched_ids: Select[Any] = (
+            select(literal_column("rowid"))
+            .select_from(table(RUNS_FTS_TABLE))
+            .where(text(f"{RUNS_FTS_TABLE} MATCH :phrase").bindparams(phrase=phrase))
+        )
+        return Run.run_id.in_(matched_ids)
+
+    return or_(
+        Run.prompt.contains(search_term),
+        Run.title.contains(search_term),
+    )
+
+
 def search_runs_by_prompt(
-    db_manager: DatabaseManager, search_term: str, limit: int = 50
-) -> List[Run]:
+    db_manager: DatabaseManager,
+    search_term: str,
+    limit: int = 50,
+    columns: Optional[Sequence[str]] = None,
+) -> Union[List[Run], List[Row[Any]]]:
     """プロンプトで実行履歴を検索します.
 
     Args:
         db_manager: DatabaseManagerインスタンス
         search_term: 検索キーワード
         limit: 取得件数制限
+        columns: 取得するカラム名（指定時はRunではなくRowを返す）
 
     Returns:
         検索にマッチした実行履歴リスト
     """
-    with db_manager.get_session() as session:
+    condition = _prompt_search_condition(db_manager, search_term)
+
+    if columns is not None:
+        stmt = (
+            select(*_resolve_columns(Run, columns))
+            .where(condition)
+            .order_by(desc(Run.created_at))
+            .limit(limit)
+        )
+        with db_manager.get_read_session() as session:
+            return list(session.execute(stmt))
+
+    with db_manager.get_read_session() as session:
         records = (
             session.query(Run)
-            .filter(
-                or_(
-                    Run.prompt.contains(search_term),
-                    Run.title.contains(search_term),
-                )
-            )
+            .filter(condition)
             .order_by(desc(Run.created_at))
             .limit(limit)
             .all()
         )
-        for record in records:
-            session.expunge(record)  # セッションから切り離してDetachedInstanceErrorを防ぐ
+        session.expunge_all()  # まとめて切り離してDetachedInstanceErrorを防ぐ
         return records
 
 
@@ -286,7 +556,7 @@ def get_images_for_run(db_manager: DatabaseManager, run_id: int) -> List[Image]:
     Returns:
         指定された実行履歴の画像リスト
     """
-    return db_manager.get_records(Image, filters={"run_id": run_id})
+    return _get_records_by_column(db_manager, Image, "run_id", run_id)
 
 
 def get_loras_for_run(db_manager: DatabaseManager, run_id: int) -> List[RunLora]:
@@ -299,7 +569,7 @@ def get_loras_for_run(db_manager: DatabaseManager, run_id: int) -> List[RunLora]
     Returns:
         指定された実行履歴のLoRA関連付けリスト
     """
-    return db_manager.get_records(RunLora, filters={"run_id": run_id})
+    return _get_records_by_column(db_manager, RunLora, "run_id", run_id)
 
 
 def get_tags_for_run(db_manager: DatabaseManager, run_id: int) -> List[RunTag]:
@@ -312,7 +582,79 @@ def get_tags_for_run(db_manager: DatabaseManager, run_id: int) -> List[RunTag]:
     Returns:
         指定された実行履歴のタグ関連付けリスト
     """
-    return db_manager.get_records(RunTag, filters={"run_id": run_id})
+    return _get_records_by_column(db_manager, RunTag, "run_id", run_id)
+
+
+def _group_by_run(
+    db_manager: DatabaseManager, model_class: Type[ModelType], run_ids: Sequence[int]
+) -> Dict[int, List[ModelType]]:
+    """run_idを持つレコードを複数Run分まとめて取得し、run_idごとに分類します.
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        model_class: run_idカラムを持つモデルクラス
+        run_ids: 実行履歴IDのシーケンス
+
+    Returns:
+        run_id -> レコードリストの辞書（該当なしのrun_idは空リスト）
+    """
+    grouped: Dict[int, List[ModelType]] = {run_id: [] for run_id in run_ids}
+    unique_ids = list(grouped)
+    run_id_column = cast(Any, model_class).run_id
+
+    with db_manager.get_read_session() as session:
+        for start in range(0, len(unique_ids), RUN_ID_CHUNK_SIZE):
+            chunk = unique_ids[start:start + RUN_ID_CHUNK_SIZE]
+            for record in session.scalars(select(model_class).where(run_id_column.in_(chunk))):
+                grouped[record.run_id].append(record)  # type: ignore[attr-defined]
+        session.expunge_all()  # まとめて切り離してDetachedInstanceErrorを防ぐ
+
+    return grouped
+
+
+def get_images_for_runs(
+    db_manager: DatabaseManager, run_ids: Sequence[int]
+) -> Dict[int, List[Image]]:
+    """複数の実行履歴の画像をまとめて取得します.
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        run_ids: 実行履歴IDのシーケンス
+
+    Returns:
+        run_id -> 画像リストの辞書
+    """
+    return _group_by_run(db_manager, Image, run_ids)
+
+
+def get_loras_for_runs(
+    db_manager: DatabaseManager, run_ids: Sequence[int]
+) -> Dict[int, List[RunLora]]:
+    """複数の実行履歴のLoRA関連付けをまとめて取得します.
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        run_ids: 実行履歴IDのシーケンス
+
+    Returns:
+        run_id -> LoRA関連付けリストの辞書
+    """
+    return _group_by_run(db_manager, RunLora, run_ids)
+
+
+def get_tags_for_runs(
+    db_manager: DatabaseManager, run_ids: Sequence[int]
+) -> Dict[int, List[RunTag]]:
+    """複数の実行履歴のタグ関連付けをまとめて取得します.
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        run_ids: 実行履歴IDのシーケンス
+
+    Returns:
+        run_id -> タグ関連付けリストの辞書
+    """
+    return _group_by_run(db_manager, RunTag, run_ids)
 
 
 def create_run_with_loras(
@@ -339,22 +681,29 @@ def create_run_with_loras(
         session.add(run)
         session.flush()  # run_idを取得
 
-        # LoRA関連付けを作成
-        for lora_config in lora_configs:
-            run_lora = RunLora(
-                run_id=run.run_id,
-                lora_id=lora_config["lora_id"],
-                weight=lora_config.get("weight", 1.0),
+        # LoRA関連付けを1回のINSERTでまとめて作成
+        if lora_configs:
+            session.execute(
+                insert(RunLora),
+                [
+                    {
+                        "run_id": run.run_id,
+                        "lora_id": lora_config["lora_id"],
+                        "weight": lora_config.get("weight", 1.0),
+                    }
+                    for lora_config in lora_configs
+                ],
             )
-            session.add(run_lora)
 
-        session.flush()
-        session.refresh(run)
         session.expunge(run)  # セッションから切り離してDetachedInstanceErrorを防ぐ
         return run
 
 
-def export_runs_with_relations(
+# エクスポート時にORMインスタンスをまとめて読み込む件数
+EXPORT_YIELD_PER = 200
+
+
+def iter_export_runs(
     db_manager: DatabaseManager,
     filters: Optional[Dict[str, Any]] = None,
     run_ids: Optional[List[int]] = None,
@@ -362,11 +711,12 @@ def export_runs_with_relations(
     until_date: Optional[str] = None,
     limit: Optional[int] = None,
     order_by: str = "created_at"
-) -> List[Dict[str, Any]]:
-    """関連データを含む実行履歴をエクスポート用に取得します.
+) -> Iterator[Dict[str, Any]]:
+    """関連データを含む実行履歴をエクスポート用に1件ずつ生成します.
 
-    このファンクションは適切なeager loadingを使用してDetachedInstanceErrorを回避し、
-    session.expunge()後にも安全にアクセスできるシリアライズ済みデータを返します。
+    ``yield_per`` で ``EXPORT_YIELD_PER`` 件ずつ読み込むため、件数に関わらず
+    保持するORMインスタンスは一定数に抑えられます。イテレーション中は
+    セッションを開いたままにします。
 
     Args:
         db_manager: DatabaseManagerインスタンス
@@ -377,27 +727,23 @@ def export_runs_with_relations(
         limit: 取得件数制限
         order_by: ソート用カラム名
 
-    Returns:
-        シリアライズ済みの実行履歴データのリスト
+    Yields:
+        シリアライズ済みの実行履歴データ
 
     Raises:
-        ValueError: 日付形式が無効な場合
+        ValueError: 日付形式が無効な場合（最初の要素の取得時）
         SQLAlchemyError: データベース操作エラー
     """
-    with db_manager.get_session() as session:
+    with db_manager.get_read_session() as session:
         # Eager loadingで関連データを先読み
-        query = session.query(Run).options(
-            joinedload(Run.model),
-            joinedload(Run.loras).joinedload(RunLora.lora_model),
-            joinedload(Run.images),
-            joinedload(Run.tags).joinedload(RunTag.tag)
-        )
+        query = Run.query_for_export().execution_options(yield_per=EXPORT_YIELD_PER)
 
         # フィルタを適用
         if filters:
             for key, value in filters.items():
-                if hasattr(Run, key):
-                    query = query.filter(getattr(Run, key) == value)
+                attribute = _model_attribute(Run, key)
+                if attribute is not None:
+                    query = query.filter(attribute == value)
 
         # Run IDが指定されている場合
         if run_ids:
@@ -421,19 +767,57 @@ def export_runs_with_relations(
                 raise ValueError(f"Invalid until_date format: {until_date}") from e
 
         # ソートを適用
-        if order_by and hasattr(Run, order_by):
-            query = query.order_by(getattr(Run, order_by))
+        if order_by:
+            attribute = _model_attribute(Run, order_by)
+            if attribute is not None:
+                query = query.order_by(attribute)
 
         # 制限を適用
         if limit is not None:
             query = query.limit(limit)
 
-        # データを取得
-        runs = query.all()
-
         # sessionが生きている間にto_dict()を実行してシリアライズ
-        serialized_runs = []
-        for run in runs:
-            serialized_runs.append(run.to_dict())
+        for run in session.execute(query).scalars():
+            yield run.to_dict()
+
+
+def export_runs_with_relations(
+    db_manager: DatabaseManager,
+    filters: Optional[Dict[str, Any]] = None,
+    run_ids: Optional[List[int]] = None,
+    since_date: Optional[str] = None,
+    until_date: Optional[str] = None,
+    limit: Optional[int] = None,
+    order_by: str = "created_at"
+) -> List[Dict[str, Any]]:
+    """関連データを含む実行履歴をエクスポート用に取得します.
 
-        return serialized_runs
+    このファンクションは適切なeager loadingを使用してDetachedInstanceErrorを回避し、
+    session.expunge()後にも安全にアクセスできるシリアライズ済みデータを返します。
+    件数が多い場合は ``iter_export_runs`` で逐次処理してください。
+
+    Args:
+        db_manager: DatabaseManagerインスタンス
+        filters: フィルタ条件の辞書
+        run_ids: 特定のRun IDのリスト
+        since_date: 開始日時（ISO 8601形式）
+        until_date: 終了日時（ISO 8601形式）
+        limit: 取得件数制限
+        order_by: ソート用カラム名
+
+    Returns:
+        シリアライズ済みの実行履歴データのリスト
+
+    Raises:
+        ValueError: 日付形式が無効な場合
+        SQLAlchemyError: データベース操作エラー
+    """
+    return list(iter_export_runs(
+        db_manager,
+        filters=filters,
+        run_ids=run_ids,
+        since_date=since_date,
+        until_date=until_date,
+        limit=limit,
+        order_by=order_by
+    ))
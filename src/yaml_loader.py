@@ -6,15 +6,100 @@
 
 from __future__ import annotations
 
+import copy
+import os
+import sys
+from collections import deque
+from collections.abc import Generator, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
 
-import yaml
+from sqlalchemy import insert, select
 from sqlalchemy.exc import SQLAlchemyError
-
-from src.models.database import Model, Run, RunLora
+from sqlalchemy.orm import Session
+
+from src.models.database import (
+    Model,
+    Run,
+    RunLora,
+    bulk_insert_run_loras,
+    bulk_insert_runs,
+)
 from src.utils.db_utils import DatabaseManager
 
+# YAMLファイルの読み込み・バリデーションを並列に行うスレッド数
+YAML_PARSE_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# parse_filesで同時に投入しておくファイル数（スレッド数に対する倍率）
+# 読み込み済みで未消費の結果がディレクトリの大きさに比例して溜まらないようにする
+YAML_PARSE_WINDOW_FACTOR = 2
+
+# iter_load_directoryで1つのトランザクションにまとめて挿入するファイル数
+LOAD_DIRECTORY_BATCH_SIZE = 100
+
+# YAMLLoaderごとに保持するパース結果キャッシュの最大件数（超えた場合は破棄）
+YAML_PARSE_CACHE_SIZE = 4096
+
+# session.info に保持する「モデル名 -> model_id」キャッシュのキー
+_MODEL_ID_CACHE_KEY = "yaml_loader.model_ids"
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """YAMLを安全に読み込みます.
+
+    ``yaml.safe_load`` と同じ結果を返しますが、libyamlが利用可能な場合は
+    C実装のパーサーを使用します。
+    PyYAMLは初回の呼び出し時に読み込むため、``YAMLValidator`` のみを
+    使用する場合はインポートされません。
+
+    Args:
+        stream: YAML文字列・バイト列またはファイルオブジェクト
+
+    Returns:
+        パースされたデータ
+    """
+    import yaml
+
+    # libyamlが利用可能な場合はC実装のローダーを使用（結果はSafeLoaderと同じ）
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+# YAMLファイルとして扱う拡張子
+YAML_SUFFIXES = ('.yaml', '.yml')
+
+
+def find_yaml_files(directory: Union[str, Path], recursive: bool = False) -> List[Path]:
+    """ディレクトリ内のYAMLファイルを列挙します.
+
+    拡張子ごとにglobする代わりに ``os.scandir`` で1回だけ走査します。
+    ``DirEntry`` はディレクトリ読み込み時のファイル種別を保持しているため、
+    YAML以外のエントリに対する ``stat`` や ``Path`` の生成を行いません。
+
+    Args:
+        directory: 検索するディレクトリ
+        recursive: サブディレクトリも検索する場合True
+
+    Returns:
+        YAMLファイルのパスのリスト
+    """
+    yaml_files = []
+    pending = [os.fspath(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.name.endswith(YAML_SUFFIXES):
+                    if entry.is_file():
+                        yaml_files.append(Path(entry.path))
+                elif recursive and entry.is_dir():
+                    pending.append(entry.path)
+    return yaml_files
+
+
+# dict.get で「キーが存在しない」ことを表す番兵（Noneの値と区別する）
+_MISSING = object()
+
 
 class YAMLValidationError(Exception):
     """YAML バリデーションエラー."""
@@ -30,22 +115,47 @@ class YAMLValidator:
     """YAML データのバリデーション機能を提供するクラス."""
 
     # 必須フィールド
-    REQUIRED_FIELDS = {
+    REQUIRED_FIELDS = frozenset((
         "run_title",
         "prompt",
         "cfg",
         "steps",
         "sampler"
-    }
+    ))
 
-    # 有効なステータス
-    VALID_STATUSES = {"Purchased", "Tried", "Tuned", "Final"}
+    # 有効なステータス（変更されないためfrozensetとして1回だけ構築）
+    VALID_STATUSES = frozenset(("Purchased", "Tried", "Tuned", "Final"))
 
     # 有効な範囲
     CFG_RANGE = (0.1, 30.0)
     STEPS_RANGE = (1, 300)
     SEED_RANGE = (0, 2**32 - 1)
 
+    # 型チェック: (フィールド名, 許容する型, Noneを許容するか, エラーメッセージでの型の説明)
+    _TYPE_SPEC: Tuple[Tuple[str, Any, bool, str], ...] = (
+        ("run_title", str, False, "a string"),
+        ("prompt", str, False, "a string"),
+        ("sampler", str, False, "a string"),
+        ("source", str, False, "a string"),
+        ("status", str, False, "a string"),
+        ("cfg", (int, float), False, "a number"),
+        ("steps", int, False, "an integer"),
+        ("seed", int, True, "an integer or null"),
+        ("loras", list, True, "a list"),
+    )
+
+    # リスト要素の型チェック: (フィールド名, 要素の型, エラーメッセージ)
+    _ELEMENT_TYPE_SPEC: Tuple[Tuple[str, Any, str], ...] = (
+        ("loras", str, "LoRA names must be strings"),
+    )
+
+    # 範囲チェック: (フィールド名, (最小値, 最大値), Noneを許容するか)
+    _RANGE_SPEC: Tuple[Tuple[str, Tuple[float, float], bool], ...] = (
+        ("cfg", CFG_RANGE, False),
+        ("steps", STEPS_RANGE, False),
+        ("seed", SEED_RANGE, True),
+    )
+
     @staticmethod
     def validate_required_fields(data: Dict[str, Any]) -> None:
         """必須フィールドの存在をチェックします.
@@ -56,10 +166,11 @@ class YAMLValidator:
         Raises:
             YAMLValidationError: 必須フィールドが不足している場合
         """
-        missing_fields = YAMLValidator.REQUIRED_FIELDS - set(data.keys())
-        if missing_fields:
+        # issubsetはdictのキーを直接参照し、中間のsetを作らない
+        if not YAMLValidator.REQUIRED_FIELDS.issubset(data):
+            missing_fields = YAMLValidator.REQUIRED_FIELDS.difference(data)
             raise YAMLValidationError(
-                f"Required fields missing: {', '.join(missing_fields)}"
+                f"Required fields missing: {', '.join(sorted(missing_fields))}"
             )
 
     @staticmethod
@@ -72,30 +183,19 @@ class YAMLValidator:
         Raises:
             YAMLValidationError: データ型が不正な場合
         """
-        # 文字列フィールド
-        string_fields = ["run_title", "prompt", "sampler", "source", "status"]
-        for field in string_fields:
-            if field in data and not isinstance(data[field], str):
-                raise YAMLValidationError(f"Field '{field}' must be a string")
-
-        # 数値フィールド
-        if "cfg" in data and not isinstance(data["cfg"], (int, float)):
-            raise YAMLValidationError("Field 'cfg' must be a number")
-
-        if "steps" in data and not isinstance(data["steps"], int):
-            raise YAMLValidationError("Field 'steps' must be an integer")
-
-        if "seed" in data and data["seed"] is not None:
-            if not isinstance(data["seed"], int):
-                raise YAMLValidationError("Field 'seed' must be an integer or null")
-
-        # リストフィールド
-        if "loras" in data and data["loras"] is not None:
-            if not isinstance(data["loras"], list):
-                raise YAMLValidationError("Field 'loras' must be a list")
-            for lora in data["loras"]:
-                if not isinstance(lora, str):
-                    raise YAMLValidationError("LoRA names must be strings")
+        for field, expected_type, nullable, description in YAMLValidator._TYPE_SPEC:
+            value = data.get(field, _MISSING)
+            if value is _MISSING or (nullable and value is None):
+                continue
+            if not isinstance(value, expected_type):
+                raise YAMLValidationError(f"Field '{field}' must be {description}")
+
+        for field, element_type, message in YAMLValidator._ELEMENT_TYPE_SPEC:
+            values = data.get(field)
+            if values is not None:
+                for value in values:
+                    if not isinstance(value, element_type):
+                        raise YAMLValidationError(message)
 
     @staticmethod
     def validate_ranges(data: Dict[str, Any]) -> None:
@@ -107,28 +207,13 @@ class YAMLValidator:
         Raises:
             YAMLValidationError: 値が範囲外の場合
         """
-        # CFG範囲チェック
-        if "cfg" in data:
-            cfg = data["cfg"]
-            if not (YAMLValidator.CFG_RANGE[0] <= cfg <= YAMLValidator.CFG_RANGE[1]):
-                raise YAMLValidationError(
-                    f"cfg must be between {YAMLValidator.CFG_RANGE[0]} and {YAMLValidator.CFG_RANGE[1]}"
-                )
-
-        # Steps範囲チェック
-        if "steps" in data:
-            steps = data["steps"]
-            if not (YAMLValidator.STEPS_RANGE[0] <= steps <= YAMLValidator.STEPS_RANGE[1]):
+        for field, (minimum, maximum), nullable in YAMLValidator._RANGE_SPEC:
+            value = data.get(field, _MISSING)
+            if value is _MISSING or (nullable and value is None):
+                continue
+            if not (minimum <= value <= maximum):
                 raise YAMLValidationError(
-                    f"steps must be between {YAMLValidator.STEPS_RANGE[0]} and {YAMLValidator.STEPS_RANGE[1]}"
-                )
-
-        # Seed範囲チェック
-        if "seed" in data and data["seed"] is not None:
-            seed = data["seed"]
-            if not (YAMLValidator.SEED_RANGE[0] <= seed <= YAMLValidator.SEED_RANGE[1]):
-                raise YAMLValidationError(
-                    f"seed must be between {YAMLValidator.SEED_RANGE[0]} and {YAMLValidator.SEED_RANGE[1]}"
+                    f"{field} must be between {minimum} and {maximum}"
                 )
 
     @staticmethod
@@ -145,28 +230,114 @@ class YAMLValidator:
             status = data["status"]
             if status not in YAMLValidator.VALID_STATUSES:
                 raise YAMLValidationError(
-                    f"status must be one of: {', '.join(YAMLValidator.VALID_STATUSES)}"
+                    f"status must be one of: {', '.join(sorted(YAMLValidator.VALID_STATUSES))}"
                 )
 
     @classmethod
     def validate(cls, data: Dict[str, Any]) -> None:
         """YAML データの完全なバリデーションを実行します.
 
+        有効なデータは事前に構築したフィールドごとの判定関数で1回だけ走査します。
+        いずれかの判定に失敗した場合のみ個別のチェックを順に実行し、
+        従来と同じエラーメッセージを送出します。
+
         Args:
             data: バリデーション対象のYAMLデータ
 
         Raises:
             YAMLValidationError: バリデーションエラーが発生した場合
         """
+        if cls.REQUIRED_FIELDS.issubset(data):
+            field_checks = _FIELD_CHECKS
+            for field, value in data.items():
+                check = field_checks.get(field)
+                if check is not None and not check(value):
+                    break
+            else:
+                return
+
         cls.validate_required_fields(data)
         cls.validate_data_types(data)
         cls.validate_ranges(data)
         cls.validate_status(data)
 
 
+def _type_check(expected_type: Any, nullable: bool) -> Callable[[Any], bool]:
+    """``_TYPE_SPEC`` の1行に対応する判定関数を作成します."""
+    if nullable:
+        return lambda value: value is None or isinstance(value, expected_type)
+    return lambda value: isinstance(value, expected_type)
+
+
+def _range_check(minimum: float, maximum: float, nullable: bool) -> Callable[[Any], bool]:
+    """``_RANGE_SPEC`` の1行に対応する判定関数を作成します."""
+    if nullable:
+        return lambda value: value is None or minimum <= value <= maximum
+    return lambda value: minimum <= value <= maximum
+
+
+def _element_type_check(element_type: Any) -> Callable[[Any], bool]:
+    """``_ELEMENT_TYPE_SPEC`` の1行に対応する判定関数を作成します."""
+    return lambda values: values is None or all(
+        isinstance(value, element_type) for value in values
+    )
+
+
+def _all_of(checks: List[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+    """判定関数を登録順に評価し、すべて満たす場合にTrueを返す関数にまとめます."""
+    if len(checks) == 1:
+        return checks[0]
+    ordered = tuple(checks)
+    return lambda value: all(check(value) for check in ordered)
+
+
+def _compile_field_checks() -> Dict[str, Callable[[Any], bool]]:
+    """YAMLValidatorの仕様表からフィールドごとの判定関数を構築します.
+
+    ``_TYPE_SPEC`` ・ ``_ELEMENT_TYPE_SPEC`` ・ ``_RANGE_SPEC`` ・ ``VALID_STATUSES``
+    から生成するため、高速パスは個別のチェックと常に同じルールで判定します。
+    型の判定を先に登録し、範囲・ステータスの判定は型を満たす値にのみ適用されます。
+
+    Returns:
+        フィールド名 -> 判定関数 の辞書
+    """
+    checks: Dict[str, List[Callable[[Any], bool]]] = {}
+    for field, expected_type, nullable, _description in YAMLValidator._TYPE_SPEC:
+        checks.setdefault(field, []).append(_type_check(expected_type, nullable))
+    for field, element_type, _message in YAMLValidator._ELEMENT_TYPE_SPEC:
+        checks.setdefault(field, []).append(_element_type_check(element_type))
+    for field, (minimum, maximum), nullable in YAMLValidator._RANGE_SPEC:
+        checks.setdefault(field, []).append(_range_check(minimum, maximum, nullable))
+
+    valid_statuses = YAMLValidator.VALID_STATUSES
+    checks.setdefault("status", []).append(lambda value: value in valid_statuses)
+
+    return {field: _all_of(field_checks) for field, field_checks in checks.items()}
+
+
+# YAMLValidator.validate の高速パスで使用する判定関数（モジュール読み込み時に1回だけ構築）
+_FIELD_CHECKS = _compile_field_checks()
+
+
 class YAMLLoader:
     """YAML ファイルの読み込みとデータベース挿入を行うクラス."""
 
+    # 取りうる値が少なく多数のRunで共有される文字列フィールド
+    # sys.internで同一オブジェクトを共有し、大量読み込み時のメモリを削減する
+    INTERNED_FIELDS = ("sampler", "scheduler", "status")
+
+    # 必須フィールドのマッピング: (YAMLフィールド名, Runモデルのフィールド名)
+    RUN_FIELD_MAP = (
+        ("run_title", "title"),
+        ("prompt", "prompt"),
+        ("cfg", "cfg"),
+        ("steps", "steps"),
+        ("sampler", "sampler"),
+    )
+
+    # YAMLに存在する場合のみ設定するフィールド（名前はRunモデルと同じ）
+    OPTIONAL_RUN_FIELDS = ("negative", "seed", "width", "height", "source")
+
     def __init__(self, db_manager: DatabaseManager):
         """YAMLLoaderを初期化します.
 
@@ -175,10 +346,36 @@ class YAMLLoader:
         """
         self.db_manager = db_manager
         self.validator = YAMLValidator()
+        # (パス, 更新時刻[ns], サイズ) -> パース済みYAMLデータ
+        self._parse_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+    @contextmanager
+    def session_scope(self) -> Generator[Session, None, None]:
+        """複数ファイルの読み込みで共有するセッションを提供します.
+
+        ``load_and_insert`` などに ``session`` として渡すと、ファイルごとに
+        セッションを作成・コミットせずに同一トランザクションで処理できます。
+        ブロックを正常に抜けるとコミットされ、例外時はロールバックされます。
+        セッション内で解決したモデルIDはキャッシュされ、同じモデル名を
+        参照する後続のファイルでは再検索されません。
+
+        Yields:
+            SQLAlchemy Session インスタンス
+        """
+        with self.db_manager.get_session() as session:
+            session.info[_MODEL_ID_CACHE_KEY] = {}
+            try:
+                yield session
+            finally:
+                session.info.pop(_MODEL_ID_CACHE_KEY, None)
 
     def load_yaml_file(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """YAML ファイルを読み込みます.
 
+        パース結果はパス・更新時刻・サイズをキーにキャッシュされ、同じローダーで
+        変更のないファイルを再度読み込む場合（重複チェック後の挿入など）は
+        パースを省略します。
+
         Args:
             file_path: YAMLファイルのパス
 
@@ -189,14 +386,27 @@ class YAMLLoader:
             YAMLLoaderError: ファイル読み込みエラー
             YAMLValidationError: YAMLパースエラー
         """
+        import yaml
+
         try:
-            with open(file_path, encoding='utf-8') as file:
-                data = yaml.safe_load(file)
+            with open(file_path, 'rb') as file:
+                stat = os.fstat(file.fileno())
+                cache_key = (os.fspath(file_path), stat.st_mtime_ns, stat.st_size)
+                cached = self._parse_cache.get(cache_key)
+                if cached is not None:
+                    # ネストしたリスト等を呼び出し側が変更してもキャッシュに影響しないよう複製する
+                    return copy.deepcopy(cached)
+
+                # バイト列のまま渡し、Python側でのUTF-8デコードを省いてパーサーに文字コードを判定させる
+                data = safe_load_yaml(file.read())
 
             if not isinstance(data, dict):
                 raise YAMLValidationError("YAML file must contain a dictionary")
 
-            return data
+            if len(self._parse_cache) >= YAML_PARSE_CACHE_SIZE:
+                self._parse_cache.clear()
+            self._parse_cache[cache_key] = data
+            return copy.deepcopy(data)
 
         except FileNotFoundError as e:
             raise YAMLLoaderError(f"YAML file not found: {file_path}") from e
@@ -205,12 +415,18 @@ class YAMLLoader:
         except Exception as e:
             raise YAMLLoaderError(f"Error reading YAML file: {e}") from e
 
-    def find_or_create_model(self, model_name: str, model_type: str = "checkpoint") -> Model:
+    def find_or_create_model(
+        self,
+        model_name: str,
+        model_type: str = "checkpoint",
+        session: Optional[Session] = None
+    ) -> Model:
         """モデルを検索し、存在しない場合は作成します.
 
         Args:
             model_name: モデル名
             model_type: モデルタイプ（デフォルト: "checkpoint"）
+            session: 使用するセッション（Noneの場合は操作ごとにセッションを作成）
 
         Returns:
             Modelインスタンス
@@ -219,6 +435,18 @@ class YAMLLoader:
             YAMLLoaderError: モデル操作エラー
         """
         try:
+            if session is not None:
+                model = session.execute(
+                    select(Model).where(Model.name == model_name)
+                ).scalars().first()
+
+                if model is None:
+                    model = Model(name=model_name, type=model_type)
+                    session.add(model)
+                    session.flush()  # model_idを取得
+
+                return model
+
             # 既存モデルを検索
             models = self.db_manager.get_records(Model, filters={"name": model_name})
 
@@ -236,11 +464,57 @@ class YAMLLoader:
         except SQLAlchemyError as e:
             raise YAMLLoaderError(f"Database error while handling model '{model_name}': {e}") from e
 
+    def _resolve_model_ids(self, session: Session, models: Dict[str, str]) -> Dict[str, int]:
+        """複数のモデルをまとめて検索し、存在しないものを作成します.
+
+        既存モデルの検索と不足分の作成をそれぞれ1回のクエリで行います。
+        ``find_or_create_model`` と同様に、既存モデルは名前のみで照合します。
+        ``session_scope`` のセッションでは解決済みのモデル名を再検索しません。
+
+        Args:
+            session: 使用するセッション
+            models: モデル名 -> 作成時のモデルタイプ の辞書
+
+        Returns:
+            モデル名 -> model_id の辞書
+        """
+        if not models:
+            return {}
+
+        cache: Optional[Dict[str, int]] = session.info.get(_MODEL_ID_CACHE_KEY)
+        model_ids: Dict[str, int] = {}
+        if cache:
+            model_ids = {name: cache[name] for name in models if name in cache}
+
+        uncached = [name for name in models if name not in model_ids]
+        if uncached:
+            for name, model_id in session.execute(
+                select(Model.name, Model.model_id).where(Model.name.in_(uncached))
+            ):
+                model_ids[name] = model_id
+
+        missing = [
+            {"name": name, "type": models[name]}
+            for name in uncached
+            if name not in model_ids
+        ]
+        if missing:
+            for name, model_id in session.execute(
+                insert(Model).returning(Model.name, Model.model_id), missing
+            ):
+                model_ids[name] = model_id
+
+        if cache is not None:
+            cache.update(model_ids)
+
+        return model_ids
+
     def create_lora_relationships(
         self,
         run_id: int,
         lora_names: List[str],
-        default_weight: float = 1.0
+        default_weight: float = 1.0,
+        session: Optional[Session] = None
     ) -> List[RunLora]:
         """LoRA関連付けを作成します.
 
@@ -248,6 +522,7 @@ class YAMLLoader:
             run_id: 実行履歴ID
             lora_names: LoRA名のリスト
             default_weight: デフォルトの重み
+            session: 使用するセッション（Noneの場合は操作ごとにセッションを作成）
 
         Returns:
             作成されたRunLoraインスタンスのリスト
@@ -255,21 +530,25 @@ class YAMLLoader:
         Raises:
             YAMLLoaderError: LoRA関連付け作成エラー
         """
-        run_loras = []
-
         try:
-            for lora_name in lora_names:
-                # LoRAモデルを検索または作成
-                lora_model = self.find_or_create_model(lora_name, "lora")
-
-                # RunLora関連付けを作成
-                run_lora = self.db_manager.create_record(
-                    RunLora,
-                    run_id=run_id,
-                    lora_id=lora_model.model_id,
-                    weight=default_weight
-                )
-                run_loras.append(run_lora)
+            if session is None:
+                with self.session_scope() as own_session:
+                    run_loras = self.create_lora_relationships(
+                        run_id, lora_names, default_weight, session=own_session
+                    )
+                    own_session.expunge_all()  # セッションから切り離してDetachedInstanceErrorを防ぐ
+                return run_loras
+
+            # LoRAモデルをまとめて検索または作成
+            model_ids = self._resolve_model_ids(session, dict.fromkeys(lora_names, "lora"))
+
+            # RunLora関連付けを作成
+            run_loras = [
+                RunLora(run_id=run_id, lora_id=model_ids[lora_name], weight=default_weight)
+                for lora_name in lora_names
+            ]
+            session.add_all(run_loras)
+            session.flush()
 
             return run_loras
 
@@ -286,42 +565,37 @@ class YAMLLoader:
             Runモデル用のデータ辞書
         """
         # YAMLフィールドをRunモデルフィールドにマッピング
-        run_data = {
-            "title": yaml_data["run_title"],
-            "prompt": yaml_data["prompt"],
-            "cfg": yaml_data["cfg"],
-            "steps": yaml_data["steps"],
-            "sampler": yaml_data["sampler"],
-        }
+        run_data = {column: yaml_data[field] for field, column in self.RUN_FIELD_MAP}
 
         # オプショナルフィールド
-        if "negative" in yaml_data:
-            run_data["negative"] = yaml_data["negative"]
-
-        if "seed" in yaml_data:
-            run_data["seed"] = yaml_data["seed"]
-
-        if "width" in yaml_data:
-            run_data["width"] = yaml_data["width"]
+        run_data.update(
+            {field: yaml_data[field] for field in self.OPTIONAL_RUN_FIELDS if field in yaml_data}
+        )
 
-        if "height" in yaml_data:
-            run_data["height"] = yaml_data["height"]
+        run_data["status"] = yaml_data.get("status", "Tried")  # デフォルトステータス
 
-        if "source" in yaml_data:
-            run_data["source"] = yaml_data["source"]
-
-        if "status" in yaml_data:
-            run_data["status"] = yaml_data["status"]
-        else:
-            run_data["status"] = "Tried"  # デフォルトステータス
+        for field in self.INTERNED_FIELDS:
+            value = run_data.get(field)
+            if isinstance(value, str):
+                run_data[field] = sys.intern(value)
 
         return run_data
 
-    def load_and_insert(self, file_path: Union[str, Path]) -> Run:
+    def load_and_insert(
+        self,
+        file_path: Union[str, Path],
+        session: Optional[Session] = None
+    ) -> Run:
         """YAML ファイルを読み込み、データベースに挿入します.
 
+        ``session`` を指定した場合はそのセッション内のSAVEPOINTで挿入し、
+        コミットは呼び出し側に任せます。エラー時はこのファイル分の変更のみ
+        ロールバックされます。指定しない場合は1つのトランザクションで挿入して
+        コミットし、エラー時はすべてロールバックされます。
+
         Args:
             file_path: YAMLファイルのパス
+            session: 使用するセッション（Noneの場合はトランザクションを作成）
 
         Returns:
             作成されたRunインスタンス
@@ -330,33 +604,64 @@ class YAMLLoader:
             YAMLValidationError: バリデーションエラー
             YAMLLoaderError: 読み込みまたは挿入エラー
         """
+        yaml_data = self._load_and_validate(file_path)
+        return self.insert_yaml_data(yaml_data, session=session)
+
+    def _load_and_validate(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """YAMLファイルを読み込んでバリデーションします（データベースには触れない）.
+
+        Args:
+            file_path: YAMLファイルのパス
+
+        Returns:
+            バリデーション済みのYAMLデータ
+
+        Raises:
+            YAMLValidationError: バリデーションエラー
+            YAMLLoaderError: 読み込みエラー
+        """
         try:
             # YAMLファイルを読み込み
             yaml_data = self.load_yaml_file(file_path)
 
             # バリデーション実行
             self.validator.validate(yaml_data)
+            return yaml_data
 
-            # モデルを処理
-            model = None
-            if "model" in yaml_data:
-                model = self.find_or_create_model(yaml_data["model"])
+        except (YAMLValidationError, YAMLLoaderError):
+            # 既知のエラーはそのまま再発生
+            raise
+        except Exception as e:
+            raise YAMLLoaderError(f"Unexpected error during load_and_insert: {e}") from e
 
-            # Runデータを変換
-            run_data = self.convert_yaml_to_run_data(yaml_data)
-            if model:
-                run_data["model_id"] = model.model_id
+    def insert_yaml_data(
+        self,
+        yaml_data: Dict[str, Any],
+        session: Optional[Session] = None
+    ) -> Run:
+        """バリデーション済みのYAMLデータをデータベースに挿入します.
 
-            # Runレコードを作成
-            run = self.db_manager.create_record(Run, **run_data)
+        ``session`` の扱いは ``load_and_insert`` と同じです。
 
-            # LoRA関連付けを作成
-            if "loras" in yaml_data and yaml_data["loras"]:
-                self.create_lora_relationships(run.run_id, yaml_data["loras"])
+        Args:
+            yaml_data: バリデーション済みのYAMLデータ
+            session: 使用するセッション（Noneの場合はトランザクションを作成）
 
-            return run
+        Returns:
+            作成されたRunインスタンス
 
-        except (YAMLValidationError, YAMLLoaderError):
+        Raises:
+            YAMLLoaderError: 挿入エラー
+        """
+        try:
+            if session is not None:
+                return self._insert_with_session(yaml_data, session)
+
+            # モデル・Run・LoRA関連付けを1つのトランザクションで挿入し、コミットを1回にする
+            with self.session_scope() as own_session:
+                return self._insert_with_session(yaml_data, own_session)
+
+        except YAMLLoaderError:
             # 既知のエラーはそのまま再発生
             raise
         except SQLAlchemyError as e:
@@ -364,15 +669,188 @@ class YAMLLoader:
         except Exception as e:
             raise YAMLLoaderError(f"Unexpected error during load_and_insert: {e}") from e
 
+    def _insert_with_session(self, yaml_data: Dict[str, Any], session: Session) -> Run:
+        """バリデーション済みのYAMLデータを指定セッションに挿入します.
+
+        Args:
+            yaml_data: バリデーション済みのYAMLデータ
+            session: 使用するセッション
+
+        Returns:
+            作成されたRunインスタンス（セッションから切り離し済み）
+        """
+        try:
+            with session.begin_nested():
+                # モデルを処理
+                run_data = self.convert_yaml_to_run_data(yaml_data)
+                if "model" in yaml_data:
+                    model_name = yaml_data["model"]
+                    run_data["model_id"] = self._resolve_model_ids(
+                        session, {model_name: "checkpoint"}
+                    )[model_name]
+
+                # Runレコードを作成
+                run = Run(**run_data)
+                session.add(run)
+                session.flush()  # run_idを取得
+
+                # LoRA関連付けを作成
+                if "loras" in yaml_data and yaml_data["loras"]:
+                    self.create_lora_relationships(
+                        run.run_id, yaml_data["loras"], session=session
+                    )
+
+                session.refresh(run)  # 最新の状態を取得
+        except Exception:
+            # ロールバックで取り消されたモデルのIDを再利用しないようキャッシュを破棄
+            cache = session.info.get(_MODEL_ID_CACHE_KEY)
+            if cache:
+                cache.clear()
+            raise
+
+        session.expunge(run)  # セッションから切り離してDetachedInstanceErrorを防ぐ
+        return run
+
+    def bulk_insert_yaml_data(self, documents: List[Dict[str, Any]]) -> List[Run]:
+        """バリデーション済みの複数のYAMLデータを1つのトランザクションでまとめて挿入します.
+
+        Runは1回の一括INSERT（RETURNINGでrun_idを取得）、LoRA関連付けも
+        1回の一括INSERTで作成します。参照されるモデルはまとめて検索・作成します。
+
+        Args:
+            documents: バリデーション済みのYAMLデータのリスト
+
+        Returns:
+            作成されたRunインスタンスのリスト（documentsと同じ順序）
+
+        Raises:
+            YAMLLoaderError: 挿入エラー（この場合はいずれのデータも挿入されない）
+        """
+        try:
+            with self.session_scope() as session:
+                # 参照される全モデルをまとめて検索・作成（最初に出現した用途のタイプで作成）
+                models: Dict[str, str] = {}
+                for yaml_data in documents:
+                    if "model" in yaml_data:
+                        models.setdefault(yaml_data["model"], "checkpoint")
+                    for name in yaml_data.get("loras") or ():
+                        models.setdefault(name, "lora")
+                model_ids = self._resolve_model_ids(session, models)
+
+                run_rows = []
+                for yaml_data in documents:
+                    run_data = self.convert_yaml_to_run_data(yaml_data)
+                    if "model" in yaml_data:
+                        run_data["model_id"] = model_ids[yaml_data["model"]]
+                    run_rows.append(run_data)
+
+                run_ids = bulk_insert_runs(session, run_rows)
+
+                bulk_insert_run_loras(session, [
+                    {"run_id": run_id, "lora_id": model_ids[name], "weight": 1.0}
+                    for run_id, yaml_data in zip(run_ids, documents)
+                    for name in yaml_data.get("loras") or ()
+                ])
+
+                # 採番されたIDの範囲で読み込む（IN句のバインド変数の上限を避ける）
+                wanted_ids = set(run_ids)
+                runs_by_id = {
+                    run.run_id: run
+                    for run in session.scalars(
+                        select(Run).where(Run.run_id.between(min(run_ids), max(run_ids)))
+                    )
+                    if run.run_id in wanted_ids
+                }
+                session.expunge_all()  # まとめて切り離してDetachedInstanceErrorを防ぐ
+                return [runs_by_id[run_id] for run_id in run_ids]
+
+        except YAMLLoaderError:
+            raise
+        except SQLAlchemyError as e:
+            raise YAMLLoaderError(f"Database error during insertion: {e}") from e
+
+    def _parse_and_validate(self, file_path: Path) -> Union[Dict[str, Any], Exception]:
+        """YAMLファイルを読み込んでバリデーションし、エラーは戻り値として返します."""
+        try:
+            return self._load_and_validate(file_path)
+        except (YAMLValidationError, YAMLLoaderError) as e:
+            return e
+
+    def parse_files(
+        self, file_paths: List[Path]
+    ) -> Iterator[Tuple[Path, Union[Dict[str, Any], Exception]]]:
+        """複数のYAMLファイルをスレッドプールで並列に読み込み、バリデーションします.
+
+        結果は ``file_paths`` と同じ順序で返します。ファイルごとのエラーは
+        例外を送出せず、結果として返します。
+
+        スレッドプールに投入するのは先頭から
+        ``スレッド数 * YAML_PARSE_WINDOW_FACTOR`` 件までで、結果を1件返すごとに
+        次のファイルを投入します。途中でジェネレータを閉じた場合、
+        未着手のファイルは読み込まずに破棄します。
+
+        Args:
+            file_paths: YAMLファイルのパスのリスト
+
+        Yields:
+            (ファイルパス, バリデーション済みのYAMLデータまたはエラー)
+        """
+        workers = min(YAML_PARSE_WORKERS, len(file_paths)) or 1
+        remaining = iter(file_paths)
+        pending: Deque[Tuple[Path, Future[Union[Dict[str, Any], Exception]]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+        def submit_next() -> None:
+            file_path = next(remaining, None)
+            if file_path is not None:
+                pending.append((file_path, executor.submit(self._parse_and_validate, file_path)))
+
+        try:
+            for _ in range(workers * YAML_PARSE_WINDOW_FACTOR):
+                submit_next()
+            while pending:
+                file_path, future = pending.popleft()
+                result = future.result()
+                submit_next()
+                yield file_path, result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def load_directory(self, directory_path: Union[str, Path]) -> List[Run]:
         """ディレクトリ内のすべての YAML ファイルを読み込みます.
 
+        有効なファイルはすべて1つのトランザクションで挿入します。
+        大量のファイルを扱う場合は ``iter_load_directory`` を使用してください。
+
         Args:
             directory_path: YAMLファイルを含むディレクトリのパス
 
         Returns:
             作成されたRunインスタンスのリスト
 
+        Raises:
+            YAMLLoaderError: ディレクトリ処理エラー
+        """
+        return list(self.iter_load_directory(directory_path, batch_size=None))
+
+    def iter_load_directory(
+        self,
+        directory_path: Union[str, Path],
+        batch_size: Optional[int] = LOAD_DIRECTORY_BATCH_SIZE
+    ) -> Iterator[Run]:
+        """ディレクトリ内の YAML ファイルを一定件数ごとに挿入し、作成したRunを順に返します.
+
+        ``batch_size`` 件ごとに挿入・コミットし、そのバッチのRunを返してから
+        次のバッチに進むため、作成済みのRunをすべてメモリに保持しません。
+        無効なファイルのエラーは有効なファイルをすべて挿入した後にまとめて送出します。
+
+        Args:
+            directory_path: YAMLファイルを含むディレクトリのパス
+            batch_size: 1つのトランザクションで挿入するファイル数（Noneの場合は全件を1回で挿入）
+
+        Yields:
+            作成されたRunインスタンス（セッションから切り離し済み）
+
         Raises:
             YAMLLoaderError: ディレクトリ処理エラー
         """
@@ -383,52 +861,61 @@ class YAMLLoader:
         if not directory.is_dir():
             raise YAMLLoaderError(f"Path is not a directory: {directory_path}")
 
-        yaml_files = list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
+        yaml_files = find_yaml_files(directory)
 
         if not yaml_files:
             raise YAMLLoaderError(f"No YAML files found in directory: {directory_path}")
 
-        runs = []
+        documents = []
         errors = []
 
-        for yaml_file in yaml_files:
-            try:
-                run = self.load_and_insert(yaml_file)
-                runs.append(run)
-            except (YAMLValidationError, YAMLLoaderError) as e:
-                errors.append(f"Error in {yaml_file.name}: {e}")
+        # 読み込みとバリデーションは並列に行い、有効なファイルをバッチごとにまとめて挿入する
+        for yaml_file, result in self.parse_files(yaml_files):
+            if isinstance(result, Exception):
+                errors.append(f"Error in {yaml_file.name}: {result}")
+                continue
+
+            documents.append(result)
+            if batch_size is not None and len(documents) >= batch_size:
+                yield from self.bulk_insert_yaml_data(documents)
+                documents = []
+
+        if documents:
+            yield from self.bulk_insert_yaml_data(documents)
 
         if errors:
             error_message = "Errors occurred while processing YAML files:\n" + "\n".join(errors)
             raise YAMLLoaderError(error_message)
 
-        return runs
-
-    def check_duplicate_run(self, yaml_data: Dict[str, Any]) -> Optional[Run]:
+    def check_duplicate_run(
+        self,
+        yaml_data: Dict[str, Any],
+        session: Optional[Session] = None
+    ) -> Optional[Run]:
         """重複する実行履歴をチェックします.
 
         Args:
             yaml_data: チェック対象のYAMLデータ
+            session: 使用するセッション（未コミットの挿入も重複対象に含める場合に指定）
 
         Returns:
             重複する実行履歴があればそのインスタンス、なければNone
         """
         try:
-            # タイトルとプロンプトで重複チェック
-            title = yaml_data["run_title"]
-            prompt = yaml_data["prompt"]
-
-            # 同じタイトルとプロンプトの実行履歴を検索
-            existing_runs = self.db_manager.get_records(
-                Run,
-                filters={"title": title}
-            )
-
-            for run in existing_runs:
-                if run.prompt == prompt:
-                    return run
-
-            return None
+            # タイトルとプロンプトの両方が一致する実行履歴を1件だけ検索
+            stmt = select(Run).where(
+                Run.title == yaml_data["run_title"],
+                Run.prompt == yaml_data["prompt"],
+            ).limit(1)
+
+            if session is not None:
+                return session.execute(stmt).scalars().first()
+
+            with self.session_scope() as own_session:
+                run = own_session.execute(stmt).scalars().first()
+                if run is not None:
+                    own_session.expunge(run)  # セッションから切り離してDetachedInstanceErrorを防ぐ
+                return run
 
         except Exception:
             # エラーが発生した場合は重複なしとして処理
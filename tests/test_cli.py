@@ -4,7 +4,6 @@
 """
 
 import os
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -16,34 +15,43 @@ from src.cli import cli
 
 
 @pytest.fixture
-def temp_db():
+def temp_db(tmp_path):
     """テスト用の一時データベースファイルを提供します."""
-    # ファイルを作成せず、パスだけを生成
-    temp_dir = tempfile.mkdtemp()
-    db_path = os.path.join(temp_dir, "test.db")
-    yield db_path
-    # クリーンアップ
-    if os.path.exists(temp_dir):
-        import shutil
-        shutil.rmtree(temp_dir, ignore_errors=True)
+    # ファイルを作成せず、パスだけを生成（削除はpytestのtmp_pathに任せる）
+    return str(tmp_path / "test.db")
 
 
 @pytest.fixture
+def ram_db(tmp_path):
+    """RAM上（Linuxの/dev/shm）に置いたテスト用データベースファイルを提供します.
+
+    ``db init`` と ``db status`` は別々の接続でファイルを開くため ``:memory:`` は使えません。
+    /dev/shmが使えない環境ではtmp_pathにフォールバックします。
+    """
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else tmp_path
+    db_path = base / f"sdxl-test-{os.getpid()}-{tmp_path.name}.db"
+    yield str(db_path)
+    # WAL/SHMファイルも含めて削除
+    for path in base.glob(f"{db_path.name}*"):
+        path.unlink()
+
+
+@pytest.fixture(scope="session")
 def runner():
-    """Click test runner を提供します."""
+    """Click test runner を提供します.
+
+    CliRunnerは呼び出しごとに入出力を分離し、状態を持たないため全テストで共有します。
+    """
     return CliRunner()
 
 
 @pytest.fixture
-def temp_env_file():
+def temp_env_file(tmp_path):
     """テスト用の一時.envファイルを提供します."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".env") as tmp_file:
-        tmp_file.write("TEST_VAR=test_value\n")
-        env_path = tmp_file.name
-    yield env_path
-    # クリーンアップ
-    if os.path.exists(env_path):
-        os.unlink(env_path)
+    env_path = tmp_path / "test.env"
+    env_path.write_text("TEST_VAR=test_value\n")
+    return str(env_path)
 
 
 class TestMainCLI:
@@ -140,6 +148,7 @@ class TestCLIErrorHandling:
         assert result.exit_code in [0, 1, 2, 3]  # 有効な終了コード
 
 
+@pytest.mark.serial
 class TestCLILogging:
     """CLIログ機能のテストクラス."""
 
@@ -231,24 +240,100 @@ class TestCLIContext:
         assert 'データベース管理コマンド' in result.output
 
 
+class TestOutputSerialization:
+    """JSON/YAML出力ユーティリティのテストクラス."""
+
+    def test_serialize_json_roundtrip(self):
+        """日本語と日時を含むデータがJSONとして復元できることをテストします."""
+        import json
+        from datetime import datetime
+
+        from src.cli.utils import serialize_json
+
+        data = [{'run_title': 'テスト', 'created_at': datetime(2024, 1, 1, 12, 0, 0)}]
+        output = serialize_json(data)
+
+        assert isinstance(output, bytes)
+        assert 'テスト' in output.decode('utf-8')  # ensure_ascii=False 相当
+        assert json.loads(output) == [{'run_title': 'テスト', 'created_at': '2024-01-01T12:00:00'}]
+
+    def test_serialize_json_without_orjson(self):
+        """orjsonが無い環境では標準jsonにフォールバックすることをテストします."""
+        import json
+        import sys
+
+        from src.cli.utils import serialize_json
+
+        with patch.dict(sys.modules, {'orjson': None}):
+            output = serialize_json({'name': 'モデル'})
+
+        assert json.loads(output) == {'name': 'モデル'}
+
+    def test_serialize_yaml_matches_default_dumper(self):
+        """C実装のDumperでも標準のyaml.dumpと同じ出力になることをテストします."""
+        import io
+
+        import yaml
+
+        from src.cli.utils import serialize_yaml
+
+        data = [{'run_title': 'テスト', 'prompt': 'line1\nline2', 'loras': ['a', 'b']}]
+        expected = yaml.dump(data, allow_unicode=True, default_flow_style=False)
+
+        assert serialize_yaml(data) == expected
+
+        stream = io.StringIO()
+        assert serialize_yaml(data, stream) is None
+        assert stream.getvalue() == expected
+
+    @pytest.mark.parametrize('items', [
+        [],
+        [{'run_title': 'テスト', 'prompt': 'line1\nline2'}],
+        [{'a': 1, 'nested': {'b': [1, 2]}}, {'c': None}],
+    ])
+    def test_streaming_writers_match_bulk_serializers(self, items):
+        """逐次書き込みの出力が一括シリアライズと一致することをテストします."""
+        import io
+
+        from src.cli.utils import (
+            serialize_json,
+            serialize_yaml,
+            write_json_array,
+            write_yaml_sequence,
+        )
+
+        json_stream = io.BytesIO()
+        assert write_json_array(iter(items), json_stream) == len(items)
+        assert json_stream.getvalue() == serialize_json(items)
+
+        yaml_stream = io.StringIO()
+        assert write_yaml_sequence(iter(items), yaml_stream) == len(items)
+        assert yaml_stream.getvalue() == serialize_yaml(items)
+
+
 class TestCLIIntegration:
     """CLI統合テストクラス."""
 
-    def test_full_cli_flow(self, runner, temp_db):
+    def test_full_cli_flow(self, runner, ram_db, tmp_path, monkeypatch):
         """完全なCLIフローをテストします."""
+        # カレントディレクトリの.envを読み込まないよう空のディレクトリで実行
+        monkeypatch.chdir(tmp_path)
+
         # データベース初期化
-        result = runner.invoke(cli, ['--db', temp_db, 'db', 'init', '--force'])
+        result = runner.invoke(cli, ['--db', ram_db, 'db', 'init', '--force'])
         assert result.exit_code == 0
-        
+
         # データベースステータス確認
-        result = runner.invoke(cli, ['--db', temp_db, 'db', 'status'])
+        result = runner.invoke(cli, ['--db', ram_db, 'db', 'status'])
         assert result.exit_code == 0
 
-    def test_error_recovery(self, runner):
+    def test_error_recovery(self, runner, tmp_path):
         """エラー回復のテストをします."""
-        # 無効なDBパスでコマンド実行
+        # 無効なDBパス（親がファイルのため作成できない）でコマンド実行
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
         result = runner.invoke(cli, [
-            '--db', '/invalid/path/db.sqlite',
+            '--db', str(blocker / 'db.sqlite'),
             'db', 'status'
         ])
         # エラーが適切に処理されることを確認
@@ -260,12 +345,13 @@ class TestCLIIntegration:
         result = runner.invoke(cli, ['--help'])
         assert result.exit_code == 0
         assert 'SDXL Asset Manager' in result.output
-        
-        # サブコマンドヘルプ
-        for subcommand in ['db', 'yaml', 'search', 'run']:
-            result = runner.invoke(cli, [subcommand, '--help'])
-            assert result.exit_code == 0
-            assert subcommand in result.output.lower()
+
+    @pytest.mark.parametrize('subcommand', ['db', 'yaml', 'search', 'run'])
+    def test_subcommand_help(self, runner, subcommand):
+        """サブコマンドのヘルプをテストします."""
+        result = runner.invoke(cli, [subcommand, '--help'])
+        assert result.exit_code == 0
+        assert subcommand in result.output.lower()
 
 
 if __name__ == '__main__':
@@ -5,6 +5,7 @@
 
 import os
 import shutil
+import sqlite3
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -38,6 +39,18 @@ def temp_backup_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+@pytest.fixture
+def unreachable_db(tmp_path):
+    """作成できない（親がディレクトリではない）データベースパスを提供します.
+
+    root権限でも作成できないため、``/nonexistent`` のように実行環境によって
+    ファイルが作られてしまうことがありません。
+    """
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    return str(blocker / "db.sqlite")
+
+
 @pytest.fixture
 def runner():
     """Click test runner を提供します."""
@@ -115,9 +128,9 @@ class TestDBCommands:
         assert 'Images' in result.output
         assert 'Tags' in result.output
 
-    def test_db_status_nonexistent_database(self, runner):
+    def test_db_status_nonexistent_database(self, runner, unreachable_db):
         """存在しないデータベースのステータス表示をテストします."""
-        result = runner.invoke(cli, ['--db', '/nonexistent/db.sqlite', 'db', 'status'])
+        result = runner.invoke(cli, ['--db', unreachable_db, 'db', 'status'])
         assert result.exit_code == 1  # データベースエラー
         assert 'データベース接続エラー' in result.output
 
@@ -158,14 +171,17 @@ class TestDBCommands:
         assert result.exit_code == 0
         assert 'バックアップをキャンセルしました' in result.output
 
-    def test_db_backup_nonexistent_source(self, runner):
+    def test_db_backup_nonexistent_source(self, runner, unreachable_db):
         """存在しないデータベースのバックアップをテストします."""
-        result = runner.invoke(cli, [
-            '--db', '/nonexistent/db.sqlite',
-            'db', 'backup'
-        ])
-        assert result.exit_code == 1  # データベースエラー
-        assert 'データベースファイルが見つかりません' in result.output
+        with runner.isolated_filesystem():
+            result = runner.invoke(cli, [
+                '--db', unreachable_db,
+                'db', 'backup'
+            ])
+            assert result.exit_code == 1  # データベースエラー
+            assert 'データベースファイルが見つかりません' in result.output
+            # デフォルト名のバックアップが作成されていないこと
+            assert not list(Path('.').glob('*_backup_*.db'))
 
     def test_db_restore(self, runner, initialized_db, temp_backup_dir):
         """バックアップからの復元をテストします."""
@@ -185,6 +201,38 @@ class TestDBCommands:
         assert 'データベースが正常に復元されました' in result.output
         assert new_db_path.exists()
 
+    def test_db_restore_discards_stale_wal_files(self, runner, initialized_db, temp_backup_dir):
+        """置き換え前のDBに残ったWALが復元後のDBへ適用されないことをテストします."""
+        backup_path = Path(temp_backup_dir) / 'restore_wal_test.db'
+        shutil.copy2(initialized_db, backup_path)
+
+        # チェックポイントされていないWALを現在のDBの横に残す
+        wal_path = Path(initialized_db + '-wal')
+        conn = sqlite3.connect(initialized_db)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA wal_autocheckpoint=0')
+        conn.execute('CREATE TABLE stale_marker (id INTEGER)')
+        conn.commit()
+        stale_wal = wal_path.read_bytes()
+        conn.close()
+        wal_path.write_bytes(stale_wal)
+
+        result = runner.invoke(cli, [
+            '--db', initialized_db,
+            'db', 'restore',
+            str(backup_path),
+            '--force'
+        ], input='y\n')
+        assert result.exit_code == 0
+        assert 'データベースが正常に復元されました' in result.output
+
+        conn = sqlite3.connect(initialized_db)
+        try:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        finally:
+            conn.close()
+        assert 'stale_marker' not in tables
+
     def test_db_restore_with_confirmation(self, runner, initialized_db, temp_backup_dir):
         """確認付きの復元をテストします."""
         # バックアップを作成
@@ -209,6 +257,32 @@ class TestDBCommands:
         ])
         assert result.exit_code != 0  # Click がファイル存在チェックでエラー
 
+    def test_db_dedupe_notion_ids(self, runner, initialized_db):
+        """重複したNotionページの紐付け解除をテストします."""
+        conn = sqlite3.connect(initialized_db)
+        conn.execute('DROP INDEX uq_runs_notion_id')
+        conn.executemany(
+            "INSERT INTO runs (title, prompt, cfg, steps, sampler, width, height, batch_size, "
+            "status, notion_id, created_at, updated_at) VALUES "
+            "(?, 'p', 7, 20, 'Euler', 1024, 1024, 1, 'Tried', 'page-1', "
+            "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)",
+            [('Run A',), ('Run B',)]
+        )
+        conn.commit()
+        conn.close()
+
+        # 重複が残っている間は初期化に失敗し、該当するRunが表示される
+        result = runner.invoke(cli, ['--db', initialized_db, 'db', 'status'])
+        assert result.exit_code != 0
+        assert 'page-1: run_id 1, 2' in result.output
+
+        result = runner.invoke(cli, ['--db', initialized_db, 'db', 'dedupe-notion-ids', '--force'])
+        assert result.exit_code == 0
+        assert '1件のRunの紐付けを解除しました' in result.output
+
+        result = runner.invoke(cli, ['--db', initialized_db, 'db', 'status'])
+        assert result.exit_code == 0
+
     def test_db_cleanup_dry_run(self, runner, initialized_db):
         """ドライランモードでのクリーンアップをテストします."""
         result = runner.invoke(cli, [
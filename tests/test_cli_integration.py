@@ -77,6 +77,18 @@ class TestCLIIntegration:
             ])
             assert result.exit_code == 0
             assert '1件のYAMLファイルを正常に読み込みました' in result.output
+
+            # 一覧・検索でモデル名が表示される（関連は先読みされる）
+            for args in (['run', 'list'], ['search', 'prompt', 'integration']):
+                result = runner.invoke(cli, ['--db', temp_db, *args])
+                assert result.exit_code == 0, result.output
+                assert 'integration_tes' in result.output
+
+            # 詳細ではモデル名とLoRA名が表示される
+            result = runner.invoke(cli, ['--db', temp_db, 'run', 'show', '1'])
+            assert result.exit_code == 0, result.output
+            assert 'integration_test_model.safetensors' in result.output
+            assert 'test_lora' in result.output
             
             # 5. データベースステータス確認
             result = runner.invoke(cli, ['--db', temp_db, 'db', 'status'])
@@ -241,7 +241,7 @@ class TestNotionCLI:
         assert result.exit_code == 0
         assert '✅ 同期完了' in result.output
         assert 'from' in result.output
-        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'from', False)
+        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'from', False, False)
 
     @SKIP_INTEGRATION_TESTS
     @patch('src.cli.notion._sync_async')
@@ -268,7 +268,7 @@ class TestNotionCLI:
         
         assert result.exit_code == 0
         assert '✅ 同期完了' in result.output
-        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'to', False)
+        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'to', False, False)
 
     @SKIP_INTEGRATION_TESTS
     @patch('src.cli.notion._sync_async')
@@ -295,7 +295,7 @@ class TestNotionCLI:
         
         assert result.exit_code == 0
         assert '✅ 同期完了' in result.output
-        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'both', False)
+        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'both', False, False)
 
     @SKIP_INTEGRATION_TESTS
     @patch('src.cli.notion._sync_async')
@@ -323,7 +323,7 @@ class TestNotionCLI:
         assert result.exit_code == 0
         assert '🔍 ドライランモード' in result.output
         assert '✅ 同期完了 (ドライラン)' in result.output
-        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'both', True)
+        mock_sync.assert_called_once_with('test_api_key', 'test_db_id', 'both', True, False)
 
     @SKIP_INTEGRATION_TESTS
     @patch('src.cli.notion._sync_async')
@@ -6,30 +6,59 @@
 
 import os
 import tempfile
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
+from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import create_engine, event, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 
-from src.models.database import Base, Image, Model, Run, RunLora, RunTag, Tag
+from src.models.database import (
+    Base,
+    Image,
+    Model,
+    Run,
+    RunLora,
+    RunTag,
+    Tag,
+    bulk_insert_run_loras,
+    bulk_insert_run_tags,
+    bulk_insert_runs,
+    upsert_runs,
+)
 from src.utils.db_init import (
+    POOL_MAX_OVERFLOW,
+    POOL_SIZE,
+    POOL_TIMEOUT,
+    DatabaseInitError,
     create_engine_for_database,
+    create_indexes,
+    find_duplicate_notion_ids,
+    get_sqlite_pragmas,
     initialize_database,
+    optimize_on_checkin,
+    reset_engine_cache,
+    unlink_duplicate_notion_ids,
     verify_database_setup,
 )
 from src.utils.db_utils import (
     DatabaseManager,
     create_run_with_loras,
-    get_images_for_run,
+    export_runs_with_relations,
+    get_images_for_runs,
     get_loras_for_run,
+    get_loras_for_runs,
     get_models_by_type,
     get_recent_runs,
     get_runs_by_status,
     get_tags_for_run,
+    get_tags_for_runs,
     search_runs_by_prompt,
 )
 
@@ -101,6 +130,19 @@ class TestDatabaseModels:
         assert isinstance(model.created_at, datetime)
         assert isinstance(model.updated_at, datetime)
 
+    def test_updated_at_set_on_bulk_update(self, db_manager, sample_run_data):
+        """一括UPDATEでもupdated_atが自動更新されることをテストします."""
+        old_timestamp = datetime(2000, 1, 1)
+        run = db_manager.create_record(Run, updated_at=old_timestamp, **sample_run_data)
+        assert run.updated_at == old_timestamp
+
+        with db_manager.get_session() as session:
+            session.execute(update(Run).values(status="Final"))
+
+        updated = db_manager.get_record_by_id(Run, run.run_id)
+        assert updated.status == "Final"
+        assert updated.updated_at > old_timestamp
+
     def test_model_unique_constraint(self, db_manager, sample_model_data):
         """Modelの名前のユニーク制約をテストします."""
         db_manager.create_record(Model, **sample_model_data)
@@ -153,6 +195,48 @@ class TestDatabaseModels:
         assert image.width == 512
         assert image.height == 768
 
+    def test_image_hash_stored_as_binary(self, db_manager, sample_run_data):
+        """Image.hashがバイナリで格納され、16進数文字列で取得できることをテストします."""
+        import hashlib
+
+        run = db_manager.create_record(Run, **sample_run_data)
+        digest = hashlib.sha256(b"image bytes").hexdigest()
+
+        image = db_manager.create_record(
+            Image, run_id=run.run_id, filename="a.png", filepath="/test/a.png", hash=digest
+        )
+        assert image.hash == digest
+
+        with db_manager.get_session() as session:
+            raw = session.execute(
+                text("SELECT hash FROM images WHERE image_id = :id"), {"id": image.image_id}
+            ).scalar()
+            assert raw == bytes.fromhex(digest)
+            assert len(raw) == 32
+
+            # 16進数文字列での検索もバイナリ比較で一致する
+            found = session.query(Image).filter(Image.hash == digest).one()
+            assert found.image_id == image.image_id
+
+    def test_notion_page_id_stored_as_binary(self, db_manager, sample_run_data):
+        """Run.notion_page_idが16バイトで格納され、UUID文字列で取得できることをテストします."""
+        page_id = "1429989f-e8ac-4eff-bc8f-57f56486db54"
+
+        run = db_manager.create_record(Run, notion_page_id=page_id, **sample_run_data)
+        assert run.notion_page_id == page_id
+
+        with db_manager.get_session() as session:
+            raw = session.execute(
+                text("SELECT notion_page_id FROM runs WHERE run_id = :id"), {"id": run.run_id}
+            ).scalar()
+            assert raw == uuid.UUID(page_id).bytes
+
+            # ハイフンなしの形式でも同じ値として検索できる
+            found = session.query(Run).filter(
+                Run.notion_page_id == page_id.replace("-", "")
+            ).one()
+            assert found.run_id == run.run_id
+
     def test_tag_creation(self, db_manager):
         """Tagの作成をテストします."""
         tag_data = {
@@ -165,6 +249,38 @@ class TestDatabaseModels:
         assert tag.name == "portrait"
         assert tag.category == "style"
 
+    def test_to_dict_covers_all_columns(self, db_manager, sample_model_data):
+        """to_dictがテーブルの全カラムを含み、日時を文字列化することをテストします."""
+        model = db_manager.create_record(Model, **sample_model_data)
+        data = model.to_dict()
+
+        assert list(data) == [column.key for column in Model.__table__.columns]
+        assert data["name"] == sample_model_data["name"]
+        assert data["created_at"] == model.created_at.isoformat()
+        assert data["updated_at"] == model.updated_at.isoformat()
+
+    def test_to_dict_cache_invalidated_on_change(self, db_manager):
+        """to_dictのキャッシュが再利用され、属性変更時に破棄されることをテストします."""
+        with db_manager.get_session() as session:
+            tag = Tag(name="portrait", category="style")
+            session.add(tag)
+            assert tag.to_dict()["created_at"] is None
+
+            # flush後はDB側で設定された値が反映される
+            session.flush()
+            first = tag.to_dict()
+            assert first["tag_id"] == tag.tag_id
+            assert first["created_at"] is not None
+
+            # 返り値を変更してもキャッシュには影響しない
+            cache = tag.__dict__["_dict_cache"]
+            first["name"] = "changed"
+            assert tag.to_dict()["name"] == "portrait"
+            assert tag.__dict__["_dict_cache"] is cache
+
+            tag.category = "character"
+            assert tag.to_dict()["category"] == "character"
+
     def test_run_lora_relationship(self, db_manager, sample_model_data, sample_run_data):
         """RunLoRAの多対多関連をテストします."""
         # チェックポイントモデルを作成
@@ -226,6 +342,121 @@ class TestDatabaseInitialization:
             if "DATABASE_PATH" in os.environ:
                 del os.environ["DATABASE_PATH"]
 
+    def test_notion_lookup_indexes_created(self, temp_db_path):
+        """Notion同期の検索用インデックスが作成されることをテストします."""
+        engine = initialize_database(temp_db_path)
+
+        with engine.connect() as conn:
+            index_names = {
+                row[0] for row in conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'index'")
+                )
+            }
+            plan = conn.execute(text(
+                "EXPLAIN QUERY PLAN SELECT run_id FROM runs WHERE notion_id = 'page'"
+            )).fetchall()
+        engine.dispose()
+
+        assert {
+            "idx_runs_notion_page_id",
+            "uq_runs_notion_id",
+            "idx_runs_model_status",
+            "idx_runs_title",
+        } <= index_names
+        assert "uq_runs_notion_id" in " ".join(str(row[-1]) for row in plan)
+
+    def test_unique_notion_index_with_duplicate_runs(self, temp_db_path):
+        """重複したnotion_idを持つ既存DBでは、解除するまで一意インデックスを作成しないことをテストします."""
+        engine = create_engine_for_database(temp_db_path)
+        Base.metadata.create_all(engine)
+        with sessionmaker(bind=engine)() as session:
+            session.add_all([
+                Run(title=f"Run {i}", prompt="p", notion_id=notion_id)
+                for i, notion_id in enumerate(["page-1", "page-1", "page-2", "", "page-1"])
+            ])
+            session.commit()
+
+        # 重複は自動で解除せず、該当するrun_idを示してエラーにする
+        with pytest.raises(DatabaseInitError, match=r"page-1: run_id 1, 2, 5"):
+            create_indexes(engine)
+        assert find_duplicate_notion_ids(engine) == {"page-1": [1, 2, 5]}
+
+        assert unlink_duplicate_notion_ids(engine) == {"page-1": [2, 5]}
+        create_indexes(engine)
+
+        with engine.connect() as conn:
+            notion_ids = conn.execute(
+                text("SELECT notion_id FROM runs ORDER BY run_id")
+            ).scalars().all()
+            with pytest.raises(IntegrityError):
+                conn.execute(text(
+                    "INSERT INTO runs (title, prompt, cfg, steps, sampler, width, height, "
+                    "batch_size, status, notion_id, created_at, updated_at) VALUES "
+                    "('Dup', 'p', 7, 20, 'Euler', 1024, 1024, 1, 'Tried', 'page-1', "
+                    "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ))
+        engine.dispose()
+
+        assert notion_ids == ["page-1", None, "page-2", None, None]
+
+    def test_initialization_converts_text_notion_page_ids(self, temp_db_path):
+        """TEXTで格納された既存のnotion_page_idが初期化時にバイナリへ変換されることをテストします."""
+        page_id = "1429989f-e8ac-4eff-bc8f-57f56486db54"
+        engine = create_engine_for_database(temp_db_path)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for title, value in [("Legacy", page_id), ("Invalid", "not-a-uuid")]:
+                conn.execute(text(
+                    "INSERT INTO runs (title, prompt, cfg, steps, sampler, width, height, "
+                    "batch_size, status, notion_page_id, created_at, updated_at) VALUES "
+                    "(:title, 'p', 7, 20, 'Euler', 1024, 1024, 1, 'Tried', :value, "
+                    "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+                ), {"title": title, "value": value})
+        engine.dispose()
+
+        engine = initialize_database(temp_db_path)
+        with engine.connect() as conn:
+            stored = dict(conn.execute(text("SELECT title, notion_page_id FROM runs")).all())
+            version = conn.execute(text("PRAGMA user_version")).scalar()
+        with sessionmaker(bind=engine)() as session:
+            found = session.query(Run).filter(Run.notion_page_id == page_id).one()
+        engine.dispose()
+
+        assert stored == {"Legacy": uuid.UUID(page_id).bytes, "Invalid": "not-a-uuid"}
+        assert version > 0
+        assert found.title == "Legacy"
+
+    def test_initialization_converts_text_image_hashes(self, temp_db_path):
+        """TEXTで格納された既存のImage.hashが初期化時にバイナリへ変換されることをテストします."""
+        import hashlib
+
+        digest = hashlib.sha256(b"legacy image").hexdigest()
+        engine = initialize_database(temp_db_path)
+        with engine.begin() as conn:
+            # バイナリ型の導入前に作成されたデータベースを再現する
+            conn.execute(text("PRAGMA user_version = 1"))
+            conn.execute(text(
+                "INSERT INTO runs (run_id, title, prompt, cfg, steps, sampler, width, height, "
+                "batch_size, status, created_at, updated_at) VALUES "
+                "(1, 'Legacy', 'p', 7, 20, 'Euler', 1024, 1024, 1, 'Tried', "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ))
+            conn.execute(text(
+                "INSERT INTO images (run_id, filename, filepath, hash, created_at) "
+                "VALUES (1, 'a.png', '/test/a.png', :hash, CURRENT_TIMESTAMP)"
+            ), {"hash": digest})
+        engine.dispose()
+
+        engine = initialize_database(temp_db_path)
+        with engine.connect() as conn:
+            raw = conn.execute(text("SELECT hash FROM images")).scalar()
+        with sessionmaker(bind=engine)() as session:
+            found = session.query(Image).filter(Image.hash == digest).one()
+        engine.dispose()
+
+        assert raw == bytes.fromhex(digest)
+        assert found.filename == "a.png"
+
     def test_create_engine_for_database(self, temp_db_path):
         """エンジン作成をテストします."""
         engine = create_engine_for_database(temp_db_path)
@@ -236,6 +467,160 @@ class TestDatabaseInitialization:
             result = conn.execute(text("PRAGMA foreign_keys"))
             assert result.fetchone()[0] == 1
 
+    def test_engine_pool_configuration(self, temp_db_path):
+        """エンジンのコネクションプール設定をテストします."""
+        engine = create_engine_for_database(temp_db_path)
+
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == POOL_SIZE
+        assert engine.pool._max_overflow == POOL_MAX_OVERFLOW
+        assert engine.pool._timeout == POOL_TIMEOUT
+        engine.dispose()
+
+    def test_connections_reused_across_sessions(self, db_manager):
+        """DatabaseManagerの呼び出し間でDBAPI接続が再利用されることをテストします."""
+        connections = []
+        for _ in range(3):
+            with db_manager.get_session() as session:
+                connections.append(session.connection().connection.dbapi_connection)
+            db_manager.get_records(Run)
+
+        assert len(set(map(id, connections))) == 1
+        assert db_manager.engine.pool.checkedin() == 1
+
+    def test_read_session_uses_read_only_engine(self, db_manager, sample_run_data):
+        """参照系が読み取り専用エンジンで実行され、書き込みは拒否されることをテストします."""
+        assert db_manager.read_engine is not db_manager.engine
+
+        run = db_manager.create_record(Run, **sample_run_data)
+        # コミット済みのデータは読み取り専用セッションから参照できる
+        assert db_manager.get_record_by_id(Run, run.run_id).title == run.title
+
+        with db_manager.get_read_session() as session:
+            assert session.execute(text("PRAGMA query_only")).scalar() == 1
+            session.add(Tag(name="read_only"))
+            with pytest.raises(OperationalError):
+                session.flush()
+
+    def test_engines_shared_per_database_path(self, temp_db_path):
+        """同じファイルのDatabaseManagerはエンジンを共有し、インメモリDBは共有しないことをテストします."""
+        first = DatabaseManager(temp_db_path)
+        second = DatabaseManager(temp_db_path)
+        assert second.engine is first.engine
+        assert second.read_engine is first.read_engine
+
+        assert DatabaseManager(":memory:").engine is not DatabaseManager(":memory:").engine
+
+    def test_manager_construction_skips_initialization(self, temp_db_path):
+        """初期化済みのパスではDatabaseManagerの作成でSQLを実行しないことをテストします."""
+        first = DatabaseManager(temp_db_path)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(first.engine, "before_cursor_execute", record)
+        try:
+            DatabaseManager(temp_db_path)
+        finally:
+            event.remove(first.engine, "before_cursor_execute", record)
+        assert statements == []
+
+        # キャッシュをリセットすると新しいエンジンで初期化し直す
+        reset_engine_cache()
+        assert DatabaseManager(temp_db_path).engine is not first.engine
+
+    def test_schema_created_in_single_transaction(self, temp_db_path):
+        """スキーマ作成が1回のコミットで完了することをテストします."""
+        commits = []
+
+        def record(conn):
+            commits.append(conn)
+
+        event.listen(Engine, "commit", record)
+        try:
+            engine = initialize_database(temp_db_path)
+        finally:
+            event.remove(Engine, "commit", record)
+
+        try:
+            assert len(commits) == 1
+            assert verify_database_setup(engine)
+        finally:
+            engine.dispose()
+
+    def test_create_indexes_skips_existing(self, temp_db_path):
+        """インデックスが揃っている場合はCREATE文を実行しないことをテストします."""
+        engine = initialize_database(temp_db_path)
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            create_indexes(engine)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+            engine.dispose()
+
+        assert not [sql for sql in statements if sql.lstrip().upper().startswith("CREATE")]
+
+    def test_optimize_on_checkin_runs_periodically(self, monkeypatch):
+        """PRAGMA optimize が接続ごとに一定間隔でのみ実行されることをテストします."""
+        dbapi_connection = MagicMock()
+        connection_record = MagicMock(info={})
+
+        optimize_on_checkin(dbapi_connection, connection_record)
+        dbapi_connection.execute.assert_not_called()
+
+        monkeypatch.setattr("src.utils.db_init.OPTIMIZE_INTERVAL_SECONDS", 0)
+        optimize_on_checkin(dbapi_connection, connection_record)
+        dbapi_connection.execute.assert_called_once_with("PRAGMA optimize")
+
+    def test_close_keeps_manager_usable(self, db_manager, sample_run_data):
+        """close()後も新しい接続で操作を続けられることをテストします."""
+        db_manager.close()
+        assert db_manager.create_record(Run, **sample_run_data).run_id is not None
+
+    def test_sqlite_pragmas_applied_per_connection(self, temp_db_path):
+        """WALなどのPRAGMAがすべての接続に適用されることをテストします."""
+        engine = create_engine_for_database(temp_db_path)
+
+        # プールから複数の接続を同時に取得して、それぞれの設定を確認
+        with engine.connect() as conn1, engine.connect() as conn2:
+            for conn in (conn1, conn2):
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                # synchronous=NORMAL は 1
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+                assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+
+    def test_sqlite_cache_pragmas_overridable_by_env(self, temp_db_path, monkeypatch):
+        """mmap_size・cache_sizeが環境変数で上書きできることをテストします."""
+        monkeypatch.setenv("SQLITE_MMAP_SIZE", "0")
+        monkeypatch.setenv("SQLITE_CACHE_KIB", "1024")
+        engine = create_engine_for_database(temp_db_path)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA mmap_size")).scalar() == 0
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -1024
+            # temp_store=MEMORY は 2
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+        engine.dispose()
+
+        monkeypatch.setenv("SQLITE_CACHE_KIB", "large")
+        with pytest.raises(ValueError):
+            get_sqlite_pragmas()
+
+    def test_in_memory_database_shares_connection(self):
+        """インメモリDBではすべてのセッションが同じデータベースを参照することをテストします."""
+        db_manager = DatabaseManager(":memory:")
+
+        run = db_manager.create_record(Run, title="memory", prompt="p")
+        assert db_manager.get_record_by_id(Run, run.run_id).title == "memory"
+        db_manager.engine.dispose()
+
     def test_verify_database_setup(self, db_manager):
         """データベースセットアップ検証をテストします."""
         assert verify_database_setup(db_manager.engine)
@@ -270,6 +655,29 @@ class TestDatabaseUtilities:
         deleted_model = db_manager.get_record_by_id(Model, model.model_id)
         assert deleted_model is None
 
+    def test_writes_skip_refresh_select(self, db_manager, sample_model_data):
+        """作成・更新でデフォルト値の再取得用SELECTが発行されないことをテストします."""
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.lstrip().split(None, 1)[0].upper())
+
+        event.listen(db_manager.engine, "before_cursor_execute", record)
+        try:
+            model = db_manager.create_record(Model, **sample_model_data)
+            created = list(statements)
+            statements.clear()
+            updated = db_manager.update_record(Model, model.model_id, notes="Updated")
+        finally:
+            event.remove(db_manager.engine, "before_cursor_execute", record)
+
+        assert created == ["INSERT"]
+        # 対象の取得1回とUPDATEのみ
+        assert statements == ["SELECT", "UPDATE"]
+        # 切り離し後もデフォルト値にアクセスできる
+        assert model.created_at is not None
+        assert updated.updated_at is not None
+
     def test_get_records_with_filters(self, db_manager, sample_model_data):
         """フィルタ付きレコード取得をテストします."""
         # 複数のモデルを作成
@@ -345,6 +753,28 @@ class TestDatabaseUtilities:
         assert len(landscape_runs) == 1
         assert "landscape" in landscape_runs[0].prompt
 
+    def test_search_runs_uses_fts_index(self, db_manager, sample_run_data):
+        """全文検索インデックスがRunの変更に追従することをテストします."""
+        if not db_manager.has_search_index:
+            pytest.skip("SQLite FTS5 trigram tokenizer is not available")
+
+        run_data = sample_run_data.copy()
+        run_data["prompt"] = 'masterpiece, "Mountain" landscape'
+        run = db_manager.create_record(Run, **run_data)
+
+        # 大文字小文字を区別しない部分一致、引用符を含む検索語
+        assert [r.run_id for r in search_runs_by_prompt(db_manager, "LANDSCAP")] == [run.run_id]
+        assert len(search_runs_by_prompt(db_manager, '"Mountain"')) == 1
+        # trigramで扱えない短い語はLIKEで検索される
+        assert len(search_runs_by_prompt(db_manager, "ma")) == 1
+
+        db_manager.update_record(Run, run.run_id, prompt="portrait")
+        assert search_runs_by_prompt(db_manager, "landscape") == []
+        assert len(search_runs_by_prompt(db_manager, "portrait")) == 1
+
+        db_manager.delete_record(Run, run.run_id)
+        assert search_runs_by_prompt(db_manager, "portrait") == []
+
     def test_create_run_with_loras(self, db_manager, sample_model_data, sample_run_data):
         """LoRA付き実行履歴作成をテストします."""
         # モデルを作成
@@ -354,23 +784,69 @@ class TestDatabaseUtilities:
         lora_data["name"] = "test_lora"
         lora_data["type"] = "lora"
         lora_model = db_manager.create_record(Model, **lora_data)
+        lora_data["name"] = "test_lora_2"
+        lora_model_2 = db_manager.create_record(Model, **lora_data)
         
         # LoRA設定
         lora_configs = [
-            {"lora_id": lora_model.model_id, "weight": 0.8}
+            {"lora_id": lora_model.model_id, "weight": 0.8},
+            {"lora_id": lora_model_2.model_id},
         ]
         
+        inserts = []
+
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
         # LoRA付き実行履歴を作成
         sample_run_data["model_id"] = checkpoint_model.model_id
-        run = create_run_with_loras(db_manager, sample_run_data, lora_configs)
+        event.listen(db_manager.engine, "before_cursor_execute", count_inserts)
+        try:
+            run = create_run_with_loras(db_manager, sample_run_data, lora_configs)
+        finally:
+            event.remove(db_manager.engine, "before_cursor_execute", count_inserts)
         
         assert run.run_id is not None
+        # Run本体 + LoRA関連付けの一括INSERT
+        assert len(inserts) == 2
         
         # LoRA関連付けが作成されているかチェック
-        loras = get_loras_for_run(db_manager, run.run_id)
-        assert len(loras) == 1
+        loras = sorted(get_loras_for_run(db_manager, run.run_id), key=lambda lora: lora.weight)
+        assert len(loras) == 2
         assert loras[0].lora_id == lora_model.model_id
         assert loras[0].weight == 0.8
+        assert loras[1].weight == 1.0
+
+    def test_get_relations_for_runs(self, db_manager, sample_model_data, sample_run_data):
+        """複数Runの関連データをrun_idごとにまとめて取得できることをテストします."""
+        lora_data = sample_model_data.copy()
+        lora_data["type"] = "lora"
+        lora_model = db_manager.create_record(Model, **lora_data)
+        tag = db_manager.create_record(Tag, name="batch_tag")
+
+        run_a = create_run_with_loras(
+            db_manager, sample_run_data.copy(), [{"lora_id": lora_model.model_id}]
+        )
+        run_b = db_manager.create_record(Run, **sample_run_data)
+        db_manager.create_record(RunTag, run_id=run_a.run_id, tag_id=tag.tag_id)
+        for i in range(2):
+            db_manager.create_record(
+                Image, run_id=run_b.run_id, filename=f"{i}.png", filepath=f"/test/{i}.png"
+            )
+
+        run_ids = [run_a.run_id, run_b.run_id]
+        images = get_images_for_runs(db_manager, run_ids)
+        loras = get_loras_for_runs(db_manager, run_ids)
+        tags = get_tags_for_runs(db_manager, run_ids)
+
+        assert {run_id: len(items) for run_id, items in images.items()} == {
+            run_a.run_id: 0, run_b.run_id: 2
+        }
+        assert [lora.lora_id for lora in loras[run_a.run_id]] == [lora_model.model_id]
+        assert loras[run_b.run_id] == []
+        assert [t.tag_id for t in tags[run_a.run_id]] == [tag.tag_id]
+        assert get_images_for_runs(db_manager, []) == {}
 
     def test_get_recent_runs(self, db_manager, sample_run_data):
         """最近の実行履歴取得をテストします."""
@@ -388,6 +864,142 @@ class TestDatabaseUtilities:
         for i in range(len(recent_runs) - 1):
             assert recent_runs[i].created_at >= recent_runs[i + 1].created_at
 
+    def test_column_projection_returns_rows(self, db_manager, sample_run_data):
+        """カラム指定の取得がORMインスタンスではなく行を返すことをテストします."""
+        for i in range(3):
+            run_data = sample_run_data.copy()
+            run_data["title"] = f"Run {i}"
+            db_manager.create_record(Run, **run_data)
+
+        rows = db_manager.get_records_core(
+            Run, ["run_id", "title"], filters={"status": "Tried"}, order_by="run_id", limit=2
+        )
+        assert [row.title for row in rows] == ["Run 0", "Run 1"]
+        assert not isinstance(rows[0], Run)
+
+        recent = get_recent_runs(db_manager, limit=1, columns=["title"])
+        assert recent[0].title == "Run 2"
+
+        found = search_runs_by_prompt(db_manager, "Run 1", columns=["run_id", "title"])
+        assert [row.title for row in found] == ["Run 1"]
+
+        with pytest.raises(ValueError):
+            db_manager.get_records_core(Run, ["no_such_column"])
+
+    def test_export_runs_with_relations(self, db_manager, sample_model_data, sample_run_data):
+        """関連データ付きエクスポートが固定回数のクエリで完了することをテストします."""
+        lora_data = sample_model_data.copy()
+        lora_data["name"] = "test_lora"
+        lora_data["type"] = "lora"
+        lora_model = db_manager.create_record(Model, **lora_data)
+        tag = db_manager.create_record(Tag, name="test_tag", category="style")
+
+        for i in range(3):
+            run_data = sample_run_data.copy()
+            run_data["title"] = f"Run {i}"
+            run = create_run_with_loras(
+                db_manager, run_data, [{"lora_id": lora_model.model_id, "weight": 0.5}]
+            )
+            db_manager.create_record(RunTag, run_id=run.run_id, tag_id=tag.tag_id)
+            db_manager.create_record(
+                Image, run_id=run.run_id, filename=f"{i}.png", filepath=f"/test/{i}.png"
+            )
+
+        statements = []
+
+        def count_statements(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        event.listen(db_manager.read_engine, "before_cursor_execute", count_statements)
+        try:
+            exported = export_runs_with_relations(db_manager)
+        finally:
+            event.remove(db_manager.read_engine, "before_cursor_execute", count_statements)
+
+        assert len(exported) == 3
+        for data in exported:
+            assert data["loras"] == ["test_lora"]
+            assert data["tags"] == ["test_tag"]
+            assert len(data["images"]) == 1
+
+        # Run本体 + loras + images + tags の4回（Run件数に依存しない）
+        assert len(statements) == 4
+
+    def test_bulk_insert_helpers(self, db_manager, sample_run_data):
+        """一括挿入ヘルパーで関連データ付きの実行履歴を作成できることをテストします."""
+        lora_model = db_manager.create_record(Model, name="bulk_lora", type="lora")
+        tag_ids = [
+            db_manager.create_record(Tag, name=name).tag_id for name in ("bulk_a", "bulk_b")
+        ]
+
+        with db_manager.get_session() as session:
+            run_rows = []
+            for i in range(5):
+                run_data = sample_run_data.copy()
+                run_data["title"] = f"Bulk {i}"
+                run_rows.append(run_data)
+            run_ids = bulk_insert_runs(session, run_rows)
+
+            lora_rows = [
+                {"run_id": run_id, "lora_id": lora_model.model_id, "weight": 0.5}
+                for run_id in run_ids
+            ]
+            bulk_insert_run_loras(session, lora_rows)
+            # 重複した関連付けは無視される
+            bulk_insert_run_loras(session, lora_rows)
+            bulk_insert_run_tags(session, [
+                {"run_id": run_ids[0], "tag_id": tag_id} for tag_id in tag_ids
+            ])
+
+        assert len(run_ids) == 5
+        assert bulk_insert_runs(session, []) == []
+
+        runs = db_manager.get_records(Run, order_by="run_id")
+        assert [run.title for run in runs] == [f"Bulk {i}" for i in range(5)]
+        assert [run.run_id for run in runs] == run_ids
+        assert len(db_manager.get_records(RunLora)) == 5
+        assert len(get_tags_for_run(db_manager, run_ids[0])) == 2
+
+    def test_bulk_insert_runs_in_chunks(self, db_manager, sample_run_data, monkeypatch):
+        """一括挿入がチャンク単位で実行され、主キーの順序が保たれることをテストします."""
+        monkeypatch.setattr("src.models.database.BULK_INSERT_CHUNK_SIZE", 2)
+
+        rows = []
+        for i in range(5):
+            run_data = sample_run_data.copy()
+            run_data["title"] = f"Chunk {i}"
+            rows.append(run_data)
+
+        with db_manager.get_session() as session:
+            run_ids = bulk_insert_runs(session, rows)
+
+        assert len(run_ids) == 5
+        runs = db_manager.get_records(Run, order_by="run_id")
+        assert [run.run_id for run in runs] == run_ids
+        assert [run.title for run in runs] == [f"Chunk {i}" for i in range(5)]
+
+    def test_upsert_runs_by_notion_id(self, db_manager, sample_run_data):
+        """notion_idをキーにINSERTとUPDATEが1文で振り分けられることをテストします."""
+        first = dict(sample_run_data, title="Original", notion_id="page-1")
+        with db_manager.get_session() as session:
+            [run_id] = upsert_runs(session, [first])
+
+        rows = [
+            dict(sample_run_data, title="Updated", notion_id="page-1"),
+            dict(sample_run_data, title="New", notion_id="page-2"),
+        ]
+        with db_manager.get_session() as session:
+            run_ids = upsert_runs(session, rows)
+
+        assert run_ids[0] == run_id
+        runs = db_manager.get_records(Run, order_by="run_id")
+        assert [(run.notion_id, run.title) for run in runs] == [
+            ("page-1", "Updated"),
+            ("page-2", "New"),
+        ]
+        assert runs[1].run_id == run_ids[1]
+
     def test_cascade_deletion(self, db_manager, sample_run_data):
         """カスケード削除をテストします."""
         # 実行履歴を作成
@@ -418,7 +1030,7 @@ class TestErrorHandling:
         if "DATABASE_PATH" in os.environ:
             del os.environ["DATABASE_PATH"]
         
-        with pytest.raises(Exception, match="Database initialization failed"):
+        with pytest.raises(DatabaseInitError, match="Database initialization failed"):
             DatabaseManager()
 
     def test_invalid_record_id(self, db_manager):
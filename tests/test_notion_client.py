@@ -1,11 +1,14 @@
 """Tests for Notion API client."""
 
 import asyncio
+import time
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timezone
 
 from src.notion_client import (
+    MAX_BACKOFF_SECONDS,
     NotionClient,
     NotionRateLimiter,
     NotionAPIError,
@@ -67,13 +70,27 @@ class TestNotionRateLimiter:
         assert len(limiter.requests) == 1
 
 
+    @pytest.mark.asyncio
+    async def test_rate_limiter_ignores_wall_clock_changes(self):
+        """Test that rate limiter uses a monotonic clock and bounded history."""
+        limiter = NotionRateLimiter(max_requests=2, time_window=0.1)
+
+        # A wall clock jump must not affect the sliding window
+        with patch("src.notion_client.time.time", return_value=0.0):
+            for _ in range(5):
+                await limiter.wait_if_needed()
+
+        assert len(limiter.requests) == 2
+        assert list(limiter.requests) == sorted(limiter.requests)
+
+
 class TestNotionClient:
     """Test Notion client functionality."""
 
     @pytest.fixture
     def mock_notion_client(self):
         """Create a mock Notion client."""
-        with patch('src.notion_client.Client') as mock_client:
+        with patch('src.notion_client.AsyncClient') as mock_client:
             yield mock_client
 
     @pytest.fixture
@@ -99,7 +116,7 @@ class TestNotionClient:
     async def test_get_database_info_success(self, notion_client):
         """Test successful database info retrieval."""
         mock_response = {"id": "test_db_id", "title": [{"plain_text": "Test DB"}]}
-        notion_client.client.databases.retrieve = MagicMock(return_value=mock_response)
+        notion_client.client.databases.retrieve = AsyncMock(return_value=mock_response)
         
         result = await notion_client.get_database_info()
         
@@ -113,7 +130,7 @@ class TestNotionClient:
             "results": [{"id": "page1"}, {"id": "page2"}],
             "has_more": False
         }
-        notion_client.client.databases.query = MagicMock(return_value=mock_response)
+        notion_client.client.databases.query = AsyncMock(return_value=mock_response)
         
         result = await notion_client.get_database_pages()
         
@@ -130,7 +147,7 @@ class TestNotionClient:
             "results": [{"id": "page1"}],
             "has_more": False
         }
-        notion_client.client.databases.query = MagicMock(return_value=mock_response)
+        notion_client.client.databases.query = AsyncMock(return_value=mock_response)
         
         result = await notion_client.get_database_pages(start_cursor="cursor123")
         
@@ -148,7 +165,7 @@ class TestNotionClient:
             "results": [{"id": "page1"}, {"id": "page2"}],
             "has_more": False
         }
-        notion_client.client.databases.query = MagicMock(return_value=mock_response)
+        notion_client.client.databases.query = AsyncMock(return_value=mock_response)
         
         result = await notion_client.get_all_pages()
         
@@ -170,7 +187,7 @@ class TestNotionClient:
                 "has_more": False
             }
         ]
-        notion_client.client.databases.query = MagicMock(side_effect=mock_responses)
+        notion_client.client.databases.query = AsyncMock(side_effect=mock_responses)
         
         result = await notion_client.get_all_pages()
         
@@ -184,7 +201,7 @@ class TestNotionClient:
         """Test successful page creation."""
         properties = {"Title": {"title": [{"text": {"content": "Test"}}]}}
         mock_response = {"id": "new_page_id", "url": "https://notion.so/new_page"}
-        notion_client.client.pages.create = MagicMock(return_value=mock_response)
+        notion_client.client.pages.create = AsyncMock(return_value=mock_response)
         
         result = await notion_client.create_page(properties)
         
@@ -199,7 +216,7 @@ class TestNotionClient:
         """Test successful page update."""
         properties = {"Title": {"title": [{"text": {"content": "Updated"}}]}}
         mock_response = {"id": "page_id", "url": "https://notion.so/page"}
-        notion_client.client.pages.update = MagicMock(return_value=mock_response)
+        notion_client.client.pages.update = AsyncMock(return_value=mock_response)
         
         result = await notion_client.update_page("page_id", properties)
         
@@ -213,7 +230,7 @@ class TestNotionClient:
     async def test_delete_page_success(self, notion_client):
         """Test successful page deletion."""
         mock_response = {"id": "page_id", "archived": True}
-        notion_client.client.pages.update = MagicMock(return_value=mock_response)
+        notion_client.client.pages.update = AsyncMock(return_value=mock_response)
         
         result = await notion_client.delete_page("page_id")
         
@@ -227,13 +244,43 @@ class TestNotionClient:
     async def test_get_page_success(self, notion_client):
         """Test successful page retrieval."""
         mock_response = {"id": "page_id", "properties": {}}
-        notion_client.client.pages.retrieve = MagicMock(return_value=mock_response)
+        notion_client.client.pages.retrieve = AsyncMock(return_value=mock_response)
         
         result = await notion_client.get_page("page_id")
         
         assert result == mock_response
         notion_client.client.pages.retrieve.assert_called_once_with(page_id="page_id")
 
+    @pytest.mark.asyncio
+    async def test_http_client_shared_and_closed(self, mock_notion_client):
+        """Test a single keep-alive HTTP client is reused and closed on exit."""
+        async with NotionClient(api_key="test_key", database_id="test_db_id") as client:
+            http_client = client._http_client
+            assert isinstance(http_client, httpx.AsyncClient)
+            assert mock_notion_client.call_args.kwargs["client"] is http_client
+            assert not http_client.is_closed
+
+        assert http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_sdk_supports_database_query(self):
+        """Test the installed SDK still provides the databases.query endpoint."""
+        async with NotionClient(api_key="test_key", database_id="test_db_id") as client:
+            assert callable(client.client.databases.query)
+
+    @pytest.mark.asyncio
+    async def test_client_method_resolved_once(self, notion_client):
+        """Test dotted method paths are resolved once and cached."""
+        retrieve = AsyncMock(return_value={"id": "page_id"})
+        notion_client.client.pages.retrieve = retrieve
+
+        await notion_client.get_page("page_id")
+        notion_client.client.pages.retrieve = AsyncMock()
+        await notion_client.get_page("page_id")
+
+        assert notion_client._method_cache["pages.retrieve"] is retrieve
+        assert retrieve.call_count == 2
+
     @pytest.mark.asyncio
     async def test_test_connection_success(self, notion_client):
         """Test successful connection test."""
@@ -241,7 +288,7 @@ class TestNotionClient:
             "id": "test_db_id",
             "title": [{"plain_text": "Test Database"}]
         }
-        notion_client.client.databases.retrieve = MagicMock(return_value=mock_db_info)
+        notion_client.client.databases.retrieve = AsyncMock(return_value=mock_db_info)
         
         result = await notion_client.test_connection()
         
@@ -253,7 +300,7 @@ class TestNotionClient:
     @pytest.mark.asyncio
     async def test_test_connection_failure(self, notion_client):
         """Test failed connection test."""
-        notion_client.client.databases.retrieve = MagicMock(
+        notion_client.client.databases.retrieve = AsyncMock(
             side_effect=Exception("Connection failed")
         )
         
@@ -273,7 +320,7 @@ class TestNotionClient:
             message="Unauthorized"
         )
         mock_error.status = 401
-        notion_client.client.databases.retrieve = MagicMock(side_effect=mock_error)
+        notion_client.client.databases.retrieve = AsyncMock(side_effect=mock_error)
         
         with pytest.raises(NotionAuthenticationError):
             await notion_client.get_database_info()
@@ -288,7 +335,7 @@ class TestNotionClient:
             message="Forbidden"
         )
         mock_error.status = 403
-        notion_client.client.databases.retrieve = MagicMock(side_effect=mock_error)
+        notion_client.client.databases.retrieve = AsyncMock(side_effect=mock_error)
         
         with pytest.raises(NotionPermissionError):
             await notion_client.get_database_info()
@@ -303,17 +350,57 @@ class TestNotionClient:
             message="Rate limited"
         )
         mock_error.status = 429
-        notion_client.client.databases.retrieve = MagicMock(side_effect=mock_error)
+        notion_client.client.databases.retrieve = AsyncMock(side_effect=mock_error)
         
         with pytest.raises(NotionRateLimitError):
             await notion_client.get_database_info()
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_honors_retry_after(self, notion_client):
+        """Test 429 retries wait for the Retry-After duration."""
+        from notion_client.errors import HTTPResponseError
+
+        mock_error = HTTPResponseError(
+            response=httpx.Response(429, headers={"Retry-After": "0.05"}),
+            message="Rate limited"
+        )
+        notion_client.client.databases.retrieve = AsyncMock(
+            side_effect=[mock_error, {"id": "test_db_id"}]
+        )
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await notion_client.get_database_info()
+
+        assert result == {"id": "test_db_id"}
+        assert loop.time() - start >= 0.05
+        assert notion_client._retry_after(mock_error, attempt=3) == 0.05
+
+    def test_retry_after_falls_back_to_backoff(self):
+        """Test exponential backoff is used without a Retry-After header."""
+        error = MagicMock(headers={})
+        assert 4.0 <= NotionClient._retry_after(error, attempt=2) < 5.0
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test the retry backoff is capped and adds up to one second of jitter."""
+        with patch('src.notion_client.random.random', return_value=0.5):
+            assert NotionClient._backoff(0) == 1.5
+            assert NotionClient._backoff(10) == MAX_BACKOFF_SECONDS + 0.5
+
+    def test_rate_limiter_pause(self):
+        """Test pausing fills the window so the next request waits."""
+        limiter = NotionRateLimiter(max_requests=3, time_window=1.0)
+        limiter.pause(2.0)
+
+        assert len(limiter.requests) == 3
+        assert limiter.requests[0] > time.monotonic()
+
     @pytest.mark.asyncio
     async def test_timeout_error_handling(self, notion_client):
         """Test timeout error handling."""
         from notion_client.errors import RequestTimeoutError
         
-        notion_client.client.databases.retrieve = MagicMock(
+        notion_client.client.databases.retrieve = AsyncMock(
             side_effect=RequestTimeoutError("Timeout")
         )
         
@@ -330,7 +417,7 @@ class TestNotionClient:
             message="Server error"
         )
         mock_error.status = 500
-        notion_client.client.databases.retrieve = MagicMock(side_effect=mock_error)
+        notion_client.client.databases.retrieve = AsyncMock(side_effect=mock_error)
         
         with pytest.raises(NotionConnectionError):
             await notion_client.get_database_info()
@@ -348,7 +435,7 @@ class TestNotionClient:
         )
         mock_error.status = 500
         
-        notion_client.client.databases.retrieve = MagicMock(
+        notion_client.client.databases.retrieve = AsyncMock(
             side_effect=[mock_error, mock_response]
         )
         
@@ -383,6 +470,13 @@ class TestNotionClient:
         assert parsed.minute == 0
         assert parsed.second == 0
 
+    def test_parse_datetime_stdlib_fallback(self, notion_client):
+        """Test datetime parsing without ciso8601 yields an aware UTC datetime."""
+        with patch("src.notion_client._parse_iso_datetime", None):
+            parsed = notion_client.parse_datetime("2023-01-01T12:00:00.000Z")
+
+        assert parsed == datetime(2023, 1, 1, 12, 0, tzinfo=timezone.utc)
+
     def test_extract_text_from_rich_text(self, notion_client):
         """Test rich text extraction."""
         rich_text = [
@@ -394,6 +488,12 @@ class TestNotionClient:
         
         assert result == "Hello World"
 
+    def test_extract_text_from_rich_text_missing_plain_text(self, notion_client):
+        """Test rich text extraction tolerates objects without plain_text."""
+        rich_text = [{"plain_text": "Hello"}, {"type": "mention"}]
+
+        assert notion_client.extract_text_from_rich_text(rich_text) == "Hello"
+
     def test_extract_text_from_empty_rich_text(self, notion_client):
         """Test rich text extraction from empty list."""
         result = notion_client.extract_text_from_rich_text([])
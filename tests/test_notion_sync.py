@@ -1,16 +1,32 @@
 """Tests for Notion sync functionality."""
 
+import asyncio
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime, timezone
+from sqlalchemy import inspect as sa_inspect
+from datetime import datetime, timedelta, timezone
 
 from src.notion_sync import (
+    NOTION_SYNC_CONCURRENCY,
     NotionFieldMapper,
     NotionSyncManager,
     SyncStats,
+    _select_runs_for_sync,
 )
 from src.notion_client import NotionClient
-from src.models.database import Model, Tag, Run, RunLora, RunTag
+from src.models.database import Model, Tag, Run, RunLora, RunTag, SyncState
+from src.utils.db_utils import DatabaseManager
+
+
+def async_pages(pages, calls=None):
+    """Create a replacement for NotionClient.iter_pages yielding the given pages."""
+    async def iter_pages(filter=None):
+        if calls is not None:
+            calls.append(filter)
+        for page in pages:
+            yield page
+    return iter_pages
 
 
 class TestSyncStats:
@@ -31,6 +47,18 @@ class TestSyncStats:
         assert stats.errors == 0
 
 
+    def test_sync_stats_uses_slots(self):
+        """Test sync stats accept keyword counts and have no instance dict."""
+        stats = SyncStats(created_local=2)
+
+        assert stats.created_local == 2
+        assert stats == SyncStats(created_local=2)
+        assert stats != SyncStats()
+        assert "created_local=2" in repr(stats)
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(TypeError):
+            SyncStats(unknown=1)
+
 class TestNotionFieldMapper:
     """Test field mapping functionality."""
 
@@ -60,6 +88,15 @@ class TestNotionFieldMapper:
         assert field_mapper.REVERSE_MAPPING['title'] == 'Title'
         assert field_mapper.REVERSE_MAPPING['prompt'] == 'Prompt'
 
+        # Precomputed local -> Notion field lists stay in sync with the mapping
+        for fields in (
+            field_mapper._RICH_TEXT_FIELDS,
+            field_mapper._NUMBER_FIELDS,
+            field_mapper._SELECT_FIELDS,
+        ):
+            for local_field, notion_field in fields:
+                assert field_mapper.REVERSE_MAPPING[local_field] == notion_field
+
     def test_notion_to_local_title_field(self, field_mapper):
         """Test Notion to local conversion for title field."""
         notion_page = {
@@ -170,6 +207,55 @@ class TestNotionFieldMapper:
         
         assert result["created_at"] == "2023-01-01T12:00:00+00:00"
 
+    def test_notion_to_local_with_compiled_schema(self, field_mapper):
+        """Test conversion using a plan compiled from the database schema."""
+        field_mapper.compile_schema({
+            "Title": {"id": "title", "type": "title"},
+            "CFG": {"id": "a", "type": "number"},
+            "Sampler": {"id": "b", "type": "select"},
+            "Unmapped": {"id": "c", "type": "rich_text"},
+        })
+        field_mapper.notion_client.extract_text_from_rich_text.return_value = "Test Title"
+
+        notion_page = {
+            "id": "page_id",
+            "url": "https://notion.so/page_id",
+            "properties": {
+                "Title": {"type": "title", "title": [{"plain_text": "Test Title"}]},
+                "CFG": {"type": "number", "number": 7.5},
+                "Sampler": {"type": "select", "select": None},
+                # Not part of the compiled schema - ignored
+                "Prompt": {"type": "rich_text", "rich_text": []},
+            }
+        }
+
+        result = field_mapper.notion_to_local(notion_page)
+
+        assert result == {
+            "title": "Test Title",
+            "cfg": "7.5",
+            "sampler": "",
+            "notion_id": "page_id",
+            "notion_url": "https://notion.so/page_id",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_manager_compiles_schema_once(self):
+        """Test that the sync manager loads the database schema once."""
+        client = MagicMock()
+        client.iter_pages = async_pages([])
+        client.get_database_info = AsyncMock(return_value={
+            "properties": {"Title": {"type": "title"}}
+        })
+
+        with patch('src.notion_sync.DatabaseManager'):
+            sync_manager = NotionSyncManager(client)
+            await sync_manager.sync_from_notion()
+            await sync_manager.sync_from_notion()
+
+        client.get_database_info.assert_awaited_once()
+        assert sync_manager.field_mapper._compiled_fields[0][:2] == ("Title", "title")
+
     def test_local_to_notion_basic_fields(self, field_mapper):
         """Test local to Notion conversion for basic fields."""
         # Create a mock run
@@ -269,8 +355,35 @@ class TestNotionFieldMapper:
         assert result["Tags"]["multi_select"][0]["name"] == "anime"
         assert result["Tags"]["multi_select"][1]["name"] == "portrait"
 
-    def test_extract_methods(self, field_mapper):
-        """Test various extract methods."""
+    def test_local_to_notion_real_run(self, field_mapper):
+        """Test local to Notion conversion of an actual Run instance."""
+        run = Run(
+            title="Real Run",
+            prompt="a cat",
+            negative="blurry",
+            cfg=7.0,
+            steps=30,
+            sampler="Euler a",
+            seed=42,
+            width=1024,
+            height=1024,
+            status="Tried",
+        )
+        field_mapper.notion_client.create_rich_text.side_effect = lambda text: [
+            {"type": "text", "text": {"content": text}}
+        ]
+
+        result = field_mapper.local_to_notion(run)
+
+        assert result["Prompt"]["rich_text"][0]["text"]["content"] == "a cat"
+        assert result["Negative"]["rich_text"][0]["text"]["content"] == "blurry"
+        assert result["Width"]["number"] == 1024.0
+        assert result["Status"]["select"]["name"] == "Tried"
+        assert "Notes" not in result
+        assert "Model" not in result
+
+    def test_extract_and_convert_methods(self, field_mapper):
+        """Test the per-type property converters."""
         # Test _extract_title
         prop = {"title": [{"plain_text": "Test Title"}]}
         field_mapper.notion_client.extract_text_from_rich_text.return_value = "Test Title"
@@ -283,25 +396,27 @@ class TestNotionFieldMapper:
         result = field_mapper._extract_rich_text(prop)
         assert result == "Test Text"
         
-        # Test _extract_number
-        prop = {"number": 42}
-        result = field_mapper._extract_number(prop)
-        assert result == 42
-        
-        # Test _extract_select
-        prop = {"select": {"name": "Test Value"}}
-        result = field_mapper._extract_select(prop)
-        assert result == "Test Value"
-        
-        # Test _extract_multi_select
+        # Test _convert_number
+        assert field_mapper._convert_number({"number": 42}) == "42"
+        assert field_mapper._convert_number({"number": None}) == ""
+
+        # Test _convert_select
+        assert field_mapper._convert_select({"select": {"name": "Test Value"}}) == "Test Value"
+        assert field_mapper._convert_select({"select": None}) == ""
+
+        # Test _convert_multi_select
         prop = {"multi_select": [{"name": "Tag1"}, {"name": "Tag2"}]}
-        result = field_mapper._extract_multi_select(prop)
-        assert result == ["Tag1", "Tag2"]
-        
-        # Test _extract_url
-        prop = {"url": "https://example.com"}
-        result = field_mapper._extract_url(prop)
-        assert result == "https://example.com"
+        assert field_mapper._convert_multi_select(prop) == "Tag1, Tag2"
+
+        # Test _convert_url
+        assert field_mapper._convert_url({"url": "https://example.com"}) == "https://example.com"
+        assert field_mapper._convert_url({"url": None}) == ""
+
+        # Test _convert_datetime
+        field_mapper.notion_client.parse_datetime.return_value = datetime(2024, 1, 2, 3, 4, 5)
+        prop = {"created_time": "2024-01-02T03:04:05.000Z"}
+        assert field_mapper._convert_datetime(prop) == "2024-01-02T03:04:05"
+        assert field_mapper._convert_datetime({}) == ""
 
 
 class TestNotionSyncManager:
@@ -312,6 +427,7 @@ class TestNotionSyncManager:
         """Create a mock Notion client."""
         client = MagicMock()
         client.get_all_pages = AsyncMock()
+        client.iter_pages = async_pages([])
         client.create_page = AsyncMock()
         client.update_page = AsyncMock()
         return client
@@ -346,7 +462,7 @@ class TestNotionSyncManager:
     @pytest.mark.asyncio
     async def test_sync_from_notion_empty_database(self, sync_manager):
         """Test sync from Notion with empty database."""
-        sync_manager.notion_client.get_all_pages.return_value = []
+        sync_manager.notion_client.iter_pages = async_pages([])
         
         result = await sync_manager.sync_from_notion()
         
@@ -373,21 +489,46 @@ class TestNotionSyncManager:
             }
         ]
         
-        sync_manager.notion_client.get_all_pages.return_value = mock_pages
+        sync_manager.notion_client.iter_pages = async_pages(mock_pages)
         
-        with patch.object(sync_manager, '_sync_page_to_local') as mock_sync:
-            mock_sync.return_value = None
+        with patch.object(sync_manager, '_save_local_runs') as mock_save:
+            mock_save.return_value = None
             
             result = await sync_manager.sync_from_notion()
             
             assert result.total_notion_pages == 2
-            assert mock_sync.call_count == 2
+            mock_save.assert_called_once()
+            assert [d["notion_id"] for d in mock_save.call_args[0][0]] == ["page1", "page2"]
+
+    @pytest.mark.asyncio
+    async def test_incremental_sync_from_notion(self, mock_notion_client, mock_db_manager):
+        """Test incremental sync filters by the checkpoint and advances it."""
+        _, mock_session = mock_db_manager
+        checkpoint = datetime(2023, 1, 1, 12, 0, 0)
+        mock_session.get.return_value = SyncState(name="notion:db:from", last_sync_at=checkpoint)
+        mock_notion_client.database_id = "db"
+        mock_notion_client.format_datetime.return_value = "2023-01-01T12:00:00+00:00"
+        filters = []
+        mock_notion_client.iter_pages = async_pages([], calls=filters)
+
+        sync_manager = NotionSyncManager(mock_notion_client, incremental=True)
+        await sync_manager.sync_from_notion()
+
+        mock_session.get.assert_called_once_with(SyncState, "notion:db:from")
+        assert filters == [{
+            "timestamp": "last_edited_time",
+            "last_edited_time": {"on_or_after": "2023-01-01T12:00:00+00:00"}
+        }]
+        saved = mock_session.merge.call_args[0][0]
+        assert saved.name == "notion:db:from"
+        assert saved.last_sync_at > checkpoint
+        mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_sync_to_notion_empty_database(self, sync_manager):
         """Test sync to Notion with empty local database."""
         with patch.object(sync_manager.db_manager, 'get_session') as mock_session:
-            mock_session.return_value.__enter__.return_value.execute.return_value.scalars.return_value.all.return_value = []
+            mock_session.return_value.__enter__.return_value.execute.return_value.scalars.return_value.partitions.return_value = []
             
             result = await sync_manager.sync_to_notion()
             
@@ -396,16 +537,63 @@ class TestNotionSyncManager:
             assert result.updated_notion == 0
             assert result.errors == 0
 
+    @pytest.mark.asyncio
+    async def test_sync_to_notion_runs_db_work_off_event_loop(self, sync_manager):
+        """Test the runs query and commit do not block the event loop thread."""
+        loop_thread = threading.get_ident()
+        threads = []
+
+        with patch.object(sync_manager.db_manager, 'get_session') as mock_session:
+            session = mock_session.return_value.__enter__.return_value
+            session.execute.side_effect = lambda *_: threads.append(threading.get_ident()) or MagicMock()
+            session.commit.side_effect = lambda: threads.append(threading.get_ident())
+
+            result = await sync_manager.sync_to_notion()
+
+        assert result.errors == 0
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_sync_from_notion_runs_db_work_off_event_loop(self, sync_manager):
+        """Test lookups, upserts and the commit of an import do not block the event loop."""
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def record(*_args, **_kwargs):
+            threads.append(threading.get_ident())
+            return MagicMock()
+
+        def upsert(*_args):
+            threads.append(threading.get_ident())
+            return [1]
+
+        sync_manager.notion_client.iter_pages = async_pages([{"id": "page1", "properties": {}}])
+
+        with patch.object(sync_manager.db_manager, 'get_session') as mock_session, \
+                patch("src.notion_sync.upsert_runs", side_effect=upsert) as mock_upsert:
+            session = mock_session.return_value.__enter__.return_value
+            for method in ("get", "execute", "merge", "flush", "commit"):
+                getattr(session, method).side_effect = record
+
+            result = await sync_manager.sync_from_notion()
+
+        assert result.errors == 0
+        assert result.created_local == 1
+        assert mock_upsert.called
+        assert threads
+        assert loop_thread not in threads
+
     @pytest.mark.asyncio
     async def test_sync_to_notion_with_runs(self, sync_manager):
-        """Test sync to Notion with local runs."""
+        """Test sync to Notion with local runs streamed in batches."""
         mock_runs = [
             MagicMock(run_id=1, title="Run 1", notion_id=None),
             MagicMock(run_id=2, title="Run 2", notion_id="existing_page")
         ]
         
         with patch.object(sync_manager.db_manager, 'get_session') as mock_session:
-            mock_session.return_value.__enter__.return_value.execute.return_value.scalars.return_value.all.return_value = mock_runs
+            mock_session.return_value.__enter__.return_value.execute.return_value.scalars.return_value.partitions.return_value = [mock_runs[:1], mock_runs[1:]]
             
             sync_manager.notion_client.get_all_pages.return_value = [
                 {"id": "existing_page", "properties": {}}
@@ -419,6 +607,50 @@ class TestNotionSyncManager:
                 assert result.total_local_runs == 2
                 assert mock_sync.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_sync_runs_to_notion_concurrently(self, sync_manager):
+        """Test runs are pushed with bounded concurrency and failures are counted."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_sync(run, notion_pages_by_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if run.run_id == 2:
+                raise RuntimeError("boom")
+
+        runs = [MagicMock(run_id=i) for i in range(1, 8)]
+        with patch.object(sync_manager, '_sync_run_to_notion', side_effect=fake_sync):
+            await sync_manager._sync_runs_to_notion(runs, {}, MagicMock())
+
+        assert max_in_flight == NOTION_SYNC_CONCURRENCY
+        assert sync_manager.stats.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_created_pages_written_back_in_one_update(self, sync_manager):
+        """Test notion IDs for created pages are stored with a single UPDATE."""
+        mock_session = MagicMock()
+        sync_manager.notion_client.create_page.side_effect = [
+            {"id": "page1", "url": "https://notion.so/page1"},
+            {"id": "page2", "url": "https://notion.so/page2"},
+        ]
+        runs = [MagicMock(run_id=1, notion_id=None), MagicMock(run_id=2, notion_id=None)]
+
+        with patch.object(sync_manager.field_mapper, 'local_to_notion', return_value={}):
+            await sync_manager._sync_runs_to_notion(runs, {}, mock_session)
+
+        mock_session.execute.assert_called_once()
+        rows = mock_session.execute.call_args[0][1]
+        assert sorted(rows, key=lambda row: row["run_id"]) == [
+            {"run_id": 1, "notion_id": "page1", "notion_url": "https://notion.so/page1"},
+            {"run_id": 2, "notion_id": "page2", "notion_url": "https://notion.so/page2"},
+        ]
+        mock_session.commit.assert_not_called()
+        assert sync_manager.stats.created_notion == 2
+
     @pytest.mark.asyncio
     async def test_sync_bidirectional(self, sync_manager):
         """Test bidirectional sync."""
@@ -439,7 +671,7 @@ class TestNotionSyncManager:
         sync_manager.notion_client.get_all_pages.return_value = mock_pages
         
         with patch.object(sync_manager.db_manager, 'get_session') as mock_session:
-            mock_session.return_value.__enter__.return_value.execute.return_value.scalars.return_value.all.return_value = mock_runs
+            mock_session.return_value.__enter__.return_value.execute.return_value.scalars.return_value = mock_runs
             
             with patch.object(sync_manager, '_sync_with_conflict_resolution') as mock_conflict:
                 with patch.object(sync_manager, '_sync_run_to_notion') as mock_sync_to_notion:
@@ -453,6 +685,98 @@ class TestNotionSyncManager:
                     assert mock_conflict.call_count == 1
                     assert mock_sync_to_notion.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_conflict_resolution_normalizes_timestamps(self, sync_manager):
+        """Test naive local and aware Notion times within the tolerance are skipped."""
+        run = MagicMock(run_id=1, notion_id="page1", updated_at=datetime(2023, 1, 1, 12, 0, 0, 500000))
+        local_data = {"updated_at": datetime(2023, 1, 1, 12, 0, 1, tzinfo=timezone.utc)}
+
+        with patch.object(sync_manager, '_update_local_run') as mock_update:
+            await sync_manager._sync_with_conflict_resolution({"id": "page1"}, run, MagicMock(), local_data)
+
+            mock_update.assert_not_called()
+            assert sync_manager.stats.skipped == 1
+
+            local_data = {"updated_at": datetime(2023, 1, 1, 21, 0, 5, tzinfo=timezone(timedelta(hours=9)))}
+            await sync_manager._sync_with_conflict_resolution({"id": "page1"}, run, MagicMock(), local_data)
+
+            mock_update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_conflict_resolution_with_converted_page(self, sync_manager):
+        """Test the ISO string produced by notion_to_local is compared as a datetime."""
+        sync_manager.notion_client.parse_datetime = MagicMock(
+            side_effect=lambda value: datetime.fromisoformat(value.replace("Z", "+00:00"))
+        )
+        run = Run(title="Run", prompt="p", notion_id="page1", updated_at=datetime(2023, 1, 1, 12, 0, 0))
+
+        def page(edited):
+            return {
+                "id": "page1",
+                "last_edited_time": edited,
+                "properties": {"Updated": {"type": "last_edited_time", "last_edited_time": edited}},
+            }
+
+        same_page = page("2023-01-01T12:00:00.500Z")
+        local_data = sync_manager.field_mapper.notion_to_local(same_page)
+        assert isinstance(local_data["updated_at"], str)
+
+        with patch.object(sync_manager, '_update_local_run') as mock_update:
+            await sync_manager._sync_with_conflict_resolution(same_page, run, MagicMock(), local_data)
+            mock_update.assert_not_called()
+            assert sync_manager.stats.skipped == 1
+
+            await sync_manager._sync_with_conflict_resolution(
+                page("2023-01-01T13:00:00.000Z"), run, MagicMock()
+            )
+            mock_update.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_with_converted_pages(self, sync_manager):
+        """Test detect_conflicts reports a real conflict from converted page data."""
+        db_manager = DatabaseManager(":memory:")
+        with db_manager.get_session() as session:
+            session.add(Run(title="Run", prompt="p", notion_id="page1", updated_at=datetime(2023, 1, 1, 12, 0, 0)))
+            session.commit()
+
+        sync_manager.db_manager = db_manager
+        sync_manager.notion_client.parse_datetime = MagicMock(
+            side_effect=lambda value: datetime.fromisoformat(value.replace("Z", "+00:00"))
+        )
+        edited = "2023-01-01T13:00:00.000Z"
+        sync_manager.notion_client.get_all_pages.return_value = [{
+            "id": "page1",
+            "last_edited_time": edited,
+            "properties": {"Updated": {"type": "last_edited_time", "last_edited_time": edited}},
+        }]
+
+        conflicts = await sync_manager.detect_conflicts()
+
+        assert len(conflicts) == 1
+        assert conflicts[0]["notion_modified"] == datetime(2023, 1, 1, 13, 0, 0, tzinfo=timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_update_local_run_stores_parsed_timestamp(self, sync_manager):
+        """Test the converted ISO updated_at is written to the run as a datetime."""
+        db_manager = DatabaseManager(":memory:")
+        sync_manager.notion_client.parse_datetime = MagicMock(
+            side_effect=lambda value: datetime.fromisoformat(value.replace("Z", "+00:00"))
+        )
+        local_data = sync_manager.field_mapper.notion_to_local({
+            "id": "page1",
+            "properties": {
+                "Updated": {"type": "last_edited_time", "last_edited_time": "2023-01-01T13:00:00.000Z"}
+            },
+        })
+
+        with db_manager.get_session() as session:
+            run = Run(title="Run", prompt="p", notion_id="page1")
+            session.add(run)
+            await sync_manager._update_local_run(run, local_data, session)
+            session.commit()
+
+            assert run.updated_at.replace(tzinfo=None) == datetime(2023, 1, 1, 13, 0, 0)
+
     @pytest.mark.asyncio
     async def test_detect_conflicts_no_conflicts(self, sync_manager):
         """Test conflict detection with no conflicts."""
@@ -522,25 +846,174 @@ class TestNotionSyncManager:
                 assert conflicts[0]["local_modified"] == local_time
                 assert conflicts[0]["notion_modified"] == notion_time
 
+    def test_convert_page_cached_by_last_edited_time(self, sync_manager):
+        """Test page conversions are reused until last_edited_time changes."""
+        page = {"id": "page1", "last_edited_time": "2023-01-01T12:00:00.000Z", "properties": {}}
+
+        with patch.object(sync_manager.field_mapper, 'notion_to_local') as mock_convert:
+            mock_convert.side_effect = lambda p: {"notion_id": p["id"]}
+
+            first = sync_manager._convert_page(page)
+            assert sync_manager._convert_page(dict(page)) is first
+            sync_manager._convert_page({**page, "last_edited_time": "2023-01-02T12:00:00.000Z"})
+
+        assert mock_convert.call_count == 2
+
     @pytest.mark.asyncio
-    async def test_get_or_create_model_existing(self, sync_manager):
+    async def test_convert_pages_off_event_loop(self, sync_manager):
+        """Test page batches are converted in a worker thread, keeping order."""
+        threads = []
+        pages = [{"id": "page1", "properties": {}}, {"id": "page2", "properties": {}}]
+
+        def convert(page):
+            threads.append(threading.get_ident())
+            return {"notion_id": page["id"]}
+
+        with patch.object(sync_manager.field_mapper, 'notion_to_local', side_effect=convert):
+            converted = await sync_manager._convert_pages(pages)
+
+        assert [local["notion_id"] for _, local in converted] == ["page1", "page2"]
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_detect_conflicts_skips_unchanged_pages(self, sync_manager):
+        """Test pages whose last_edited_time matches the run are filtered in SQL."""
+        db_manager = DatabaseManager(":memory:")
+        with db_manager.get_session() as session:
+            session.add_all([
+                Run(title="Same", prompt="p", notion_id="page1", updated_at=datetime(2023, 1, 1, 12, 0, 0)),
+                Run(title="Changed", prompt="p", notion_id="page2", updated_at=datetime(2023, 1, 1, 12, 0, 0)),
+            ])
+            session.commit()
+
+        sync_manager.db_manager = db_manager
+        sync_manager.notion_client.parse_datetime = MagicMock(
+            side_effect=lambda value: datetime.fromisoformat(value.replace("Z", "+00:00"))
+        )
+        sync_manager.notion_client.get_all_pages.return_value = [
+            {"id": "page1", "last_edited_time": "2023-01-01T12:00:00.000Z", "properties": {}},
+            {"id": "page2", "last_edited_time": "2023-01-01T13:00:00.000Z", "properties": {}},
+        ]
+
+        with patch.object(sync_manager.field_mapper, 'notion_to_local') as mock_convert:
+            mock_convert.return_value = {"updated_at": datetime(2023, 1, 1, 13, 0, 0)}
+            conflicts = await sync_manager.detect_conflicts()
+
+        assert [c["notion_id"] for c in conflicts] == ["page2"]
+        mock_convert.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_local_run_applies_lora_and_tag_diff(self, sync_manager):
+        """Test unchanged LoRA/tag rows are kept and only the delta is applied."""
+        db_manager = DatabaseManager(":memory:")
+        with db_manager.get_session() as session:
+            run = Run(title="Run", prompt="p")
+            run.loras.extend([
+                RunLora(lora_model=Model(name="A", type="lora"), weight=0.5),
+                RunLora(lora_model=Model(name="B", type="lora"), weight=0.7),
+            ])
+            run.tags.append(RunTag(tag=Tag(name="keep")))
+            session.add(run)
+            session.commit()
+            kept_lora = next(rl for rl in run.loras if rl.lora_model.name == "B")
+
+            await sync_manager._update_local_run(
+                run, {"lora_names": ["B", "C"], "tag_names": ["keep", "new"]}, session
+            )
+            session.commit()
+
+            assert sorted(rl.lora_model.name for rl in run.loras) == ["B", "C"]
+            assert kept_lora in run.loras and kept_lora.weight == 0.7
+            assert sorted(rt.tag.name for rt in run.tags) == ["keep", "new"]
+
+    @pytest.mark.asyncio
+    async def test_sync_pages_to_local_upserts_batch(self, sync_manager):
+        """Test a page batch is upserted by notion_id with LoRA/tag links applied."""
+        db_manager = DatabaseManager(":memory:")
+        with db_manager.get_session() as session:
+            run = Run(title="Old", prompt="keep me", notion_id="page1")
+            run.loras.extend([
+                RunLora(lora_model=Model(name="A", type="lora"), weight=0.5),
+                RunLora(lora_model=Model(name="B", type="lora"), weight=0.7),
+            ])
+            session.add(run)
+            session.commit()
+
+        sync_manager.notion_client.extract_text_from_rich_text = MagicMock(
+            side_effect=lambda rich_text: "".join(item["plain_text"] for item in rich_text)
+        )
+
+        def multi_select(*names):
+            return {"type": "multi_select", "multi_select": [{"name": name} for name in names]}
+
+        pages = [
+            {"id": "page1", "properties": {
+                "Title": {"type": "title", "title": [{"plain_text": "New"}]},
+                "LoRAs": multi_select("B", "C"),
+            }},
+            {"id": "page2", "properties": {
+                "Title": {"type": "title", "title": [{"plain_text": "Created"}]},
+                "Prompt": {"type": "rich_text", "rich_text": [{"plain_text": "a cat"}]},
+                "Steps": {"type": "number", "number": 30},
+                "Model": {"type": "select", "select": {"name": "base"}},
+                "Tags": multi_select("anime", "portrait"),
+            }},
+        ]
+
+        with db_manager.get_session() as session:
+            await sync_manager._sync_pages_to_local(pages, session)
+            session.commit()
+
+        assert sync_manager.stats.created_local == 1
+        assert sync_manager.stats.updated_local == 1
+        assert sync_manager.stats.errors == 0
+
+        with db_manager.get_session() as session:
+            updated, created = session.execute(
+                _select_runs_for_sync().order_by(Run.run_id)
+            ).unique().scalars().all()
+
+            assert (updated.title, updated.prompt) == ("New", "keep me")
+            assert {rl.lora_model.name: rl.weight for rl in updated.loras} == {"B": 0.7, "C": 1.0}
+            assert (created.notion_id, created.title, created.prompt) == ("page2", "Created", "a cat")
+            assert created.steps == 30 and created.status == "Tried"
+            assert created.model.name == "base"
+            assert sorted(rt.tag.name for rt in created.tags) == ["anime", "portrait"]
+
+    def test_select_runs_for_sync_loads_relations(self):
+        """Test runs for sync come with model, LoRAs and tags already loaded."""
+        db_manager = DatabaseManager(":memory:")
+        with db_manager.get_session() as session:
+            run = Run(title="Run", prompt="p", model=Model(name="base", type="checkpoint"))
+            run.loras.append(RunLora(lora_model=Model(name="A", type="lora")))
+            run.tags.append(RunTag(tag=Tag(name="t")))
+            session.add(run)
+            session.commit()
+
+        with db_manager.get_session() as session:
+            loaded = session.execute(_select_runs_for_sync()).scalars().one()
+            unloaded = sa_inspect(loaded).unloaded
+            assert not {"model", "loras", "tags"} & unloaded
+            assert "lora_model" not in sa_inspect(loaded.loras[0]).unloaded
+            assert "tag" not in sa_inspect(loaded.tags[0]).unloaded
+
+    def test_get_or_create_model_existing(self, sync_manager):
         """Test get or create model with existing model."""
         mock_session = MagicMock()
         mock_model = MagicMock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = mock_model
         
-        result = await sync_manager._get_or_create_model("TestModel", mock_session)
+        result = sync_manager._get_or_create_model("TestModel", mock_session)
         
         assert result == mock_model
         mock_session.add.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_model_new(self, sync_manager):
+    def test_get_or_create_model_new(self, sync_manager):
         """Test get or create model with new model."""
         mock_session = MagicMock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = None
         
-        result = await sync_manager._get_or_create_model("TestModel", mock_session)
+        result = sync_manager._get_or_create_model("TestModel", mock_session)
         
         # Check that a new model was created with the correct name
         assert result.name == "TestModel"
@@ -550,25 +1023,23 @@ class TestNotionSyncManager:
         added_model = mock_session.add.call_args[0][0]
         assert added_model.name == "TestModel"
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_lora_existing(self, sync_manager):
+    def test_get_or_create_lora_existing(self, sync_manager):
         """Test get or create LoRA with existing LoRA."""
         mock_session = MagicMock()
         mock_lora = MagicMock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = mock_lora
         
-        result = await sync_manager._get_or_create_lora("TestLoRA", mock_session)
+        result = sync_manager._get_or_create_lora("TestLoRA", mock_session)
         
         assert result == mock_lora
         mock_session.add.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_lora_new(self, sync_manager):
+    def test_get_or_create_lora_new(self, sync_manager):
         """Test get or create LoRA with new LoRA."""
         mock_session = MagicMock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = None
         
-        result = await sync_manager._get_or_create_lora("TestLoRA", mock_session)
+        result = sync_manager._get_or_create_lora("TestLoRA", mock_session)
         
         # Check that a new LoRA was created with the correct name and type
         assert result.name == "TestLoRA"
@@ -579,25 +1050,23 @@ class TestNotionSyncManager:
         assert added_lora.name == "TestLoRA"
         assert added_lora.type == "lora"
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_tag_existing(self, sync_manager):
+    def test_get_or_create_tag_existing(self, sync_manager):
         """Test get or create tag with existing tag."""
         mock_session = MagicMock()
         mock_tag = MagicMock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = mock_tag
         
-        result = await sync_manager._get_or_create_tag("TestTag", mock_session)
+        result = sync_manager._get_or_create_tag("TestTag", mock_session)
         
         assert result == mock_tag
         mock_session.add.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_get_or_create_tag_new(self, sync_manager):
+    def test_get_or_create_tag_new(self, sync_manager):
         """Test get or create tag with new tag."""
         mock_session = MagicMock()
         mock_session.execute.return_value.scalar_one_or_none.return_value = None
         
-        result = await sync_manager._get_or_create_tag("TestTag", mock_session)
+        result = sync_manager._get_or_create_tag("TestTag", mock_session)
         
         # Check that a new tag was created with the correct name
         assert result.name == "TestTag"
@@ -606,6 +1075,47 @@ class TestNotionSyncManager:
         added_tag = mock_session.add.call_args[0][0]
         assert added_tag.name == "TestTag"
 
+    def test_get_or_create_cached_per_session(self, sync_manager):
+        """Test repeated lookups hit the cache until the session changes."""
+        mock_session = MagicMock()
+        mock_session.execute.return_value.scalar_one_or_none.return_value = None
+
+        first = sync_manager._get_or_create_tag("TestTag", mock_session)
+        second = sync_manager._get_or_create_tag("TestTag", mock_session)
+        lora = sync_manager._get_or_create_lora("TestTag", mock_session)
+
+        assert first is second
+        assert lora is not first
+        assert mock_session.execute.call_count == 2
+        mock_session.add.assert_called_with(lora)
+
+        other_session = MagicMock()
+        other_session.execute.return_value.scalar_one_or_none.return_value = None
+        third = sync_manager._get_or_create_tag("TestTag", other_session)
+
+        assert third is not first
+        other_session.execute.assert_called_once()
+
+    def test_prefetch_lookups_fills_caches(self, sync_manager):
+        """Test referenced names are loaded in bulk so lookups skip SELECTs."""
+        model = Model(name="ModelA")
+        tag = Tag(name="TagA")
+        mock_session = MagicMock()
+        mock_session.execute.return_value.scalars.side_effect = [[model], [], [tag]]
+
+        sync_manager._prefetch_lookups(
+            [
+                {"model_name": "ModelA", "lora_names": ["LoraA"], "tag_names": ["TagA"]},
+                {"model_name": "ModelA", "lora_names": [], "tag_names": ["TagA"]},
+            ],
+            mock_session,
+        )
+        assert mock_session.execute.call_count == 3
+
+        assert sync_manager._get_or_create_model("ModelA", mock_session) is model
+        assert sync_manager._get_or_create_tag("TagA", mock_session) is tag
+        assert mock_session.execute.call_count == 3
+
     def test_log_sync_stats(self, sync_manager):
         """Test sync statistics logging."""
         sync_manager.stats.total_notion_pages = 5
@@ -636,10 +1146,13 @@ class TestNotionSyncManager:
         mock_session = MagicMock()
         
         # Test create local run in dry run mode
-        await sync_manager._create_local_run(local_data, mock_session)
+        await sync_manager._save_local_runs([local_data], mock_session)
         
-        # Should not add anything to session
+        # Should not write anything, but still report the run as created
         mock_session.add.assert_not_called()
+        mock_session.begin_nested.assert_not_called()
+        mock_session.flush.assert_not_called()
+        assert sync_manager.stats.created_local == 1
         
         # Test update local run in dry run mode
         mock_run = MagicMock()
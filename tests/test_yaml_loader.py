@@ -5,12 +5,15 @@
 """
 
 import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any, Dict
 
 import pytest
 import yaml
+from sqlalchemy import event
 
 from src.models.database import Model, Run, RunLora
 from src.utils.db_utils import DatabaseManager
@@ -19,8 +22,11 @@ from src.yaml_loader import (
     YAMLLoaderError,
     YAMLValidationError,
     YAMLValidator,
+    _compile_field_checks,
+    find_yaml_files,
     load_single_yaml_file,
     load_yaml_files_from_data_directory,
+    safe_load_yaml,
 )
 
 
@@ -241,6 +247,38 @@ class TestYAMLValidator:
         # 有効なデータでは例外が発生しないはず
         YAMLValidator.validate(valid_yaml_data)
 
+    @pytest.mark.parametrize("overrides, message", [
+        ({"cfg": 50.0, "steps": "25"}, "Field 'steps' must be an integer"),
+        ({"seed": -1}, "seed must be between"),
+        ({"seed": None, "loras": None}, None),
+        ({"loras": ["ok", 1]}, "LoRA names must be strings"),
+        ({"status": 1}, "Field 'status' must be a string"),
+        ({"status": "Unknown"}, "status must be one of"),
+        ({"prompt": None}, "Field 'prompt' must be a string"),
+    ])
+    def test_validate_matches_individual_checks(self, valid_yaml_data, overrides, message):
+        """高速パスでも個別チェックと同じ結果・エラーメッセージになることをテストします."""
+        data = {**valid_yaml_data, **overrides}
+
+        if message is None:
+            YAMLValidator.validate(data)
+            return
+
+        with pytest.raises(YAMLValidationError) as exc_info:
+            YAMLValidator.validate(data)
+
+        assert message in str(exc_info.value)
+
+    def test_validate_fast_path_uses_spec_tables(self, valid_yaml_data, monkeypatch):
+        """仕様表に追加したルールが高速パスにも反映されることをテストします."""
+        monkeypatch.setattr(
+            YAMLValidator, "_RANGE_SPEC", YAMLValidator._RANGE_SPEC + (("cfg", (0.1, 5.0), False),)
+        )
+        monkeypatch.setattr("src.yaml_loader._FIELD_CHECKS", _compile_field_checks())
+
+        with pytest.raises(YAMLValidationError, match="cfg must be between 0.1 and 5.0"):
+            YAMLValidator.validate({**valid_yaml_data, "cfg": 7.5})
+
     def test_validate_complete_minimal_success(self, minimal_yaml_data):
         """最小限のデータでバリデーションが成功することをテストします."""
         # 最小限のデータでも例外が発生しないはず
@@ -258,6 +296,34 @@ class TestYAMLLoader:
         assert "run_title" in data
         assert data["run_title"] == "Test Generation"
 
+    def test_load_yaml_file_reuses_parse_for_unchanged_file(
+        self, yaml_loader, temp_yaml_file, monkeypatch
+    ):
+        """変更のないファイルは再パースせず、変更されたファイルは再パースすることをテストします."""
+        import src.yaml_loader as yaml_loader_module
+
+        parses = []
+
+        def counting_safe_load_yaml(stream):
+            parses.append(stream)
+            return safe_load_yaml(stream)
+
+        monkeypatch.setattr(yaml_loader_module, "safe_load_yaml", counting_safe_load_yaml)
+
+        first = yaml_loader.load_yaml_file(temp_yaml_file)
+        loras = list(first["loras"])
+        first["run_title"] = "mutated by caller"  # 呼び出し側の変更はキャッシュに影響しない
+        first["loras"].append("added by caller")  # ネストしたリストの変更も同様
+        second = yaml_loader.load_yaml_file(temp_yaml_file)
+        assert len(parses) == 1
+        assert second["run_title"] == "Test Generation"
+        assert second["loras"] == loras
+
+        with open(temp_yaml_file, 'a', encoding='utf-8') as f:
+            f.write("source: changed\n")
+        assert yaml_loader.load_yaml_file(temp_yaml_file)["source"] == "changed"
+        assert len(parses) == 2
+
     def test_load_yaml_file_not_found(self, yaml_loader):
         """存在しないファイルの読み込みエラーをテストします."""
         with pytest.raises(YAMLLoaderError) as exc_info:
@@ -279,6 +345,21 @@ class TestYAMLLoader:
         finally:
             os.unlink(tmp_file_path)
 
+    def test_safe_load_yaml_matches_safe_load(self, valid_yaml_data):
+        """safe_load_yamlがyaml.safe_loadと同じ結果を返すことをテストします."""
+        text = yaml.dump(valid_yaml_data, allow_unicode=True)
+        assert safe_load_yaml(text) == yaml.safe_load(text)
+
+        # 任意のPythonオブジェクトは構築しない
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("!!python/object/apply:os.getcwd []")
+
+    def test_import_does_not_load_pyyaml(self):
+        """モジュールのインポートだけではPyYAMLが読み込まれないことをテストします."""
+        code = "import sys, src.yaml_loader; sys.exit('yaml' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent)
+        assert result.returncode == 0
+
     def test_find_or_create_model_existing(self, yaml_loader, db_manager):
         """既存モデルの検索をテストします."""
         # 事前にモデルを作成
@@ -341,6 +422,14 @@ class TestYAMLLoader:
         assert run_data["prompt"] == minimal_yaml_data["prompt"]
         assert run_data["status"] == "Tried"  # デフォルトステータス
 
+    def test_convert_yaml_to_run_data_interns_common_strings(self, yaml_loader, valid_yaml_data):
+        """低カーディナリティの文字列フィールドが共有されることをテストします."""
+        first = yaml_loader.convert_yaml_to_run_data(dict(valid_yaml_data, sampler="".join(["DPM++", " 2M"])))
+        second = yaml_loader.convert_yaml_to_run_data(dict(valid_yaml_data, sampler="".join(["DPM++ ", "2M"])))
+
+        assert first["sampler"] is second["sampler"]
+        assert first["status"] is second["status"]
+
     def test_load_and_insert_success(self, yaml_loader, temp_yaml_file):
         """YAML読み込みとDB挿入の成功をテストします."""
         run = yaml_loader.load_and_insert(temp_yaml_file)
@@ -359,6 +448,108 @@ class TestYAMLLoader:
         loras = db_manager.get_records(RunLora, filters={"run_id": run.run_id})
         assert len(loras) == 2  # test_lora_1, test_lora_2
 
+    def test_load_and_insert_commits_once(
+        self, yaml_loader, temp_yaml_file, valid_yaml_data, db_manager, monkeypatch
+    ):
+        """セッション未指定時は1回のコミットで挿入し、失敗時はすべてロールバックされることをテストします."""
+        commits = []
+
+        def count_commits(conn):
+            commits.append(conn)
+
+        event.listen(db_manager.engine, "commit", count_commits)
+        try:
+            run = yaml_loader.load_and_insert(temp_yaml_file)
+        finally:
+            event.remove(db_manager.engine, "commit", count_commits)
+
+        assert len(commits) == 1
+        assert len(db_manager.get_records(RunLora, filters={"run_id": run.run_id})) == 2
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(yaml_loader, "create_lora_relationships", fail)
+        with pytest.raises(YAMLLoaderError):
+            yaml_loader.insert_yaml_data(
+                dict(valid_yaml_data, run_title="Atomic Run", model="Atomic-Model")
+            )
+
+        assert db_manager.get_records(Run, filters={"title": "Atomic Run"}) == []
+        assert db_manager.get_records(Model, filters={"name": "Atomic-Model"}) == []
+
+    def test_load_and_insert_with_shared_session(
+        self, yaml_loader, temp_yaml_directory, valid_yaml_data, db_manager
+    ):
+        """共有セッションでの複数ファイル挿入をテストします."""
+        yaml_files = []
+        for i in range(2):
+            data = valid_yaml_data.copy()
+            data["run_title"] = f"Shared Run {i}"
+            yaml_file = temp_yaml_directory / f"shared_{i}.yaml"
+            with open(yaml_file, 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            yaml_files.append(yaml_file)
+
+        with yaml_loader.session_scope() as session:
+            runs = [yaml_loader.load_and_insert(f, session=session) for f in yaml_files]
+
+            # 未コミットの挿入も同じセッション内の重複チェックで検出される
+            duplicate = yaml_loader.check_duplicate_run(
+                {"run_title": "Shared Run 0", "prompt": valid_yaml_data["prompt"]},
+                session=session
+            )
+            assert duplicate is not None
+
+        assert [run.title for run in runs] == ["Shared Run 0", "Shared Run 1"]
+        assert len(db_manager.get_records(Run)) == 2
+        # モデルは共有セッション内で再利用され、重複作成されない
+        assert len(db_manager.get_records(Model, filters={"name": "SDXL-Turbo-0.9"})) == 1
+        assert len(db_manager.get_records(RunLora)) == 4
+
+    def test_shared_session_reuses_resolved_model_ids(
+        self, yaml_loader, temp_yaml_directory, valid_yaml_data, db_manager, monkeypatch
+    ):
+        """共有セッションでは解決済みのモデルを再検索せず、ロールバック時は破棄することをテストします."""
+        model_selects = []
+
+        def count_model_selects(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT") and "FROM models" in statement:
+                model_selects.append(statement)
+
+        event.listen(db_manager.engine, "before_cursor_execute", count_model_selects)
+        try:
+            with yaml_loader.session_scope() as session:
+                for i in range(3):
+                    data = dict(valid_yaml_data, run_title=f"Cached Run {i}")
+                    yaml_loader.insert_yaml_data(data, session=session)
+
+                # 1件目でチェックポイントとLoRAを1回ずつ検索し、以降はキャッシュを使用
+                assert len(model_selects) == 2
+
+                # 挿入が失敗した場合、セーブポイントで取り消されたモデルIDは破棄される
+                def fail(*args, **kwargs):
+                    raise RuntimeError("boom")
+
+                with monkeypatch.context() as m:
+                    m.setattr(yaml_loader, "create_lora_relationships", fail)
+                    with pytest.raises(YAMLLoaderError):
+                        yaml_loader.insert_yaml_data(
+                            dict(valid_yaml_data, run_title="Failed Run", model="Rolled-Back"),
+                            session=session
+                        )
+
+                run = yaml_loader.insert_yaml_data(
+                    dict(valid_yaml_data, run_title="Retried Run", model="Rolled-Back"),
+                    session=session
+                )
+        finally:
+            event.remove(db_manager.engine, "before_cursor_execute", count_model_selects)
+
+        models = db_manager.get_records(Model, filters={"name": "Rolled-Back"})
+        assert len(models) == 1
+        assert run.model_id == models[0].model_id
+
     def test_load_directory_success(self, yaml_loader, temp_yaml_directory, valid_yaml_data):
         """ディレクトリからのYAML読み込みをテストします."""
         # 複数のYAMLファイルを作成
@@ -370,11 +561,109 @@ class TestYAMLLoader:
             with open(yaml_file, 'w', encoding='utf-8') as f:
                 yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
         
+        inserts = []
+        model_selects = []
+
+        def count_inserts(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement.split("(", 1)[0].split()[-1])
+            elif statement.lstrip().upper().startswith("SELECT") and "FROM models" in statement:
+                model_selects.append(statement)
+
         # ディレクトリから読み込み
-        runs = yaml_loader.load_directory(temp_yaml_directory)
+        event.listen(yaml_loader.db_manager.engine, "before_cursor_execute", count_inserts)
+        try:
+            runs = yaml_loader.load_directory(temp_yaml_directory)
+        finally:
+            event.remove(yaml_loader.db_manager.engine, "before_cursor_execute", count_inserts)
         
         assert len(runs) == 3
         assert all(isinstance(run, Run) for run in runs)
+        assert sorted(run.title for run in runs) == [f"Test Run {i}" for i in range(3)]
+        # モデル一括（チェックポイント1件とLoRA2件）+ Run一括 + LoRA関連付け一括
+        assert sorted(inserts) == ["models", "run_loras", "runs"]
+        # 既存モデルの検索はモデル名をまとめた1回のみ
+        assert len(model_selects) == 1
+        assert {model.name for model in yaml_loader.db_manager.get_records(Model)} == {
+            valid_yaml_data["model"], *valid_yaml_data["loras"]
+        }
+        assert len(yaml_loader.db_manager.get_records(RunLora)) == 6
+
+    def test_iter_load_directory_inserts_in_batches(
+        self, yaml_loader, temp_yaml_directory, valid_yaml_data, db_manager
+    ):
+        """iter_load_directoryがバッチごとにコミットしながらRunを返すことをテストします."""
+        for i in range(5):
+            data = dict(valid_yaml_data, run_title=f"Batched Run {i}")
+            with open(temp_yaml_directory / f"batched_{i}.yaml", 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+
+        commits = []
+
+        def count_commits(conn):
+            commits.append(conn)
+
+        runs_iter = yaml_loader.iter_load_directory(temp_yaml_directory, batch_size=2)
+        event.listen(db_manager.engine, "commit", count_commits)
+        try:
+            first = next(runs_iter)
+            # 最初のバッチのみ挿入された時点でRunが返される
+            assert len(commits) == 1
+            assert len(db_manager.get_records(Run)) == 2
+            runs = [first, *runs_iter]
+        finally:
+            event.remove(db_manager.engine, "commit", count_commits)
+
+        assert len(commits) == 3  # 2件 + 2件 + 1件
+        assert sorted(run.title for run in runs) == [f"Batched Run {i}" for i in range(5)]
+
+    def test_load_directory_reports_invalid_files(
+        self, yaml_loader, temp_yaml_directory, valid_yaml_data
+    ):
+        """並列の読み込みでも、無効なファイルのエラーがファイルごとに報告されることをテストします."""
+        paths = []
+        for i in range(4):
+            data = valid_yaml_data.copy()
+            data["run_title"] = f"Test Run {i}"
+            if i == 2:
+                del data["prompt"]
+            yaml_file = temp_yaml_directory / f"test_{i}.yaml"
+            with open(yaml_file, 'w', encoding='utf-8') as f:
+                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            paths.append(yaml_file)
+
+        # 結果は入力と同じ順序で、エラーは例外を送出せずに返される
+        results = list(yaml_loader.parse_files(paths))
+        assert [path for path, _ in results] == paths
+        assert isinstance(results[2][1], YAMLValidationError)
+        assert results[0][1]["run_title"] == "Test Run 0"
+
+        with pytest.raises(YAMLLoaderError) as exc_info:
+            yaml_loader.load_directory(temp_yaml_directory)
+        assert "Error in test_2.yaml" in str(exc_info.value)
+
+    def test_parse_files_bounds_in_flight_files(self, yaml_loader, monkeypatch):
+        """投入済みのファイル数が上限を超えず、途中で閉じると残りを読み込まないことをテストします."""
+        monkeypatch.setattr("src.yaml_loader.YAML_PARSE_WORKERS", 2)
+        monkeypatch.setattr("src.yaml_loader.YAML_PARSE_WINDOW_FACTOR", 2)
+        parsed = []
+
+        def fake_parse(file_path):
+            parsed.append(file_path)
+            return {"path": str(file_path)}
+
+        monkeypatch.setattr(yaml_loader, "_parse_and_validate", fake_parse)
+        paths = [Path(f"file_{i}.yaml") for i in range(20)]
+
+        results = yaml_loader.parse_files(paths)
+        first_path, first_result = next(results)
+        assert first_path == paths[0]
+        assert first_result == {"path": "file_0.yaml"}
+        # 先頭4件と、1件消費した分の補充1件のみが投入される
+        assert len(parsed) <= 5
+
+        results.close()
+        assert len(parsed) <= 5
 
     def test_load_directory_not_found(self, yaml_loader):
         """存在しないディレクトリのエラーをテストします."""
@@ -407,6 +696,11 @@ class TestYAMLLoader:
         assert duplicate is not None
         assert duplicate.run_id == existing_run.run_id
 
+        # タイトルが同じでもプロンプトが異なれば重複ではない
+        assert yaml_loader.check_duplicate_run(
+            dict(valid_yaml_data, prompt="different prompt")
+        ) is None
+
 
 class TestUtilityFunctions:
     """ユーティリティ関数のテストクラス."""
@@ -418,6 +712,20 @@ class TestUtilityFunctions:
         assert run.run_id is not None
         assert run.title == "Test Generation"
 
+    def test_find_yaml_files(self, temp_yaml_directory):
+        """YAMLファイルのみが列挙され、recursive指定時はサブディレクトリも含むことをテストします."""
+        nested = temp_yaml_directory / "nested"
+        nested.mkdir()
+        (temp_yaml_directory / "fake.yaml").mkdir()  # YAML拡張子のディレクトリは対象外
+        for path in ["a.yaml", "b.yml", "notes.txt", "nested/c.yaml"]:
+            (temp_yaml_directory / path).write_text("{}", encoding="utf-8")
+
+        assert sorted(p.name for p in find_yaml_files(temp_yaml_directory)) == ["a.yaml", "b.yml"]
+        assert sorted(
+            p.relative_to(temp_yaml_directory).as_posix()
+            for p in find_yaml_files(temp_yaml_directory, recursive=True)
+        ) == ["a.yaml", "b.yml", "nested/c.yaml"]
+
     def test_load_yaml_files_from_data_directory_not_found(self, db_manager):
         """data/yamlsディレクトリが存在しない場合のエラーをテストします."""
         # 現在のディレクトリにdata/yamlsが存在しないはず
@@ -514,6 +822,16 @@ class TestEdgeCases:
         finally:
             os.unlink(tmp_file_path)
 
+    def test_yaml_with_invalid_utf8(self, yaml_loader, temp_yaml_directory):
+        """UTF-8として不正なバイト列を含むYAMLがバリデーションエラーになることをテストします."""
+        yaml_file = temp_yaml_directory / "invalid_utf8.yaml"
+        yaml_file.write_bytes(b"run_title: \xff\xfe broken\n")
+
+        with pytest.raises(YAMLValidationError) as exc_info:
+            yaml_loader.load_yaml_file(yaml_file)
+
+        assert "Invalid YAML format" in str(exc_info.value)
+
     def test_yaml_with_extreme_values(self, yaml_loader):
         """極端な値を含むYAMLの処理をテストします."""
         extreme_data = {